@@ -0,0 +1,211 @@
+"""
+Headless end-to-end benchmark of the GS_OT_Import flow.
+
+Runs the real addon code against the `fake_bpy` stand-in, so the whole import
+path (PLY read -> process_and_bake -> create_shader -> Geometry Nodes setup) can
+be timed on machines without Blender. Besides wall time it reports how often
+the expensive Blender APIs were hit and how many elements went through them.
+
+Usage:
+    python bench_import.py                       # synthetic 100k splat cloud
+    python bench_import.py --points 1000000
+    python bench_import.py --ply scene.ply --repeat 3
+    python bench_import.py --color-mode ATTRIBUTE   # texture-free colours vs. palette
+    python bench_import.py --sh-mode HEMISPHERE     # bake SH bands 1-3 (view average)
+    python bench_import.py --remove-floaters        # include the hash-grid floater removal
+    python bench_import.py --merge 4                # merge 4 synthetic captures into one object
+    python bench_import.py --max-calls libraries.load=1 --max-calls mesh.from_pydata=1
+
+With --max-calls the script exits with status 1 if any budget is exceeded,
+so it can be used as a performance-regression guard in CI.
+"""
+
+import argparse
+import importlib.util
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+import fake_bpy
+
+ADDON_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "blender-addon")
+ADDON_NAME = "gs_oil_paint"
+
+
+# ==============================================================================
+#  SYNTHETIC DATA
+# ==============================================================================
+
+def write_synthetic_ply(filepath, n_points, seed=0, sh_degree=3):
+    """Write a random 3DGS-style binary PLY with the standard Inria layout."""
+    rng = np.random.default_rng(seed)
+    n_rest = 3 * ((sh_degree + 1) ** 2 - 1)
+    names = (["x", "y", "z", "nx", "ny", "nz", "f_dc_0", "f_dc_1", "f_dc_2"]
+             + [f"f_rest_{i}" for i in range(n_rest)]
+             + ["opacity", "scale_0", "scale_1", "scale_2", "rot_0", "rot_1", "rot_2", "rot_3"])
+    data = np.zeros(n_points, dtype=[(n, '<f4') for n in names])
+
+    data['x'], data['y'], data['z'] = rng.normal(0.0, 2.0, (3, n_points))
+    for i in range(3):
+        data[f'f_dc_{i}'] = rng.normal(0.0, 1.0, n_points)
+    for i in range(n_rest):
+        data[f'f_rest_{i}'] = rng.normal(0.0, 0.1, n_points)
+    data['opacity'] = rng.normal(0.0, 2.0, n_points)
+    for i in range(3):
+        data[f'scale_{i}'] = rng.normal(-4.5, 0.8, n_points)
+    q = rng.normal(0.0, 1.0, (n_points, 4))
+    q /= np.linalg.norm(q, axis=1, keepdims=True)
+    for i in range(4):
+        data[f'rot_{i}'] = q[:, i]
+
+    header = ["ply", "format binary_little_endian 1.0", f"element vertex {n_points}"]
+    header += [f"property float {n}" for n in names]
+    header += ["end_header"]
+    with open(filepath, 'wb') as f:
+        f.write(("\n".join(header) + "\n").encode('ascii'))
+        data.tofile(f)
+    return filepath
+
+
+# ==============================================================================
+#  ADDON LOADING
+# ==============================================================================
+
+def load_addon():
+    """Import blender-addon/ as a package (its directory name is not importable)."""
+    init_path = os.path.join(ADDON_DIR, "__init__.py")
+    spec = importlib.util.spec_from_file_location(
+        ADDON_NAME, init_path, submodule_search_locations=[ADDON_DIR])
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[ADDON_NAME] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def run_import(addon, context, filepath, scene_settings):
+    for key, value in scene_settings.items():
+        setattr(context.scene, key, value)
+    op = addon.GS_OT_Import()
+    op.filepath = filepath
+    return op.execute(context)
+
+
+def run_merge(addon, context, filepaths, scene_settings):
+    import bpy
+    for key, value in scene_settings.items():
+        setattr(context.scene, key, value)
+    op = addon.GS_OT_ImportMerge()
+    op.directory = os.path.dirname(filepaths[0])
+    op.files = [bpy.types.OperatorFileListElement(os.path.basename(path)) for path in filepaths]
+    return op.execute(context)
+
+
+# ==============================================================================
+#  MAIN
+# ==============================================================================
+
+def parse_budget(entries):
+    budget = {}
+    for entry in entries or []:
+        name, _, limit = entry.partition("=")
+        budget[name] = int(limit)
+    return budget
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--ply", help="Existing PLY file (default: synthetic cloud)")
+    parser.add_argument("--points", type=int, default=100_000, help="Synthetic splat count")
+    parser.add_argument("--repeat", type=int, default=1, help="Number of timed imports")
+    parser.add_argument("--brush", default=None, help="Brush alpha file name in brush/tex_alpha")
+    parser.add_argument("--color-mode", choices=("PALETTE", "ATTRIBUTE"), default=None,
+                        help="Scene gs_color_mode (default: the addon default, PALETTE)")
+    parser.add_argument("--sh-mode", choices=("DC", "HEMISPHERE", "CAMERA"), default=None,
+                        help="Scene gs_sh_mode (default: the addon default, DC)")
+    parser.add_argument("--remove-floaters", action="store_true",
+                        help="Enable gs_remove_floaters (degenerate splats are removed by default)")
+    parser.add_argument("--merge", type=int, default=0, metavar="N",
+                        help="Merge N synthetic captures of --points splats each (GS_OT_ImportMerge)")
+    parser.add_argument("--analyze", action="store_true",
+                        help="Run the pre-import analysis first, to compare its estimates with the timed import")
+    parser.add_argument("--max-calls", action="append", metavar="NAME=N",
+                        help="Fail if API NAME is called more than N times per import")
+    args = parser.parse_args(argv)
+
+    context = fake_bpy.install()
+    addon = load_addon()
+
+    t0 = time.perf_counter()
+    addon.register()
+    register_time = time.perf_counter() - t0
+
+    tmpdir = None
+    filepath = args.ply
+    if not filepath and not args.merge:
+        tmpdir = tempfile.TemporaryDirectory()
+        filepath = os.path.join(tmpdir.name, f"synthetic_{args.points}.ply")
+        write_synthetic_ply(filepath, args.points)
+    merge_paths = []
+    if args.merge:
+        tmpdir = tmpdir or tempfile.TemporaryDirectory()
+        for i in range(args.merge):
+            merge_paths.append(write_synthetic_ply(
+                os.path.join(tmpdir.name, f"capture_{i}.ply"), args.points, seed=i))
+
+    settings = {}
+    if args.brush:
+        settings["gs_target_material"] = args.brush
+    if args.color_mode:
+        settings["gs_color_mode"] = args.color_mode
+    if args.sh_mode:
+        settings["gs_sh_mode"] = args.sh_mode
+    if args.remove_floaters:
+        settings["gs_remove_floaters"] = True
+
+    if args.analyze:
+        context = fake_bpy.reset()
+        for key, value in settings.items():
+            setattr(context.scene, key, value)
+        op = addon.GS_OT_Analyze()
+        op.filepath = merge_paths[0] if merge_paths else filepath
+        t0 = time.perf_counter()
+        op.execute(context)
+        print(f"[bench] analysis: {(time.perf_counter() - t0) * 1000:.1f} ms")
+        for _, line in op.reports:
+            print(f"[bench]   {line}")
+
+    budget = parse_budget(args.max_calls)
+    failed = False
+    timings = []
+    for i in range(args.repeat):
+        context = fake_bpy.reset()
+        t0 = time.perf_counter()
+        if merge_paths:
+            result = run_merge(addon, context, merge_paths, settings)
+        else:
+            result = run_import(addon, context, filepath, settings)
+        timings.append(time.perf_counter() - t0)
+        print(f"[bench] run {i + 1}: {timings[-1]:.3f}s -> {result}")
+
+        for name, limit in budget.items():
+            count = fake_bpy.STATS.calls[name]
+            if count > limit:
+                print(f"[bench] BUDGET EXCEEDED: {name} called {count}x (limit {limit})")
+                failed = True
+
+    print(f"[bench] register(): {register_time * 1000:.1f} ms")
+    print(f"[bench] import best {min(timings):.3f}s, mean {sum(timings) / len(timings):.3f}s")
+    print("[bench] Blender API calls (last run):")
+    print(fake_bpy.STATS.report())
+
+    addon.unregister()
+    if tmpdir:
+        tmpdir.cleanup()
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,79 @@
+"""
+Thread scaling benchmark of the per-splat transform stages.
+
+Times transforms.splat_arrays (position, opacity sigmoid, scale exp,
+Z-minimum reorientation) and palette.color_keys (SH -> packed sRGB keys,
+View Average) on a synthetic degree-3 cloud with 1, 2, 4, ... threads up to
+the CPUs of this machine, and reports splats per second and the speed-up
+over one thread.
+
+Usage:
+    python bench_parallel.py                     # 2M splats
+    python bench_parallel.py --points 5000000 --threads 1 8 16
+    python bench_parallel.py --ply scene.ply --chunk 32768
+"""
+
+import argparse
+import importlib
+import os
+import sys
+import tempfile
+
+import fake_bpy
+from bench_import import load_addon, write_synthetic_ply, ADDON_NAME
+from bench_sh import best_time
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--ply", help="Existing PLY file (default: synthetic degree-3 cloud)")
+    parser.add_argument("--points", type=int, default=2_000_000, help="Synthetic splat count")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per case (best is reported)")
+    parser.add_argument("--chunk", type=int, default=None, help="Splats per block (default: parallel.CHUNK)")
+    parser.add_argument("--threads", type=int, nargs="+", default=None,
+                        help="Thread counts to time (default: 1, 2, 4, ... up to the CPU count)")
+    args = parser.parse_args(argv)
+
+    fake_bpy.install()
+    addon = load_addon()
+    parallel = importlib.import_module(f"{ADDON_NAME}.parallel")
+    transforms = importlib.import_module(f"{ADDON_NAME}.transforms")
+    palette = importlib.import_module(f"{ADDON_NAME}.palette")
+    sh = importlib.import_module(f"{ADDON_NAME}.sh")
+
+    tmpdir = None
+    filepath = args.ply
+    if not filepath:
+        tmpdir = tempfile.TemporaryDirectory()
+        filepath = os.path.join(tmpdir.name, f"synthetic_{args.points}.ply")
+        write_synthetic_ply(filepath, args.points)
+
+    ply_data, n_points = addon.read_ply_data(filepath)
+    chunk = args.chunk or parallel.CHUNK
+    cpus = parallel.worker_count()
+    threads = args.threads or [t for t in (1, 2, 4, 8, 16, 32, 64) if t < cpus] + [cpus]
+    view = sh.ViewColor(ply_data.dtype.names, 'HEMISPHERE') if sh.file_degree(ply_data.dtype.names) else None
+    print(f"[bench] {n_points} splats, {chunk} splats/block, {cpus} CPUs available")
+
+    stages = [
+        ("transforms", lambda: transforms.splat_arrays(ply_data, True, chunk)),
+        ("colour keys", lambda: palette.color_keys(ply_data, True, chunk, view=view)),
+    ]
+    for label, fn in stages:
+        single = None
+        for count in threads:
+            parallel.shutdown()
+            parallel.worker_count = lambda count=count: count
+            seconds = best_time(fn, args.repeat)
+            single = single or seconds
+            print(f"[bench] {label:<12} {count:3d} threads {seconds * 1000:8.1f} ms  "
+                  f"{n_points / seconds / 1e6:6.1f} M splats/s  x{single / seconds:.2f}")
+
+    parallel.shutdown()
+    if tmpdir:
+        tmpdir.cleanup()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,100 @@
+"""
+Startup-time budget for enabling the addon.
+
+Each sample runs in a fresh interpreter (nothing cached by earlier imports),
+imports the addon package against `fake_bpy` and calls register(). Reports the
+time spent and fails if it exceeds the budget or if registration pulled in a
+module that should only load on first use (NumPy, colorsys, mathutils, ...).
+
+Blender keeps the addon's bytecode in __pycache__, so by default one untimed
+warm-up run fills a private bytecode cache first; --cold times compilation too.
+
+Usage:
+    python bench_register.py                     # default budget 50 ms
+    python bench_register.py --budget-ms 20 --samples 10
+    python bench_register.py --cold              # include bytecode compilation
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+# Modules registration must not import; they belong to the import/bake path
+DEFERRED_MODULES = ("numpy", "colorsys", "mathutils", "concurrent.futures")
+
+ADDON_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "blender-addon")
+
+_CHILD = r"""
+import importlib.util, json, sys, time
+sys.path.insert(0, {bench_dir!r})
+import fake_bpy
+fake_bpy.install()
+before = set(sys.modules)
+t0 = time.perf_counter()
+spec = importlib.util.spec_from_file_location(
+    "gs_oil_paint", {init_path!r}, submodule_search_locations=[{addon_dir!r}])
+addon = importlib.util.module_from_spec(spec)
+sys.modules["gs_oil_paint"] = addon
+spec.loader.exec_module(addon)
+t1 = time.perf_counter()
+addon.register()
+t2 = time.perf_counter()
+loaded = sorted(m for m in {deferred!r} if m in sys.modules and m not in before)
+print(json.dumps({{"import": t1 - t0, "register": t2 - t1, "loaded": loaded}}))
+"""
+
+
+def sample(pycache=None):
+    """Import + register() in a fresh interpreter; `pycache` is a bytecode cache folder."""
+    addon_dir = os.path.abspath(ADDON_DIR)
+    code = _CHILD.format(
+        bench_dir=os.path.dirname(os.path.abspath(__file__)),
+        init_path=os.path.join(addon_dir, "__init__.py"),
+        addon_dir=addon_dir,
+        deferred=DEFERRED_MODULES,
+    )
+    env = dict(os.environ)
+    if pycache:
+        env.pop("PYTHONDONTWRITEBYTECODE", None)
+        env["PYTHONPYCACHEPREFIX"] = pycache
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True, env=env)
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--budget-ms", type=float, default=50.0, help="Max import + register() time")
+    parser.add_argument("--samples", type=int, default=5, help="Fresh-interpreter samples")
+    parser.add_argument("--cold", action="store_true", help="No bytecode cache (time compilation too)")
+    args = parser.parse_args(argv)
+
+    if args.cold:
+        results = [sample() for _ in range(args.samples)]
+    else:
+        with tempfile.TemporaryDirectory() as pycache:
+            sample(pycache)
+            results = [sample(pycache) for _ in range(args.samples)]
+    totals = [(r["import"] + r["register"]) * 1000 for r in results]
+    best = min(totals)
+
+    print(f"[bench] addon import: {min(r['import'] for r in results) * 1000:.1f} ms (best)")
+    print(f"[bench] register():   {min(r['register'] for r in results) * 1000:.1f} ms (best)")
+    print(f"[bench] total:        {best:.1f} ms best, {sum(totals) / len(totals):.1f} ms mean "
+          f"(budget {args.budget_ms:.0f} ms)")
+
+    failed = False
+    loaded = sorted({m for r in results for m in r["loaded"]})
+    if loaded:
+        print(f"[bench] FAIL: registration imported deferred modules: {', '.join(loaded)}")
+        failed = True
+    if best > args.budget_ms:
+        print("[bench] FAIL: startup budget exceeded")
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
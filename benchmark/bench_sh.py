@@ -0,0 +1,77 @@
+"""
+Throughput benchmark of the colour stage with view-dependent SH bands.
+
+Times palette.color_keys (PLY colour fields -> packed sRGB keys) on a
+synthetic degree-3 cloud for the base colour only and for the View Average /
+Active Camera bakes at SH degrees 1-3, and reports splats per second.
+
+Usage:
+    python bench_sh.py                       # 1M splats
+    python bench_sh.py --points 5000000 --repeat 3
+    python bench_sh.py --ply scene.ply --chunk 65536
+"""
+
+import argparse
+import importlib
+import os
+import sys
+import tempfile
+import time
+
+import fake_bpy
+from bench_import import load_addon, write_synthetic_ply, ADDON_NAME
+
+
+def best_time(fn, repeat):
+    timings = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - t0)
+    return min(timings)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--ply", help="Existing PLY file (default: synthetic degree-3 cloud)")
+    parser.add_argument("--points", type=int, default=1_000_000, help="Synthetic splat count")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per case (best is reported)")
+    parser.add_argument("--chunk", type=int, default=None, help="Splats per block (default: KEY_CHUNK)")
+    parser.add_argument("--linear", action="store_true", help="Treat the source as linear (sRGB LUT path)")
+    args = parser.parse_args(argv)
+
+    fake_bpy.install()
+    addon = load_addon()
+    palette = importlib.import_module(f"{ADDON_NAME}.palette")
+    sh = importlib.import_module(f"{ADDON_NAME}.sh")
+
+    tmpdir = None
+    filepath = args.ply
+    if not filepath:
+        tmpdir = tempfile.TemporaryDirectory()
+        filepath = os.path.join(tmpdir.name, f"synthetic_{args.points}.ply")
+        write_synthetic_ply(filepath, args.points)
+
+    ply_data, n_points = addon.read_ply_data(filepath)
+    names = ply_data.dtype.names
+    chunk = args.chunk or palette.KEY_CHUNK
+    print(f"[bench] {n_points} splats, SH degree {sh.file_degree(names)} in file, {chunk} splats/block")
+
+    cases = [("base colour", None)]
+    for degree in range(1, sh.file_degree(names) + 1):
+        cases.append((f"view average, degree {degree}",
+                      sh.ViewColor(names, 'HEMISPHERE', max_degree=degree)))
+        cases.append((f"camera, degree {degree}",
+                      sh.ViewColor(names, 'CAMERA', (0.0, -10.0, 2.0), max_degree=degree)))
+
+    for label, view in cases:
+        seconds = best_time(lambda: palette.color_keys(ply_data, args.linear, chunk, view=view), args.repeat)
+        print(f"[bench] {label:<26} {seconds * 1000:8.1f} ms  {n_points / seconds / 1e6:6.1f} M splats/s")
+
+    if tmpdir:
+        tmpdir.cleanup()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
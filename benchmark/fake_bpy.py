@@ -0,0 +1,1318 @@
+"""
+Lightweight stand-in for the `bpy` and `mathutils` modules.
+
+It implements just enough of the datablock API used by the addon for the whole
+import path (GS_OT_Import -> process_and_bake -> create_shader) to run headless,
+and records every call that is expensive inside real Blender so benchmarks can
+guard against regressions.
+
+Usage:
+    import fake_bpy
+    fake_bpy.install()          # puts `bpy`, `bpy.*` and `mathutils` in sys.modules
+    ...
+    fake_bpy.STATS.calls        # Counter: "meshes.from_pydata" -> 1, ...
+    fake_bpy.STATS.elements     # Counter: "mesh.attributes.foreach_set" -> floats written
+"""
+
+import math
+import os
+import sys
+import tempfile
+import types
+from collections import Counter
+
+
+# ==============================================================================
+#  CALL RECORDER
+# ==============================================================================
+
+class CallStats:
+    """Counts API calls and the number of elements moved through buffer APIs."""
+
+    def __init__(self):
+        self.calls = Counter()
+        self.elements = Counter()
+
+    def record(self, name, elements=0):
+        self.calls[name] += 1
+        if elements:
+            self.elements[name] += elements
+
+    def reset(self):
+        self.calls.clear()
+        self.elements.clear()
+
+    def report(self):
+        lines = []
+        for name in sorted(self.calls):
+            line = f"  {name:<40} {self.calls[name]:>8}"
+            if self.elements[name]:
+                line += f"   ({self.elements[name]:,} elements)"
+            lines.append(line)
+        return "\n".join(lines)
+
+
+STATS = CallStats()
+
+
+def _length(seq):
+    try:
+        return len(seq)
+    except TypeError:
+        return 0
+
+
+# ==============================================================================
+#  ID COLLECTIONS
+# ==============================================================================
+
+class ID:
+    """Base for all datablocks: name, users and library linkage."""
+
+    def __init__(self, name):
+        self.name = name
+        self.users = 0
+        self.use_fake_user = False
+        self.library = None
+        self._id_props = {}
+
+    def __repr__(self):
+        return f"<{type(self).__name__} '{self.name}'>"
+
+    # Custom (ID) properties: obj["key"]
+    def __getitem__(self, key):
+        return self._id_props[key]
+
+    def __setitem__(self, key, value):
+        self._id_props[key] = value
+
+    def __contains__(self, key):
+        return key in self._id_props
+
+    def get(self, key, default=None):
+        return self._id_props.get(key, default)
+
+    def keys(self):
+        return list(self._id_props.keys())
+
+    def _release(self):
+        """Drop the user counts this block holds on others (on bpy.data.*.remove)."""
+
+
+class IDCollection:
+    """Mimics bpy_prop_collection for bpy.data.* (name lookup, unique names)."""
+
+    def __init__(self, kind, factory):
+        self._kind = kind
+        self._factory = factory
+        self._items = {}
+
+    def _unique_name(self, name):
+        if name not in self._items:
+            return name
+        i = 1
+        while f"{name}.{i:03d}" in self._items:
+            i += 1
+        return f"{name}.{i:03d}"
+
+    def _add(self, block):
+        block.name = self._unique_name(block.name)
+        self._items[block.name] = block
+        return block
+
+    def new(self, name, *args, **kwargs):
+        STATS.record(f"{self._kind}.new")
+        return self._add(self._factory(name, *args, **kwargs))
+
+    def remove(self, block, do_unlink=True):
+        STATS.record(f"{self._kind}.remove")
+        if self._items.pop(block.name, None) is not None:
+            block._release()
+
+    def get(self, name, default=None):
+        return self._items.get(name, default)
+
+    def keys(self):
+        return list(self._items.keys())
+
+    def values(self):
+        return list(self._items.values())
+
+    def __contains__(self, name):
+        return name in self._items
+
+    def __getitem__(self, key):
+        if isinstance(key, int):
+            return list(self._items.values())[key]
+        return self._items[key]
+
+    def __iter__(self):
+        return iter(list(self._items.values()))
+
+    def __len__(self):
+        return len(self._items)
+
+
+# ==============================================================================
+#  MESH / ATTRIBUTES
+# ==============================================================================
+
+class _AttributeData:
+    def __init__(self, attr):
+        self._attr = attr
+
+    def foreach_set(self, key, seq):
+        n = _length(seq)
+        STATS.record("mesh.attributes.foreach_set", n)
+        self._attr.values = seq
+
+    def foreach_get(self, key, seq):
+        n = _length(seq)
+        STATS.record("mesh.attributes.foreach_get", n)
+        if self._attr.values is not None:
+            _flat_set(seq, self._attr.values)
+
+    def __len__(self):
+        return self._attr.domain_size
+
+
+class Attribute:
+    def __init__(self, name, data_type, domain, domain_size):
+        self.name = name
+        self.data_type = data_type
+        self.domain = domain
+        self.domain_size = domain_size
+        self.values = None
+        self.data = _AttributeData(self)
+
+
+class AttributeCollection:
+    def __init__(self, mesh):
+        self._mesh = mesh
+        self._items = {}
+
+    def new(self, name, type, domain):
+        STATS.record("mesh.attributes.new")
+        attr = Attribute(name, type, domain, len(self._mesh.vertices))
+        self._items[name] = attr
+        return attr
+
+    def remove(self, attr):
+        STATS.record("mesh.attributes.remove")
+        self._items.pop(attr.name, None)
+
+    def get(self, name, default=None):
+        return self._items.get(name, default)
+
+    def __contains__(self, name):
+        return name in self._items
+
+    def __getitem__(self, name):
+        return self._items[name]
+
+    def __iter__(self):
+        return iter(list(self._items.values()))
+
+    def __len__(self):
+        return len(self._items)
+
+
+def _flat_set(seq, values):
+    """Copy `values` (any nesting) into the flat buffer `seq`, like foreach_get."""
+    import numpy as np
+    seq[:] = np.asarray(values, dtype=np.float64).reshape(-1)[:len(seq)]
+
+
+class _VertexCollection:
+    def __init__(self, mesh):
+        self._mesh = mesh
+        self._count = 0
+        self.co = None
+
+    def add(self, count):
+        STATS.record("mesh.vertices.add", count)
+        self._count += count
+
+    def foreach_set(self, key, seq):
+        STATS.record("mesh.vertices.foreach_set", _length(seq))
+        self.co = seq
+
+    def foreach_get(self, key, seq):
+        STATS.record("mesh.vertices.foreach_get", _length(seq))
+        if self.co is not None:
+            _flat_set(seq, self.co)
+
+    def __len__(self):
+        return self._count
+
+
+class _FlatCollection:
+    """Element collection backed by one flat list per property (loops, triangles, ...)."""
+
+    def __init__(self, name, **props):
+        self._name = name
+        self._props = props
+        self._count = 0
+
+    def set(self, count, **props):
+        self._count = count
+        self._props.update(props)
+
+    def foreach_get(self, key, seq):
+        STATS.record(f"mesh.{self._name}.foreach_get", _length(seq))
+        _flat_set(seq, self._props[key])
+
+    def foreach_set(self, key, seq):
+        STATS.record(f"mesh.{self._name}.foreach_set", _length(seq))
+        self._props[key] = seq
+
+    def __len__(self):
+        return self._count
+
+
+class UVLayer:
+    def __init__(self, name, n_loops):
+        self.name = name
+        self.data = _FlatCollection("uv_layers.data", uv=[0.0] * (2 * n_loops))
+        self.data._count = n_loops
+
+
+class _UVLayers(dict):
+    active = None
+
+    def new(self, name="UVMap"):
+        layer = UVLayer(name, len(self._mesh.loops))
+        self[name] = layer
+        if self.active is None:
+            self.active = layer
+        return layer
+
+
+class _MaterialSlots(list):
+    def append(self, material):
+        if material is not None:
+            material.users += 1
+        super().append(material)
+
+
+class Mesh(ID):
+    def __init__(self, name):
+        super().__init__(name)
+        self.vertices = _VertexCollection(self)
+        self.loops = _FlatCollection("loops", vertex_index=[])
+        self.polygons = _FlatCollection("polygons", loop_start=[], loop_total=[])
+        self.loop_triangles = _FlatCollection("loop_triangles", loops=[])
+        self.corner_normals = _FlatCollection("corner_normals", vector=[])
+        self.attributes = AttributeCollection(self)
+        self.uv_layers = _UVLayers()
+        self.uv_layers._mesh = self
+        self.materials = _MaterialSlots()
+
+    def from_pydata(self, vertices, edges, faces):
+        STATS.record("mesh.from_pydata", _length(vertices) * 3)
+        self._set_geometry(vertices, faces)
+
+    def _set_geometry(self, vertices, faces):
+        """from_pydata without recording: for data the fake itself provides."""
+        n = _length(vertices)
+        self.vertices._count = n
+        self.vertices.co = vertices
+
+        loop_verts, loop_start, loop_total, tris = [], [], [], []
+        for face in faces:
+            first = len(loop_verts)
+            loop_start.append(first)
+            loop_total.append(len(face))
+            loop_verts.extend(face)
+            for i in range(1, len(face) - 1):
+                tris.extend((first, first + i, first + i + 1))
+        self.loops.set(len(loop_verts), vertex_index=loop_verts)
+        self.polygons.set(len(faces), loop_start=loop_start, loop_total=loop_total)
+        self.loop_triangles.set(len(tris) // 3, loops=tris)
+        self.corner_normals.set(len(loop_verts), vector=[0.0, 0.0, 1.0] * len(loop_verts))
+
+    def _release(self):
+        for material in self.materials:
+            if material is not None:
+                material.users -= 1
+
+    def calc_loop_triangles(self):
+        STATS.record("mesh.calc_loop_triangles")
+
+    def update(self):
+        STATS.record("mesh.update")
+
+
+def _brush_quad(name):
+    """
+    Library meshes are unit quads with a 0..1 UVMap, like the asset.blend
+    brushes. Built without recording, so the counters only show addon calls.
+    """
+    mesh = Mesh(name)
+    mesh._set_geometry([(-0.5, -0.5, 0.0), (0.5, -0.5, 0.0), (0.5, 0.5, 0.0), (-0.5, 0.5, 0.0)], [(0, 1, 2, 3)])
+    uv = mesh.uv_layers.new("UVMap")
+    uv.data._props["uv"] = [0.0, 0.0, 1.0, 0.0, 1.0, 1.0, 0.0, 1.0]
+    return mesh
+
+
+# ==============================================================================
+#  IMAGES
+# ==============================================================================
+
+class _Pixels:
+    def __init__(self, image):
+        self._image = image
+        self._data = None
+
+    def foreach_set(self, seq):
+        STATS.record("image.pixels.foreach_set", _length(seq))
+        self._data = seq
+
+    def foreach_get(self, seq):
+        STATS.record("image.pixels.foreach_get", _length(seq))
+        if self._data is not None:
+            _flat_set(seq, self._data)
+
+    def __len__(self):
+        w, h = self._image.size
+        return w * h * self._image.channels
+
+
+class _ColorspaceSettings:
+    def __init__(self):
+        self.name = 'sRGB'
+
+
+class Image(ID):
+    def __init__(self, name, width=0, height=0, alpha=False, float_buffer=False, filepath=""):
+        super().__init__(name)
+        self.size = (width, height)
+        self.channels = 4
+        self.alpha_mode = 'STRAIGHT'
+        self.is_float = float_buffer
+        self.filepath = filepath
+        self.filepath_raw = filepath
+        self.file_format = 'PNG'
+        self.source = 'FILE' if filepath else 'GENERATED'
+        self.packed_file = None
+        self.colorspace_settings = _ColorspaceSettings()
+        self.pixels = _Pixels(self)
+
+    def pack(self):
+        STATS.record("image.pack", len(self.pixels))
+        self.packed_file = types.SimpleNamespace(size=self.size[0] * self.size[1] * 4)
+
+    def save(self, **kwargs):
+        STATS.record("image.save", len(self.pixels))
+
+    def reload(self):
+        STATS.record("image.reload")
+
+    def scale(self, width, height):
+        STATS.record("image.scale")
+        self.size = (width, height)
+
+
+class ImageCollection(IDCollection):
+    def __init__(self):
+        super().__init__("images", Image)
+
+    def new(self, name, width, height, alpha=False, float_buffer=False, **kwargs):
+        STATS.record("images.new", width * height * 4)
+        return self._add(Image(name, width, height, alpha, float_buffer))
+
+    def load(self, filepath, check_existing=False):
+        STATS.record("images.load")
+        if not os.path.exists(filepath):
+            raise RuntimeError(f"Error: Cannot read file '{filepath}'")
+        abspath = os.path.abspath(filepath)
+        if check_existing:
+            for img in self:
+                if img.filepath and os.path.abspath(img.filepath) == abspath:
+                    return img
+        return self._add(Image(os.path.basename(filepath), 256, 256, filepath=filepath))
+
+
+# ==============================================================================
+#  MATERIALS / NODES
+# ==============================================================================
+
+class Socket:
+    def __init__(self, node, name, index):
+        self.node = node
+        self.name = name
+        self.index = index
+        self.default_value = 0.0
+        self.is_linked = False
+
+
+class _SocketList:
+    """Sockets are reachable by index or by name; unknown names are created on demand."""
+
+    def __init__(self, node):
+        self._node = node
+        self._sockets = []
+
+    def _ensure(self, index):
+        while len(self._sockets) <= index:
+            self._sockets.append(Socket(self._node, f"Socket_{len(self._sockets)}", len(self._sockets)))
+        return self._sockets[index]
+
+    def __getitem__(self, key):
+        if isinstance(key, int):
+            return self._ensure(key)
+        for s in self._sockets:
+            if s.name == key:
+                return s
+        s = Socket(self._node, key, len(self._sockets))
+        self._sockets.append(s)
+        return s
+
+    def get(self, key, default=None):
+        for s in self._sockets:
+            if s.name == key:
+                return s
+        return default
+
+    def __len__(self):
+        return len(self._sockets)
+
+
+class Node:
+    def __init__(self, bl_idname):
+        self.bl_idname = bl_idname
+        self.type = bl_idname
+        self.name = bl_idname
+        self.label = ""
+        self.location = (0.0, 0.0)
+        self._image = None
+        self.inputs = _SocketList(self)
+        self.outputs = _SocketList(self)
+
+    @property
+    def image(self):
+        return self._image
+
+    @image.setter
+    def image(self, image):
+        if self._image is not None:
+            self._image.users -= 1
+        if image is not None:
+            image.users += 1
+        self._image = image
+
+
+class NodeCollection:
+    def __init__(self):
+        self._nodes = []
+
+    def new(self, type):
+        STATS.record("nodes.new")
+        node = Node(type)
+        self._nodes.append(node)
+        return node
+
+    def clear(self):
+        STATS.record("nodes.clear")
+        for node in self._nodes:
+            node.image = None
+        self._nodes.clear()
+
+    def remove(self, node):
+        self._nodes.remove(node)
+
+    def get(self, name, default=None):
+        for n in self._nodes:
+            if n.name == name:
+                return n
+        return default
+
+    def __getitem__(self, key):
+        if isinstance(key, int):
+            return self._nodes[key]
+        return self.get(key)
+
+    def __iter__(self):
+        return iter(list(self._nodes))
+
+    def __len__(self):
+        return len(self._nodes)
+
+
+class Link:
+    def __init__(self, from_socket, to_socket):
+        self.from_socket = from_socket
+        self.to_socket = to_socket
+
+
+class LinkCollection:
+    def __init__(self):
+        self._links = []
+
+    def new(self, from_socket, to_socket):
+        STATS.record("links.new")
+        to_socket.is_linked = True
+        link = Link(from_socket, to_socket)
+        self._links.append(link)
+        return link
+
+    def __iter__(self):
+        return iter(list(self._links))
+
+    def __len__(self):
+        return len(self._links)
+
+
+class NodeTree:
+    def __init__(self):
+        self.nodes = NodeCollection()
+        self.links = LinkCollection()
+
+
+class Material(ID):
+    def __init__(self, name):
+        super().__init__(name)
+        self.use_nodes = False
+        self.node_tree = NodeTree()
+        self.blend_method = 'OPAQUE'
+        self.use_backface_culling = False
+        self.show_transparent_back = True
+        self.specular_intensity = 0.5
+        self.roughness = 0.5
+
+    def _release(self):
+        for node in self.node_tree.nodes:
+            node.image = None
+
+    def copy(self):
+        """Duplicates settings, custom properties and nodes (images gain a user)."""
+        STATS.record("material.copy")
+        mat = Material(self.name)
+        for key, value in vars(self).items():
+            if key not in ("name", "users", "node_tree", "_id_props", "library"):
+                setattr(mat, key, value)
+        mat._id_props = dict(self._id_props)
+        for node in self.node_tree.nodes:
+            clone = mat.node_tree.nodes.new(node.bl_idname)
+            for key, value in vars(node).items():
+                if key not in ("_image", "inputs", "outputs"):
+                    setattr(clone, key, value)
+            clone.image = node.image
+        return bpy_data.materials._add(mat)
+
+
+class InterfaceItem:
+    def __init__(self, name, bl_socket_idname, identifier):
+        self.name = name
+        self.bl_socket_idname = bl_socket_idname
+        self.identifier = identifier
+        self.item_type = 'SOCKET'
+        self.in_out = 'INPUT'
+
+
+class _Interface:
+    def __init__(self, items):
+        self.items_tree = items
+
+    def new_socket(self, name, in_out='INPUT', socket_type='NodeSocketFloat'):
+        STATS.record("interface.new_socket")
+        item = InterfaceItem(name, socket_type, f"Socket_{len(self.items_tree)}")
+        item.in_out = in_out
+        item.default_value = 0.0
+        item.min_value = item.max_value = 0.0
+        self.items_tree.append(item)
+        return item
+
+
+class NodeGroup(ID):
+    def __init__(self, name, type='GeometryNodeTree'):
+        super().__init__(name)
+        self.bl_idname = type
+        self.nodes = NodeCollection()
+        self.links = LinkCollection()
+        self.interface = _Interface([])
+
+
+def _instancer_group(name):
+    """Library GS_Instancer: the interface the addon looks up by socket name."""
+    group = NodeGroup(name)
+    group.interface = _Interface([
+        InterfaceItem("Geometry", 'NodeSocketGeometry', "Socket_0"),
+        InterfaceItem("instance", 'NodeSocketObject', "Socket_1"),
+        InterfaceItem("Material", 'NodeSocketMaterial', "Socket_2"),
+    ])
+    return group
+
+
+# ==============================================================================
+#  OBJECTS / SCENE
+# ==============================================================================
+
+class Modifier(dict):
+    # Modifiers are distinct datablock members even when their inputs match
+    __eq__ = object.__eq__
+    __hash__ = object.__hash__
+
+    def __init__(self, name, type):
+        super().__init__()
+        self.name = name
+        self.type = type
+        self.node_group = None
+        self.show_viewport = True
+        self.show_render = True
+
+
+class ModifierCollection:
+    def __init__(self):
+        self._mods = []
+
+    def new(self, name, type):
+        STATS.record("modifiers.new")
+        mod = Modifier(name, type)
+        self._mods.append(mod)
+        return mod
+
+    def get(self, name, default=None):
+        for m in self._mods:
+            if m.name == name:
+                return m
+        return default
+
+    def remove(self, mod):
+        self._mods.remove(mod)
+
+    def move(self, from_index, to_index):
+        self._mods.insert(to_index, self._mods.pop(from_index))
+
+    def __getitem__(self, name):
+        return self.get(name)
+
+    def __iter__(self):
+        return iter(list(self._mods))
+
+    def __len__(self):
+        return len(self._mods)
+
+
+class Camera(ID):
+    def __init__(self, name):
+        super().__init__(name)
+        self.type = 'PERSP'
+        self.lens = 50.0
+        self.sensor_width = 36.0
+        self.ortho_scale = 6.0
+        self.clip_start = 0.1
+        self.clip_end = 1000.0
+
+
+class Object(ID):
+    def __init__(self, name, object_data=None):
+        super().__init__(name)
+        self.data = object_data
+        if isinstance(object_data, Mesh):
+            self.type = 'MESH'
+        elif isinstance(object_data, Camera):
+            self.type = 'CAMERA'
+        else:
+            self.type = 'EMPTY'
+        self.modifiers = ModifierCollection()
+        self.location = (0.0, 0.0, 0.0)
+        self.rotation_euler = (0.0, 0.0, 0.0)
+        self.scale = (1.0, 1.0, 1.0)
+        self.hide_viewport = False
+        self.hide_render = False
+        self.parent = None
+        self._selected = False
+        if object_data is not None:
+            object_data.users += 1
+
+    def _release(self):
+        if self.data is not None:
+            self.data.users -= 1
+        for coll in self.users_collection:
+            coll.objects.unlink(self)
+
+    def select_set(self, state):
+        self._selected = state
+
+    def select_get(self):
+        return self._selected
+
+    @property
+    def matrix_world(self):
+        """Location @ Euler XYZ rotation @ scale, as rows."""
+        cx, cy, cz = (math.cos(a) for a in self.rotation_euler)
+        sx, sy, sz = (math.sin(a) for a in self.rotation_euler)
+        rot = [
+            [cy * cz, sx * sy * cz - cx * sz, cx * sy * cz + sx * sz],
+            [cy * sz, sx * sy * sz + cx * cz, cx * sy * sz - sx * cz],
+            [-sy, sx * cy, cx * cy],
+        ]
+        rows = [[rot[i][j] * self.scale[j] for j in range(3)] + [self.location[i]] for i in range(3)]
+        return Matrix(rows + [[0.0, 0.0, 0.0, 1.0]])
+
+    @property
+    def users_collection(self):
+        return [c for c in [_CONTEXT[0].scene.collection, *bpy_data.collections]
+                if self in c.objects]
+
+    def calc_matrix_camera(self, depsgraph, x=1, y=1, scale_x=1.0, scale_y=1.0):
+        """OpenGL-style projection; sensor fit AUTO (sensor_width spans the larger side)."""
+        STATS.record("object.calc_matrix_camera")
+        cam = self.data
+        aspect = (x * scale_x) / (y * scale_y)
+        near, far = cam.clip_start, cam.clip_end
+        if cam.type == 'ORTHO':
+            half = cam.ortho_scale * 0.5
+            sx, sy = (1.0 / half, aspect / half) if aspect >= 1.0 else (1.0 / (half * aspect), 1.0 / half)
+            return Matrix([
+                [sx, 0.0, 0.0, 0.0],
+                [0.0, sy, 0.0, 0.0],
+                [0.0, 0.0, -2.0 / (far - near), -(far + near) / (far - near)],
+                [0.0, 0.0, 0.0, 1.0],
+            ])
+        f = 2.0 * cam.lens / cam.sensor_width
+        sx, sy = (f, f * aspect) if aspect >= 1.0 else (f / aspect, f)
+        return Matrix([
+            [sx, 0.0, 0.0, 0.0],
+            [0.0, sy, 0.0, 0.0],
+            [0.0, 0.0, (far + near) / (near - far), 2.0 * far * near / (near - far)],
+            [0.0, 0.0, -1.0, 0.0],
+        ])
+
+
+class _ObjectLinks:
+    def __init__(self):
+        self._objects = []
+
+    def link(self, obj):
+        STATS.record("collection.objects.link")
+        self._objects.append(obj)
+
+    def unlink(self, obj):
+        self._objects.remove(obj)
+
+    def __contains__(self, obj):
+        return obj in self._objects
+
+    def __iter__(self):
+        return iter(list(self._objects))
+
+    def __len__(self):
+        return len(self._objects)
+
+
+class Collection(ID):
+    def __init__(self, name):
+        super().__init__(name)
+        self.objects = _ObjectLinks()
+        self.children = _ObjectLinks()
+
+
+class _PropertyGroupBase:
+    """Base for Scene / Operator / Panel: resolves annotated bpy.props to defaults."""
+
+    def __getattr__(self, name):
+        for klass in type(self).__mro__:
+            prop = klass.__dict__.get("__annotations__", {}).get(name)
+            if isinstance(prop, _Property):
+                value = prop.default_for(self)
+                object.__setattr__(self, name, value)
+                return value
+        raise AttributeError(name)
+
+
+class RenderSettings:
+    def __init__(self):
+        self.resolution_x = 1920
+        self.resolution_y = 1080
+        self.resolution_percentage = 100
+        self.pixel_aspect_x = 1.0
+        self.pixel_aspect_y = 1.0
+
+
+class Scene(ID, _PropertyGroupBase):
+    def __init__(self, name="Scene"):
+        ID.__init__(self, name)
+        self.collection = Collection("Scene Collection")
+        self.camera = None
+        self.frame_current = 1
+        self.render = RenderSettings()
+
+    @property
+    def objects(self):
+        seen = []
+        for coll in [self.collection, *bpy_data.collections]:
+            seen.extend(o for o in coll.objects if o not in seen)
+        return seen
+
+    def frame_set(self, frame):
+        """Change frame and run the frame_change_pre/post handlers like Blender."""
+        handlers = sys.modules["bpy"].app.handlers
+        for handler in list(handlers.frame_change_pre):
+            handler(self, None)
+        self.frame_current = frame
+        for handler in list(handlers.frame_change_post):
+            handler(self, None)
+
+
+class _ActiveObjects:
+    def __init__(self):
+        self.active = None
+
+
+class ViewLayer:
+    def __init__(self):
+        self.objects = _ActiveObjects()
+
+
+class WindowManager:
+    def __init__(self):
+        self.file_selectors = 0
+        self.windows = []
+
+    def fileselect_add(self, operator):
+        self.file_selectors += 1
+
+
+class Context:
+    def __init__(self):
+        self.scene = Scene()
+        self.collection = self.scene.collection
+        self.view_layer = ViewLayer()
+        self.window_manager = WindowManager()
+
+    @property
+    def active_object(self):
+        return self.view_layer.objects.active
+
+    @property
+    def selected_objects(self):
+        return [o for o in self.scene.objects if o.select_get()]
+
+    def evaluated_depsgraph_get(self):
+        return types.SimpleNamespace(scene=self.scene)
+
+
+# ==============================================================================
+#  LIBRARIES
+# ==============================================================================
+
+# Datablock names reported for any .blend opened through libraries.load().
+# Benchmarks may replace this to mirror the real asset.blend contents.
+LIBRARY_CONTENTS = {
+    "meshes": ["Brush_Quad", "Brush_Curved", "Brush_Disc"],
+    "materials": [],
+    "node_groups": ["GS_Instancer"],
+    "objects": [],
+    "images": [],
+}
+
+_LIBRARY_FACTORIES = {
+    "meshes": _brush_quad,
+    "materials": Material,
+    "node_groups": _instancer_group,
+    "objects": Object,
+    "images": Image,
+}
+
+
+class _LibraryNames:
+    def __init__(self, contents):
+        for kind, names in contents.items():
+            setattr(self, kind, list(names))
+
+
+class _LibraryLoad:
+    def __init__(self, filepath, link):
+        self.filepath = filepath
+        self.link = link
+        self.data_from = _LibraryNames(LIBRARY_CONTENTS)
+        self.data_to = _LibraryNames({k: [] for k in LIBRARY_CONTENTS})
+
+    def __enter__(self):
+        STATS.record("libraries.load")
+        if not os.path.exists(self.filepath):
+            raise OSError(f"{self.filepath}: No such file or directory")
+        return self.data_from, self.data_to
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is not None:
+            return False
+        # Blender replaces requested names with the loaded datablocks
+        for kind, factory in _LIBRARY_FACTORIES.items():
+            names = getattr(self.data_to, kind)
+            loaded = []
+            for name in names:
+                if name not in getattr(self.data_from, kind):
+                    loaded.append(None)
+                    continue
+                STATS.record("libraries.link" if self.link else "libraries.append")
+                block = getattr(bpy_data, kind)._add(factory(name))
+                if self.link:
+                    block.library = bpy_data.libraries.ensure(self.filepath)
+                loaded.append(block)
+            setattr(self.data_to, kind, loaded)
+        return False
+
+
+class Library(ID):
+    def __init__(self, name, filepath=""):
+        super().__init__(name)
+        self.filepath = filepath
+
+
+class LibraryCollection(IDCollection):
+    def __init__(self):
+        super().__init__("libraries", Library)
+
+    def ensure(self, filepath):
+        for lib in self:
+            if lib.filepath == filepath:
+                return lib
+        return self._add(Library(os.path.basename(filepath), filepath))
+
+    def load(self, filepath, link=False, relative=False, **kwargs):
+        return _LibraryLoad(filepath, link)
+
+
+# ==============================================================================
+#  bpy.data
+# ==============================================================================
+
+class BlendData:
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.meshes = IDCollection("meshes", Mesh)
+        self.images = ImageCollection()
+        self.materials = IDCollection("materials", Material)
+        self.node_groups = IDCollection("node_groups", NodeGroup)
+        self.objects = IDCollection("objects", Object)
+        self.collections = IDCollection("collections", Collection)
+        self.cameras = IDCollection("cameras", Camera)
+        self.libraries = LibraryCollection()
+        self.filepath = ""
+
+    def orphans_purge(self, do_local_ids=True, do_linked_ids=True, do_recursive=False):
+        STATS.record("orphans_purge")
+        return 0
+
+
+bpy_data = BlendData()
+
+
+# ==============================================================================
+#  bpy.types / bpy.props / bpy.utils
+# ==============================================================================
+
+class _Property:
+    """Result of bpy.props.*Property(); acts as a descriptor when assigned to a type."""
+
+    def __init__(self, kind, **kwargs):
+        self.kind = kind
+        self.keywords = kwargs
+        self.attr = None
+
+    def __set_name__(self, owner, name):
+        self.attr = name
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+        key = self.attr or next(k for k, v in vars(type(obj)).items() if v is self)
+        if key not in obj.__dict__:
+            obj.__dict__[key] = self.default_for(obj)
+        return obj.__dict__[key]
+
+    def __set__(self, obj, value):
+        key = self.attr or next(k for k, v in vars(type(obj)).items() if v is self)
+        obj.__dict__[key] = value
+
+    def default_for(self, owner):
+        if "default" in self.keywords:
+            return self.keywords["default"]
+        items = self.keywords.get("items")
+        if self.kind == 'ENUM' and items is not None:
+            if callable(items):
+                items = items(owner, _CONTEXT[0])
+            return items[0][0] if items else ""
+        return {
+            'BOOL': False, 'INT': 0, 'FLOAT': 0.0, 'STRING': "", 'ENUM': "",
+        }.get(self.kind)
+
+
+def _prop_factory(kind):
+    def factory(**kwargs):
+        return _Property(kind, **kwargs)
+    return factory
+
+
+class Operator(_PropertyGroupBase):
+    bl_idname = ""
+    bl_label = ""
+    bl_options = set()
+
+    def __init__(self):
+        self.reports = []
+
+    def report(self, type, message):
+        self.reports.append((set(type), message))
+
+
+class Panel(_PropertyGroupBase):
+    pass
+
+
+class PropertyGroup(_PropertyGroupBase):
+    pass
+
+
+class OperatorFileListElement(PropertyGroup):
+    def __init__(self, name=""):
+        self.name = name
+
+
+class _PreviewPixels:
+    def __init__(self):
+        self.data = None
+
+    def foreach_set(self, seq):
+        STATS.record("preview.pixels.foreach_set", _length(seq))
+        self.data = seq
+
+
+class ImagePreview:
+    def __init__(self, icon_id):
+        self.icon_id = icon_id
+        self.image_size = (0, 0)
+        self.image_pixels_float = _PreviewPixels()
+
+
+class _Previews(dict):
+    def __init__(self):
+        super().__init__()
+
+    def load(self, name, filepath, filetype, force_reload=False):
+        STATS.record("previews.load")
+        preview = types.SimpleNamespace(icon_id=len(self) + 1, filepath=filepath)
+        self[name] = preview
+        return preview
+
+    def new(self, name):
+        STATS.record("previews.new")
+        preview = ImagePreview(len(self) + 1)
+        self[name] = preview
+        return preview
+
+    def close(self):
+        self.clear()
+
+
+_REGISTERED = []
+_CONTEXT = [None]
+_TIMERS = []
+
+
+def _register_class(cls):
+    STATS.record("utils.register_class")
+    _REGISTERED.append(cls)
+
+
+def _unregister_class(cls):
+    STATS.record("utils.unregister_class")
+    if cls in _REGISTERED:
+        _REGISTERED.remove(cls)
+
+
+def _previews_new():
+    STATS.record("previews.new_collection")
+    return _Previews()
+
+
+def _previews_remove(pcoll):
+    pcoll.close()
+
+
+def _timer_register(function, first_interval=0.0, persistent=False):
+    _TIMERS.append(function)
+
+
+def _timer_unregister(function):
+    if function in _TIMERS:
+        _TIMERS.remove(function)
+
+
+def _timer_is_registered(function):
+    return function in _TIMERS
+
+
+def run_timers():
+    """Drive bpy.app.timers callbacks until they all return None."""
+    while _TIMERS:
+        for fn in list(_TIMERS):
+            if fn() is None and fn in _TIMERS:
+                _TIMERS.remove(fn)
+
+
+def _extension_path_user(package, path="", create=False):
+    root = os.path.join(_USER_DIR[0] or os.path.join(tempfile.gettempdir(), "gs_fake_bpy_user"), path)
+    if create:
+        os.makedirs(root, exist_ok=True)
+    return root
+
+
+_USER_DIR = [None]
+
+
+def _display_name_from_filepath(filepath):
+    return os.path.splitext(os.path.basename(filepath))[0]
+
+
+# ==============================================================================
+#  mathutils
+# ==============================================================================
+
+class Euler(tuple):
+    def __new__(cls, values=(0.0, 0.0, 0.0), order='XYZ'):
+        return super().__new__(cls, values)
+
+    x = property(lambda self: self[0])
+    y = property(lambda self: self[1])
+    z = property(lambda self: self[2])
+
+
+class Quaternion:
+    def __init__(self, wxyz=(1.0, 0.0, 0.0, 0.0)):
+        self.w, self.x, self.y, self.z = (float(v) for v in wxyz)
+
+    def to_euler(self, order='XYZ'):
+        STATS.record("mathutils.Quaternion.to_euler")
+        w, x, y, z = self.w, self.x, self.y, self.z
+        n = math.sqrt(w * w + x * x + y * y + z * z) or 1.0
+        w, x, y, z = w / n, x / n, y / n, z / n
+        sy = 2.0 * (w * y - x * z)
+        sy = max(-1.0, min(1.0, sy))
+        ex = math.atan2(2.0 * (w * x + y * z), 1.0 - 2.0 * (x * x + y * y))
+        ey = math.asin(sy)
+        ez = math.atan2(2.0 * (w * z + x * y), 1.0 - 2.0 * (y * y + z * z))
+        return Euler((ex, ey, ez))
+
+
+class Vector(tuple):
+    def __new__(cls, values=(0.0, 0.0, 0.0)):
+        return super().__new__(cls, (float(v) for v in values))
+
+    x = property(lambda self: self[0])
+    y = property(lambda self: self[1])
+    z = property(lambda self: self[2])
+
+
+class Matrix:
+    def __init__(self, rows=None):
+        if rows is None:
+            rows = [[1.0 if i == j else 0.0 for j in range(4)] for i in range(4)]
+        self.rows = [list(r) for r in rows]
+
+    @classmethod
+    def Identity(cls, size):
+        return cls([[1.0 if i == j else 0.0 for j in range(size)] for i in range(size)])
+
+    def __iter__(self):
+        return iter(self.rows)
+
+    def __len__(self):
+        return len(self.rows)
+
+    def __getitem__(self, i):
+        return self.rows[i]
+
+
+# ==============================================================================
+#  INSTALLATION
+# ==============================================================================
+
+def _build_modules():
+    bpy = types.ModuleType("bpy")
+    bpy.data = bpy_data
+
+    bpy.types = types.ModuleType("bpy.types")
+    for cls in (ID, Mesh, Image, Material, NodeGroup, Object, Camera, Scene, Collection,
+                Operator, Panel, PropertyGroup, OperatorFileListElement, Context):
+        setattr(bpy.types, cls.__name__, cls)
+    bpy.types.NodeTree = NodeGroup
+
+    bpy.props = types.ModuleType("bpy.props")
+    for kind in ('Bool', 'Int', 'Float', 'String', 'Enum', 'FloatVector', 'IntVector', 'Pointer', 'Collection'):
+        setattr(bpy.props, f"{kind}Property", _prop_factory(kind.upper()))
+
+    bpy.utils = types.ModuleType("bpy.utils")
+    bpy.utils.register_class = _register_class
+    bpy.utils.unregister_class = _unregister_class
+    bpy.utils.extension_path_user = _extension_path_user
+    bpy.utils.previews = types.ModuleType("bpy.utils.previews")
+    bpy.utils.previews.new = _previews_new
+    bpy.utils.previews.remove = _previews_remove
+    bpy.utils.previews.ImagePreviewCollection = _Previews
+
+    bpy.path = types.ModuleType("bpy.path")
+    bpy.path.display_name_from_filepath = _display_name_from_filepath
+    bpy.path.abspath = lambda p, **kw: os.path.abspath(p)
+    bpy.path.ensure_ext = lambda p, ext, **kw: p if p.lower().endswith(ext) else p + ext
+
+    bpy.app = types.ModuleType("bpy.app")
+    bpy.app.version = (4, 2, 0)
+    bpy.app.background = True
+    bpy.app.tempdir = ""
+    bpy.app.timers = types.SimpleNamespace(
+        register=_timer_register,
+        unregister=_timer_unregister,
+        is_registered=_timer_is_registered,
+    )
+    bpy.app.handlers = types.SimpleNamespace(
+        load_post=[], save_pre=[], depsgraph_update_post=[], frame_change_pre=[],
+        frame_change_post=[],
+        persistent=lambda function: function,
+    )
+
+    bpy.ops = types.SimpleNamespace()
+
+    mathutils = types.ModuleType("mathutils")
+    mathutils.Quaternion = Quaternion
+    mathutils.Euler = Euler
+    mathutils.Vector = Vector
+    mathutils.Matrix = Matrix
+
+    return {
+        "bpy": bpy,
+        "bpy.types": bpy.types,
+        "bpy.props": bpy.props,
+        "bpy.utils": bpy.utils,
+        "bpy.utils.previews": bpy.utils.previews,
+        "bpy.path": bpy.path,
+        "bpy.app": bpy.app,
+        "mathutils": mathutils,
+    }
+
+
+def install():
+    """Register the fake modules in sys.modules and return a fresh Context."""
+    sys.modules.update(_build_modules())
+    context = new_context()
+    return context
+
+
+def new_context():
+    context = Context()
+    _CONTEXT[0] = context
+    if "bpy" in sys.modules:
+        sys.modules["bpy"].context = context
+    return context
+
+
+def reset():
+    """Drop all datablocks and recorded stats (between benchmark runs)."""
+    bpy_data.reset()
+    STATS.reset()
+    return new_context()
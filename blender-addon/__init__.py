@@ -1,15 +1,14 @@
 import bpy
-import numpy as np
-import colorsys
 import time
-import sys
-import struct
-import mathutils
 import os
+import re
+import contextlib
 import bpy.utils.previews
-import bpy.utils.previews
+# NOTE: numpy, colorsys and mathutils are imported inside the functions that use
+# them, so enabling the addon (e.g. headless farm jobs) stays cheap.
 # from .geometry_node import create_gs_node_system
-from .shader import create_shader
+from .shader import material_for_palette, template_key
+from . import thumbnails, parallel
 
 bl_info = {
     "name": "3DGS Oil Paint",
@@ -25,51 +24,81 @@ bl_info = {
 #  MINIMAL PLY READER (Embedded to avoid dependencies)
 # ==============================================================================
 
+# Mapping PLY types to Numpy types
+PLY_TYPE_MAP = {
+    'float': 'f4', 'float32': 'f4',
+    'double': 'f8', 'float64': 'f8',
+    'uchar': 'u1', 'uint8': 'u1',
+    'int': 'i4', 'int32': 'i4'
+}
+
+
+def read_ply_header(f):
+    """
+    Parse the header of a PLY file opened in binary mode, leaving `f` at the
+    first vertex record. Returns (numpy dtype list, vertex count).
+    """
+    # Header Parsing
+    header_lines = []
+    while True:
+        line = f.readline().strip().decode('ascii')
+        header_lines.append(line)
+        if line == 'end_header':
+            break
+    
+    # Parse elements
+    vertex_count = 0
+    properties = []
+    for line in header_lines:
+        if line.startswith('element vertex'):
+            vertex_count = int(line.split()[-1])
+        elif line.startswith('property'):
+            parts = line.split()
+            name = parts[-1]
+            dtype = parts[1]
+            properties.append((name, dtype))
+    
+    # Define Numpy Dtype
+    dtype_list = []
+    for name, dtype_str in properties:
+        dtype_list.append((name, PLY_TYPE_MAP.get(dtype_str, 'f4')))
+    return dtype_list, vertex_count
+
+
 def read_ply_data(filepath):
     """
     A minimal high-performance PLY reader optimized for 3DGS format.
     Returns a dictionary of numpy arrays.
     """
+    import numpy as np
+
     with open(filepath, 'rb') as f:
-        # Header Parsing
-        header_lines = []
-        while True:
-            line = f.readline().strip().decode('ascii')
-            header_lines.append(line)
-            if line == 'end_header':
-                break
-        
-        # Parse elements
-        vertex_count = 0
-        properties = []
-        for line in header_lines:
-            if line.startswith('element vertex'):
-                vertex_count = int(line.split()[-1])
-            elif line.startswith('property'):
-                parts = line.split()
-                name = parts[-1]
-                dtype = parts[1]
-                properties.append((name, dtype))
-        
-        # Define Numpy Dtype
-        # Mapping PLY types to Numpy types
-        type_map = {
-            'float': 'f4', 'float32': 'f4',
-            'double': 'f8', 'float64': 'f8',
-            'uchar': 'u1', 'uint8': 'u1',
-            'int': 'i4', 'int32': 'i4'
-        }
-        
-        dtype_list = []
-        for name, dtype_str in properties:
-            dtype_list.append((name, type_map.get(dtype_str, 'f4')))
-            
+        dtype_list, vertex_count = read_ply_header(f)
         # Read Data
         # 3DGS files are usually little-endian
         data = np.fromfile(f, dtype=dtype_list, count=vertex_count)
         
     return data, vertex_count
 
+
+def sample_ply_data(filepath, count):
+    """
+    About `count` evenly strided records of a PLY file, read through a memory
+    map so only the pages they sit on are touched. Returns (sample, vertex count).
+    """
+    import numpy as np
+
+    with open(filepath, 'rb') as f:
+        dtype_list, vertex_count = read_ply_header(f)
+        offset = f.tell()
+    if vertex_count == 0:
+        return np.zeros(0, dtype=dtype_list), 0
+    stride = max(1, vertex_count // max(count, 1))
+    records = np.memmap(filepath, dtype=dtype_list, mode='r', offset=offset, shape=(vertex_count,))
+    sample = np.array(records[::stride])
+    del records     # release the mapping (Windows keeps the file locked otherwise)
+    return sample, vertex_count
+
 # ==============================================================================
 #  CORE LOGIC: BAKER & IMPORTER
 # ==============================================================================
@@ -86,9 +115,11 @@ def read_ply_data(filepath):
 preview_collections = {}
 
 class AssetManager:
-    _cached_meshes = []
-    _last_scan_time = 0
-    
+    # Index of datablock names in asset.blend, re-read only when the file changes
+    _index = None
+    _index_key = None
+    _mesh_items = []
+
     @classmethod
     def get_asset_path(cls):
         return os.path.join(os.path.dirname(os.path.realpath(__file__)), "asset.blend")
@@ -97,47 +128,210 @@ class AssetManager:
     def get_brush_path(cls, subfolder):
         return os.path.join(os.path.dirname(os.path.realpath(__file__)), "brush", subfolder)
 
+    @staticmethod
+    def _file_key(path):
+        try:
+            return (path, os.stat(path).st_mtime_ns)
+        except OSError:
+            return None
+
     @classmethod
-    def scan_assets(cls, context):
-        # Cache for 2 seconds to avoid spamming disk
-        if time.time() - cls._last_scan_time < 2.0 and cls._cached_meshes:
-            return
+    def _store_index(cls, data_from, asset_path):
+        cls._index = {
+            "meshes": list(data_from.meshes),
+            "node_groups": list(data_from.node_groups),
+        }
+        cls._index_key = cls._file_key(asset_path)
+        # Enum items must stay referenced while Blender displays them
+        cls._mesh_items = [(m, m, "") for m in cls._index["meshes"]]
+
+    @classmethod
+    def index_is_current(cls):
+        return cls._index is not None and cls._index_key == cls._file_key(cls.get_asset_path())
+
+    @classmethod
+    def get_index(cls):
+        """Names of the meshes and node groups in asset.blend (re-read when its mtime changes)."""
+        if cls.index_is_current():
+            return cls._index
 
         asset_path = cls.get_asset_path()
         if not os.path.exists(asset_path):
             print(f"Asset file missing: {asset_path}")
-            return
+            return {"meshes": [], "node_groups": []}
 
-        with bpy.data.libraries.load(asset_path, link=False) as (data_from, data_to):
-            cls._cached_meshes = [(m, m, "") for m in data_from.meshes]
-        
-        cls._last_scan_time = time.time()
+        # Only reads the directory of the library, nothing is linked here
+        with bpy.data.libraries.load(asset_path, link=True) as (data_from, data_to):
+            cls._store_index(data_from, asset_path)
+        return cls._index
+
+    @classmethod
+    def find_linked(cls, collection, name):
+        """Return the datablock `name` already linked from asset.blend, if any."""
+        asset_path = os.path.normcase(cls.get_asset_path())
+        for block in collection:
+            if block.name != name or not block.library:
+                continue
+            lib_path = os.path.abspath(bpy.path.abspath(block.library.filepath))
+            if os.path.normcase(lib_path) == asset_path:
+                return block
+        return None
 
     @classmethod
-    def import_all_assets(cls):
-        """Import ALL meshes from asset.blend into the current project"""
+    @contextlib.contextmanager
+    def linking(cls):
+        """
+        Link only the requested meshes and node groups from asset.blend, opening
+        the library at most once. Yields link(meshes=(), node_groups=()), which
+        returns {"meshes": {name: Mesh}, "node_groups": {name: NodeTree}},
+        complete when the block exits. Datablocks linked by earlier imports are
+        reused. A stale index is re-read by opening the library on entry, so the
+        enums that list it resolve inside the block; otherwise the library is
+        opened on exit, and not at all when everything is already present.
+        """
         asset_path = cls.get_asset_path()
+        found = {"meshes": {}, "node_groups": {}}
+        missing = {"meshes": [], "node_groups": []}
+
+        def link(meshes=(), node_groups=()):
+            for kind, names in (("meshes", meshes), ("node_groups", node_groups)):
+                collection = getattr(bpy.data, kind)
+                for name in names:
+                    block = cls.find_linked(collection, name)
+                    if block:
+                        found[kind][name] = block
+                    else:
+                        missing[kind].append(name)
+            return found
+
         if not os.path.exists(asset_path):
             print(f"Asset file missing: {asset_path}")
+            yield link
             return
 
-        # Prepare lists of assets to load
-        meshes_to_load = []
+        stale = not cls.index_is_current()
+        if not stale:
+            yield link
+            if not any(missing.values()):
+                return
 
-        # First inspect what's available
-        with bpy.data.libraries.load(asset_path, link=False) as (data_from, data_to):
-            for m in data_from.meshes:
-                if m not in bpy.data.meshes:
-                    meshes_to_load.append(m)
-            
-            data_to.meshes = meshes_to_load
-            
-        print(f"[AssetManager] Imported {len(meshes_to_load)} new meshes.")
+        with bpy.data.libraries.load(asset_path, link=True) as (data_from, data_to):
+            cls._store_index(data_from, asset_path)
+            if stale:
+                yield link
+            data_to.meshes = [n for n in missing["meshes"] if n in data_from.meshes]
+            data_to.node_groups = [n for n in missing["node_groups"] if n in data_from.node_groups]
+
+        for kind in ("meshes", "node_groups"):
+            for block in getattr(data_to, kind):
+                if block:
+                    found[kind][block.name] = block
+
+        print(f"[AssetManager] Linked {len(data_to.meshes) + len(data_to.node_groups)} datablocks.")
 
     @classmethod
     def get_mesh_items(cls, scene, context):
-        cls.scan_assets(context)
-        return cls._cached_meshes if cls._cached_meshes else [("NONE", "None", "")]
+        cls.get_index()
+        return cls._mesh_items if cls._mesh_items else [("NONE", "None", "")]
+
+
+class BrushRegistry:
+    """
+    Brush textures found in brush/tex_alpha and brush/tex_normal.
+    The folders are listed once and re-listed only when their mtime changes;
+    alpha->normal pairs and loaded image handles are indexed for O(1) lookup.
+    """
+    VALID_EXTS = ('.png', '.jpg', '.jpeg', '.tif', '.tiff')
+
+    _signature = None
+    _alpha_files = []      # natural-sorted file names in tex_alpha
+    _normal_paths = {}     # base name -> path in tex_normal
+    _image_names = {}      # normalized abspath -> bpy.data.images name
+
+    @staticmethod
+    def natural_key(text):
+        # Sort NATURALLY (e.g. 1, 2, 10 instead of 1, 10, 2)
+        return [int(c) if c.isdigit() else c.lower() for c in re.split(r'(\d+)', text)]
+
+    @classmethod
+    def _list_images(cls, folder):
+        try:
+            names = os.listdir(folder)
+        except OSError:
+            return []
+        return [f for f in names
+                if not f.startswith(('.', '_')) and f.lower().endswith(cls.VALID_EXTS)]
+
+    @classmethod
+    def _folder_signature(cls):
+        sig = []
+        for sub in ("tex_alpha", "tex_normal"):
+            try:
+                sig.append(os.stat(AssetManager.get_brush_path(sub)).st_mtime_ns)
+            except OSError:
+                sig.append(None)
+        return tuple(sig)
+
+    @classmethod
+    def refresh(cls):
+        """Re-scan brush folders if they changed. Returns the current signature."""
+        signature = cls._folder_signature()
+        if signature == cls._signature:
+            return signature
+
+        cls._alpha_files = sorted(cls._list_images(AssetManager.get_brush_path("tex_alpha")), key=cls.natural_key)
+
+        normal_dir = AssetManager.get_brush_path("tex_normal")
+        cls._normal_paths = {}
+        for f in sorted(cls._list_images(normal_dir)):
+            cls._normal_paths.setdefault(os.path.splitext(f)[0], os.path.join(normal_dir, f))
+
+        cls._signature = signature
+        return signature
+
+    @classmethod
+    def alpha_files(cls):
+        cls.refresh()
+        return cls._alpha_files
+
+    @classmethod
+    def get_alpha_path(cls, name):
+        if name not in cls.alpha_files():
+            return None
+        return os.path.join(AssetManager.get_brush_path("tex_alpha"), name)
+
+    @classmethod
+    def get_normal_path(cls, alpha_name):
+        """Normal map with the same base name as the alpha texture (excluding format)."""
+        cls.refresh()
+        return cls._normal_paths.get(os.path.splitext(alpha_name)[0])
+
+    @staticmethod
+    def _path_key(path):
+        return os.path.normcase(os.path.abspath(bpy.path.abspath(path)))
+
+    @classmethod
+    def get_image(cls, filepath):
+        """
+        Return the bpy image loaded from `filepath`, loading it only if needed.
+        Lookup is by path, since alpha and normal maps may share a file name.
+        """
+        key = cls._path_key(filepath)
+
+        name = cls._image_names.get(key)
+        img = bpy.data.images.get(name) if name else None
+        if img and img.filepath and cls._path_key(img.filepath) == key:
+            return img
+
+        # Index is stale (image renamed/removed or loaded elsewhere): rebuild it once
+        cls._image_names = {cls._path_key(i.filepath): i.name for i in bpy.data.images if i.filepath}
+        name = cls._image_names.get(key)
+        if name:
+            return bpy.data.images[name]
+
+        img = bpy.data.images.load(filepath)
+        cls._image_names[key] = img.name
+        return img
 
 # Helper callbacks for EnumProperty (must be module-level functions to avoid registration issues)
 # Helper callbacks for EnumProperty (must be module-level functions to avoid registration issues)
@@ -147,31 +341,16 @@ def get_brush_textures_callback(self, context):
     if not os.path.exists(brush_path):
         return [("NONE", "Path Missing", "", 0, 0)]
 
-    # 1. Get raw file list
-    try:
-        raw_files = sorted(os.listdir(brush_path))
-    except Exception as e:
-        print(f"[GS_Tool_DEBUG] Error scanning: {e}")
-        return [("NONE", "Scan Error", "", 0, 0)]
-
-    # 2. Filter images
-    valid_exts = ('.png', '.jpg', '.jpeg', '.tif', '.tiff')
-    image_files = []
-    for f in raw_files:
-        if f.startswith('.') or f.startswith('_'): 
-            continue
-        if f.lower().endswith(valid_exts):
-            image_files.append(f)
-            
-    # Sort immediately after filtering to guarantee order stability
-    image_files.sort()
+    # 1. Cheap change check (folder mtime), the listing itself is cached
+    signature = BrushRegistry.refresh()
+    image_files = BrushRegistry.alpha_files()
             
     if not image_files:
-        return [("NONE", "No Images Found", "", 0)]
+        return [("NONE", "No Images Found", "", 0, 0)]
 
-    # 3. Ensure Preview Collection
+    # 2. Ensure Preview Collection
     pcoll = preview_collections.get("main")
-    if not pcoll:
+    if pcoll is None: # an empty collection is falsy (dict subclass)
         print("[GS_Tool_DEBUG] Re-creating pcoll...")
         try:
             pcoll = bpy.utils.previews.new()
@@ -180,35 +359,27 @@ def get_brush_textures_callback(self, context):
         except:
              return [("NONE", "Pcoll Error", "", 0, 0)]
 
-    # === FIXED CACHING LOGIC ===
-    # Only rebuild the list if it's empty or explicitly cleared.
+    # === CACHING LOGIC ===
+    # Only rebuild the list when the brush folder changed.
     # Re-building it every frame causes the UI ID mismatch ("jumping names").
-    # Renamed to _v2 to force refresh after sorting update.
     if not hasattr(pcoll, "my_items_cache_v2"):
         pcoll.my_items_cache_v2 = []
+        pcoll.my_items_signature = None
         
-    if pcoll.my_items_cache_v2:
+    if pcoll.my_items_cache_v2 and pcoll.my_items_signature == signature:
         return pcoll.my_items_cache_v2
 
-    # 4. Build Items List (Standard 5-tuple)
+    # 3. Build Items List (Standard 5-tuple), already naturally sorted
     items = []
     
-    # Sort image_files NATURALLY (e.g. 1, 2, 10 instead of 1, 10, 2)
-    # This prevents user confusion with numbered brush files.
-    import re
-    def natural_key(text):
-        return [int(c) if c.isdigit() else c.lower() for c in re.split(r'(\d+)', text)]
-    
-    image_files.sort(key=natural_key)
-    
     for i, name in enumerate(image_files):
         # Unique ID is file name
         filepath = os.path.join(brush_path, name)
         
-        # Load into pcoll if missing
+        # Empty preview now, downscaled icon filled in lazily (disk cached)
         if name not in pcoll:
             try:
-                pcoll.load(name, filepath, 'IMAGE')
+                thumbnails.request(pcoll, name, filepath)
             except Exception as e:
                 print(f"[GS_Tool_DEBUG] Failed to load {name}: {e}")
                 continue
@@ -223,6 +394,7 @@ def get_brush_textures_callback(self, context):
     
     # Cache the result!
     pcoll.my_items_cache_v2 = items
+    pcoll.my_items_signature = signature
         
     return items if items else [("NONE", "None", "", 0, 0)]
 
@@ -245,6 +417,7 @@ class GS_Processor:
 
     @staticmethod
     def linear_to_srgb(linear):
+        import numpy as np
         a = 0.055
         srgb = np.where(
             linear <= 0.0031308,
@@ -258,185 +431,17 @@ class GS_Processor:
 
 
     @classmethod
-    def process_and_bake(cls, context, filepath):
-        # 0. Get user selections
-        target_mat_name = context.scene.gs_target_material
-        target_mesh_name = context.scene.gs_target_mesh
-        target_mesh_name = context.scene.gs_target_mesh
-        z_is_minimum = getattr(context.scene, "gs_z_is_minimum", True)
-        y_up_to_z_up = getattr(context.scene, "gs_y_up_to_z_up", True)
-        source_is_linear = getattr(context.scene, "gs_source_is_linear", True)
-        
-        # Valid check for NONE
-        if target_mat_name == "NONE":
-            target_mat_name = None
-        if target_mesh_name == "NONE":
-            target_mesh_name = None
-        
-        cls.log(f"Target Material: {target_mat_name}")
-        cls.log(f"Target Mesh: {target_mesh_name}")
-        cls.log(f"Z is Minimum: {z_is_minimum}")
-        cls.log(f"Y-up to Z-up: {y_up_to_z_up}")
-        cls.log(f"Source is Linear: {source_is_linear}")
-        
-        # Step 1: Ensure Library Assets are Loaded
-        AssetManager.import_all_assets()
-        
-        # Step 2: Retrieve the selected assets from bpy.data
-        template_mat = None
-        template_mesh = None
-        
-        if target_mat_name and target_mat_name in bpy.data.materials:
-            template_mat = bpy.data.materials[target_mat_name]
-        
-        if target_mesh_name and target_mesh_name in bpy.data.meshes:
-            template_mesh = bpy.data.meshes[target_mesh_name]
-        
-        if target_mat_name and not template_mat:
-            cls.log(f"ERROR: Material '{target_mat_name}' not found locally after import!")
-        
-        start_time = time.time()
-        
-        # 1. Load PLY data
-        cls.log(f"Loading: {filepath}")
-        ply_data, n_points = read_ply_data(filepath)
-        
-        # 2. Extract and process basic data (NumPy Vectorization)
-        # Position
-        xyz = np.stack((ply_data['x'], ply_data['y'], ply_data['z']), axis=1)
-        
-        # Opacity
-        if 'opacity' in ply_data.dtype.names:
-            log_opacities = ply_data['opacity']
-            opacities = 1 / (1 + np.exp(-log_opacities))
-        else:
-            log_opacities = np.zeros(n_points)
-            opacities = np.ones(n_points)
-
-        # Scale
-        scale_names = [n for n in ply_data.dtype.names if n.startswith('scale')]
-        if len(scale_names) >= 3:
-            log_scales = np.stack([ply_data[n] for n in scale_names[:3]], axis=1)
-            scales = np.exp(log_scales)
-        else:
-            log_scales = np.ones((n_points, 3)) * -4.6 
-            scales = np.ones((n_points, 3)) * 0.01
-
-        # Rotation
-        rot_names = [n for n in ply_data.dtype.names if n.startswith('rot')]
-        quats = np.zeros((n_points, 4), dtype=np.float32)
-        quats[:, 0] = 1.0
-        
-        if len(rot_names) >= 4:
-            quats = np.stack([ply_data[n] for n in rot_names[:4]], axis=1)
-            # Reference script does NOT normalize explicitly
-
-        # ---------------------------------------------------------
-        # Optional: Force Z to be the smallest scale axis
-        # ---------------------------------------------------------
-        if z_is_minimum:
-            cls.log("Applying Z-Minimum logic (reorienting splats)...")
-            # Find closest axis to "flat" dimension
-            # We want scale.z to be the minimum of (x, y, z)
-            min_indices = np.argmin(scales, axis=1) # 0=x, 1=y, 2=z
-            
-            # Masks
-            mask_x = (min_indices == 0)
-            mask_y = (min_indices == 1)
-            
-            # --- 1. Adjust Scales ---
-            # If X is min: swap X and Z
-            # scales[mask_x] = (z, y, x)
-            if np.any(mask_x):
-                # Copy original
-                s_x = scales[mask_x].copy()
-                ls_x = log_scales[mask_x].copy()
-                # Swap col 0 and 2
-                scales[mask_x, 0] = s_x[:, 2]
-                scales[mask_x, 2] = s_x[:, 0]
-                log_scales[mask_x, 0] = ls_x[:, 2]
-                log_scales[mask_x, 2] = ls_x[:, 0]
-                
-            # If Y is min: swap Y and Z? 
-            # Strategy: Rotate -90 on X axis maps Y->Z, Z->-Y
-            # So New Z gets Old Y. New Y gets Old Z.
-            # scales[mask_y] = (x, z, y)
-            if np.any(mask_y):
-                s_y = scales[mask_y].copy()
-                ls_y = log_scales[mask_y].copy()
-                # Swap col 1 and 2
-                scales[mask_y, 1] = s_y[:, 2]
-                scales[mask_y, 2] = s_y[:, 1]
-                log_scales[mask_y, 1] = ls_y[:, 2]
-                log_scales[mask_y, 2] = ls_y[:, 1]
-
-            # --- 2. Adjust Rotations ---
-            # We must apply a local rotation P such that R_new = R_old * P
-            # q_new = q_old * q_p
-            
-            # Define fix quaternions (w, x, y, z)
-            # Fix X->Z: Ry(90) -> (cos(45), 0, sin(45), 0) -> (0.7071, 0, 0.7071, 0)
-            q_fix_x = np.array([0.70710678, 0.0, 0.70710678, 0.0], dtype=np.float32)
-            
-            # Fix Y->Z: Rx(-90) -> (cos(-45), sin(-45), 0, 0) -> (0.7071, -0.7071, 0, 0)
-            q_fix_y = np.array([0.70710678, -0.70710678, 0.0, 0.0], dtype=np.float32)
-            
-            # Prepare array of adjustment quaternions
-            q_adj = np.zeros((n_points, 4), dtype=np.float32)
-            q_adj[:, 0] = 1.0 # default identity
-            
-            q_adj[mask_x] = q_fix_x
-            q_adj[mask_y] = q_fix_y
-            
-            # Vectorized Quaternion Multiply
-            # q1 (quats) * q2 (q_adj)
-            w1, x1, y1, z1 = quats[:, 0], quats[:, 1], quats[:, 2], quats[:, 3]
-            w2, x2, y2, z2 = q_adj[:, 0], q_adj[:, 1], q_adj[:, 2], q_adj[:, 3]
-            
-            q_new = np.empty_like(quats)
-            q_new[:, 0] = w1*w2 - x1*x2 - y1*y2 - z1*z2
-            q_new[:, 1] = w1*x2 + x1*w2 + y1*z2 - z1*y2
-            q_new[:, 2] = w1*y2 - x1*z2 + y1*w2 + z1*x2
-            q_new[:, 3] = w1*z2 + x1*y2 - y1*x2 + z1*w2
-            
-            quats = q_new
-
-        # Compute Euler (after potential modification)
-        rot_euler_data = np.zeros((n_points, 3), dtype=np.float32)
-        for i in range(n_points):
-            q = mathutils.Quaternion(quats[i]) 
-            e = q.to_euler()
-            rot_euler_data[i] = (e.x, e.y, e.z)
-
-        # 3. Process Colors (SH -> RGB)
-        if 'f_dc_0' in ply_data.dtype.names:
-            SH_C0 = 0.28209479177387814
-            r = ply_data['f_dc_0'] * SH_C0 + 0.5
-            g = ply_data['f_dc_1'] * SH_C0 + 0.5
-            b = ply_data['f_dc_2'] * SH_C0 + 0.5
-            cols = np.stack((r, g, b), axis=1)
-        elif 'red' in ply_data.dtype.names:
-            cols = np.stack((ply_data['red'], ply_data['green'], ply_data['blue']), axis=1) / 255.0
-        else:
-            cols = np.ones((n_points, 3))
+    def bake_palette(cls, packed_colors):
+        """
+        Palette colours (m, 3) and the palette rank of every splat for packed 24-bit sRGB keys.
+        Lossless when the colours fit the palette, else a GRID_FALLBACK_LEVEL^3 LUT.
+        """
+        import numpy as np
+        import colorsys
 
-        cols = np.clip(cols, 0.0, 1.0)
-
-        # Apply Gamma Correction if source is Linear
-        if source_is_linear:
-            cls.log("Applying Linear -> sRGB conversion...")
-            cols = cls.linear_to_srgb(cols)
-        else:
-            cls.log("Source is sRGB. Skipping gamma correction.")
-
-        # ---------------------------------------------------------
-        # 4. Baking Algorithm (Ported from 3dgs2quad.py)
-        # ---------------------------------------------------------
         cls.log("Analyzing colors for Palette baking...")
         
-        # Convert to Int for deduplication
-        cols_u8 = (cols * 255.0).astype(np.int32)
-        packed_colors = (cols_u8[:, 0] << 16) | (cols_u8[:, 1] << 8) | cols_u8[:, 2]
+        # Keys are already packed integers: deduplicate directly
         unique_packed, inverse_indices = np.unique(packed_colors, return_inverse=True)
         unique_count = len(unique_packed)
         max_pixels = cls.PALETTE_SIZE * cls.PALETTE_SIZE
@@ -495,172 +500,441 @@ class GS_Processor:
             lut_3d_map = original_to_rank.reshape((q_level, q_level, q_level))
             
             # Map Points
-            indices = (cols * (q_level - 0.0001)).astype(np.int32)
+            from .palette import keys_to_rgb
+            indices = (keys_to_rgb(packed_colors) * (q_level - 0.0001)).astype(np.int32)
             final_point_ranks = lut_3d_map[indices[:, 0], indices[:, 1], indices[:, 2]]
 
-        # ---------------------------------------------------------
-        # 5. Create Blender Object
-        # ---------------------------------------------------------
-        cls.log("Creating Mesh...")
-        mesh = bpy.data.meshes.new(name="GS_Mesh")
-        mesh.from_pydata(xyz.tolist(), [], [])
-        mesh.update()
-        
-        # Write Attributes
-        cls._write_attribute(mesh, "scale", 'FLOAT_VECTOR', scales)
-        cls._write_attribute(mesh, "logscale", 'FLOAT_VECTOR', log_scales)
-        cls._write_attribute(mesh, "rot_euler", 'FLOAT_VECTOR', rot_euler_data)
-        
-        cls._write_attribute(mesh, "quatxyz", 'FLOAT_VECTOR', quats[:, :3])
-        cls._write_attribute(mesh, "quatw", 'FLOAT', quats[:, 3])
-        
-        cls._write_attribute(mesh, "opacity", 'FLOAT', opacities)
-        cls._write_attribute(mesh, "log_opacity", 'FLOAT', log_opacities)
-        
-        # Compute and write Palette UV
-        u_coords = ((final_point_ranks % cls.PALETTE_SIZE) + 0.5) / cls.PALETTE_SIZE
-        v_coords = ((final_point_ranks // cls.PALETTE_SIZE) + 0.5) / cls.PALETTE_SIZE
-        uv_data = np.stack((u_coords, v_coords), axis=1)
-        uv_data_3d = np.zeros((n_points, 3), dtype=np.float32)
-        uv_data_3d[:, :2] = uv_data
-        cls._write_attribute(mesh, "palette_uv", 'FLOAT_VECTOR', uv_data_3d)
+        return final_palette_colors, final_point_ranks
 
-        # ---------------------------------------------------------
-        # 6. Create Texture and Material
-        # ---------------------------------------------------------
-        obj_name = bpy.path.display_name_from_filepath(filepath)
-        obj = bpy.data.objects.new(obj_name, mesh)
-        context.collection.objects.link(obj)
-        context.view_layer.objects.active = obj
-        obj.select_set(True)
+    @classmethod
+    def load_splats(cls, context, filepath, transform=None):
+        """
+        Per-splat arrays of one PLY file: clean-up, opacity, scale, Z-minimum
+        reorientation and packed colour keys. `transform` (4x4, merge.py) places
+        one capture of a merged import in the PLY space of the combined object.
+        Returns (dict of arrays or None if no splat is left, removed per reason).
+        """
+        import numpy as np
+        from . import merge
+
+        z_is_minimum = getattr(context.scene, "gs_z_is_minimum", True)
+        y_up_to_z_up = getattr(context.scene, "gs_y_up_to_z_up", True)
+        source_is_linear = getattr(context.scene, "gs_source_is_linear", True)
+        sh_mode = getattr(context.scene, "gs_sh_mode", 'DC')
+        remove_degenerate = getattr(context.scene, "gs_remove_degenerate", True)
+        remove_floaters = getattr(context.scene, "gs_remove_floaters", False)
+        # matrix_world of the capture's splats: camera views are mapped through it
+        placement = merge.placement_matrix(y_up_to_z_up)
+        if transform is not None:
+            placement = placement @ transform
+        start_time = time.time()
+
+        # 1. Load PLY data
+        cls.log(f"Loading: {filepath}")
+        ply_data, n_points = read_ply_data(filepath)
+
+        # 1b. Clean-up (cleanup.py): corrupt, degenerate, duplicate and floating splats
+        removed = {}
+        if remove_degenerate or remove_floaters:
+            from . import cleanup
+            keep, removed = cleanup.clean_splats(
+                ply_data, remove_degenerate, remove_floaters,
+                getattr(context.scene, "gs_floater_radius", 10.0),
+                getattr(context.scene, "gs_floater_neighbors", 3))
+            total = sum(removed.values())
+            summary = ", ".join(f"{count} {reason}" for reason, count in removed.items() if count)
+            cls.log(f"Clean-up: removed {total} of {n_points} splats ({summary or 'none'}): "
+                    f"{time.time()-start_time:.2f}s")
+            if total:
+                ply_data = ply_data[keep]
+                n_points = len(ply_data)
+            if n_points == 0:
+                return None, removed
         
-        # A. Create Texture
-        tex_name = f"{obj.name}_Palette_Lut"
-        if tex_name in bpy.data.images:
-            bpy.data.images.remove(bpy.data.images[tex_name])
-            
-        image = bpy.data.images.new(tex_name, cls.PALETTE_SIZE, cls.PALETTE_SIZE)
+        # 2. Per-splat arrays: position, opacity, scale and rotation in one
+        # fused pass per block of splats, spread over a thread pool (transforms.py)
+        from . import transforms
+        if z_is_minimum:
+            cls.log("Applying Z-Minimum logic (reorienting splats)...")
+        arrays = transforms.splat_arrays(ply_data, z_is_minimum)
+        xyz, quats = arrays["xyz"], arrays["quats"]
+        opacities, log_opacities = arrays["opacities"], arrays["log_opacities"]
+        scales, log_scales = arrays["scales"], arrays["log_scales"]
+        cls.log(f"Splat transforms: {time.time()-start_time:.2f}s")
+
+        # 3. Process Colors (SH -> RGB): one fused pass to packed 24-bit sRGB keys
+        from . import palette
+        if source_is_linear:
+            cls.log("Applying Linear -> sRGB conversion...")
+        else:
+            cls.log("Source is sRGB. Skipping gamma correction.")
+        view = None
+        if sh_mode != 'DC':
+            # Higher SH bands (f_rest_*) for one view or the outside view average
+            from . import sh
+            camera = context.scene.camera
+            if sh.file_degree(ply_data.dtype.names) == 0:
+                cls.log("No f_rest_* coefficients: baking the base colour only")
+            elif sh_mode == 'CAMERA' and camera is not None:
+                origin, forward = sh.camera_view(camera, np.linalg.inv(placement))
+                view = sh.ViewColor(ply_data.dtype.names, 'CAMERA', origin, forward)
+                cls.log(f"SH degree {view.degree}: colour seen from camera '{camera.name}'")
+            else:
+                if sh_mode == 'CAMERA':
+                    cls.log("No scene camera: baking the view-averaged colour instead")
+                view = sh.ViewColor(ply_data.dtype.names, 'HEMISPHERE', np.median(xyz, axis=0))
+                cls.log(f"SH degree {view.degree}: colour averaged over outside views")
+        color_keys = palette.color_keys(ply_data, source_is_linear, view=view)
+        cls.log(f"Colour keys: {time.time()-start_time:.2f}s")
+
+        # Merged captures: into the PLY space of the combined object (merge.py)
+        if transform is not None:
+            xyz, scales, log_scales, quats = merge.transform_splats(xyz, scales, log_scales, quats, transform)
+
+        splats = {
+            "xyz": xyz, "opacities": opacities, "log_opacities": log_opacities, "scales": scales,
+            "log_scales": log_scales, "quats": quats, "color_keys": color_keys,
+        }
+        return splats, removed
+
+    @classmethod
+    def process_and_bake(cls, context, filepath, sources=None):
+        """
+        Import `filepath`, or merge `sources` ((filepath, 4x4 transform or None)
+        pairs) into one object named after `filepath`.
+        """
+        import numpy as np
+        import mathutils
+        from . import palette
+
+        # 0. Get user selections
+        target_mat_name = context.scene.gs_target_material
+        z_is_minimum = getattr(context.scene, "gs_z_is_minimum", True)
+        y_up_to_z_up = getattr(context.scene, "gs_y_up_to_z_up", True)
+        source_is_linear = getattr(context.scene, "gs_source_is_linear", True)
+        chunk_divisions = getattr(context.scene, "gs_chunk_divisions", 1)
+        morton_order = getattr(context.scene, "gs_morton_order", False)
+        attribute_schema = getattr(context.scene, "gs_attribute_schema", 'FULL')
+        brush_mode = getattr(context.scene, "gs_brush_mode", 'SINGLE')
+        color_mode = getattr(context.scene, "gs_color_mode", 'PALETTE')
+        palette_layout = getattr(context.scene, "gs_palette_layout", 'HSV')
+        sh_mode = getattr(context.scene, "gs_sh_mode", 'DC')
+        remove_degenerate = getattr(context.scene, "gs_remove_degenerate", True)
+        remove_floaters = getattr(context.scene, "gs_remove_floaters", False)
         
-        pixels = np.zeros(cls.PALETTE_SIZE * cls.PALETTE_SIZE * 4, dtype=np.float32)
-        pixels[3::4] = 1.0 # Alpha
+        # Valid check for NONE
+        if target_mat_name == "NONE":
+            target_mat_name = None
         
-        count = len(final_palette_colors)
-        flat_colors = np.zeros(count * 4, dtype=np.float32)
-        flat_colors[0::4] = final_palette_colors[:, 0]
-        flat_colors[1::4] = final_palette_colors[:, 1]
-        flat_colors[2::4] = final_palette_colors[:, 2]
-        flat_colors[3::4] = 1.0
+        cls.log(f"Target Material: {target_mat_name}")
+        cls.log(f"Z is Minimum: {z_is_minimum}")
+        cls.log(f"Y-up to Z-up: {y_up_to_z_up}")
+        cls.log(f"Source is Linear: {source_is_linear}")
+        cls.log(f"Morton Order: {morton_order}")
+        cls.log(f"Attribute Schema: {attribute_schema}")
+        cls.log(f"Brush Mode: {brush_mode}")
+        cls.log(f"Color Mode: {color_mode}")
+        cls.log(f"Palette Layout: {palette_layout}")
+        cls.log(f"View Color: {sh_mode}")
+        cls.log(f"Remove Degenerate: {remove_degenerate}, Remove Floaters: {remove_floaters}")
         
-        pixels[:count*4] = flat_colors
-        image.pixels.foreach_set(pixels)
-        image.pack()
+        # Step 1: Link only the library assets this import uses (single library open)
+        gn_tree_name = "GS_Instancer"
+        gn_tree = bpy.data.node_groups.get(gn_tree_name)
+        if gn_tree and gn_tree.library:
+            gn_tree = None  # resolved below through the asset library
+
+        # The target mesh enum lists asset.blend: read it inside the block, where a
+        # stale index was already refreshed by the one library open
+        with AssetManager.linking() as link:
+            target_mesh_name = context.scene.gs_target_mesh
+            if target_mesh_name == "NONE":
+                target_mesh_name = None
+            assets = link(
+                meshes=[target_mesh_name] if target_mesh_name else [],
+                node_groups=[] if gn_tree else [gn_tree_name],
+            )
+        cls.log(f"Target Mesh: {target_mesh_name}")
         
-        # B. Establish Shader Node Tree
-        # Create new material
-        mat_name = f"GSmat_{obj.name}"
-        new_mat = bpy.data.materials.new(name=mat_name)
+        # Step 2: Retrieve the selected assets
+        template_mesh = assets["meshes"].get(target_mesh_name)
+        if not gn_tree:
+            gn_tree = assets["node_groups"].get(gn_tree_name)
         
-        obj.data.materials.append(new_mat)
+        if target_mesh_name and not template_mesh:
+            cls.log(f"ERROR: Mesh '{target_mesh_name}' not found in asset.blend!")
         
-        # Prepare Images
-        img_alpha = None
-        img_normal = None
+        start_time = time.time()
         
-        # 2. Brush Alpha Texture
-        if target_mat_name and target_mat_name != "NONE":
-            alpha_path = os.path.join(AssetManager.get_brush_path("tex_alpha"), target_mat_name)
-            if os.path.exists(alpha_path):
-                # Load Image
-                img_name = target_mat_name
-                if img_name in bpy.data.images:
-                    img_alpha = bpy.data.images[img_name]
-                    if img_alpha.filepath != alpha_path:
-                         try: img_alpha = bpy.data.images.load(alpha_path)
-                         except: pass
-                else:
-                    try: img_alpha = bpy.data.images.load(alpha_path)
-                    except: pass
+        # 1. Load the PLY file(s): merged captures are streamed in one by one
+        if sources is None:
+            sources = [(filepath, None)]
+        cls.last_cleanup = ""
+        removed = {}
+        parts = []
+        for path, transform in sources:
+            part, part_removed = cls.load_splats(context, path, transform)
+            for reason, count in part_removed.items():
+                removed[reason] = removed.get(reason, 0) + count
+            if part is not None:
+                parts.append(part)
+        total = sum(removed.values())
+        if total:
+            summary = ", ".join(f"{count} {reason}" for reason, count in removed.items() if count)
+            cls.last_cleanup = f"Removed {total} splats ({summary})"
+        if not parts:
+            cls.log("ERROR: No splats left after clean-up")
+            return {'CANCELLED'}
+        if len(parts) == 1:
+            splats = parts[0]
+        else:
+            # One array per attribute: the palette below is deduplicated across captures
+            splats = {key: np.concatenate([part[key] for part in parts]) for key in parts[0]}
+            cls.log(f"Merged {len(parts)} captures: {len(splats['xyz'])} splats")
+        del parts
+
+        # Optional: reorder along a Z-curve so every attribute array built
+        # below (and the mesh / exported buffers) is spatially coherent
+        if morton_order:
+            from .spatial import morton_order as compute_morton_order
+            order = compute_morton_order(splats["xyz"])
+            splats = {key: values[order] for key, values in splats.items()}
+            cls.log(f"Morton reordering: {time.time()-start_time:.2f}s")
+
+        xyz, opacities, log_opacities = splats["xyz"], splats["opacities"], splats["log_opacities"]
+        scales, log_scales, quats = splats["scales"], splats["log_scales"], splats["quats"]
+        color_keys = splats["color_keys"]
+        n_points = len(xyz)
+        del splats
+
+        # Compute Euler (after potential modification)
+        # Lean schemas store the quaternion; GS_Decode derives rot_euler on evaluation
+        rot_euler_data = None
+        if attribute_schema == 'FULL':
+            rot_euler_data = np.zeros((n_points, 3), dtype=np.float32)
+            for i in range(n_points):
+                q = mathutils.Quaternion(quats[i]) 
+                e = q.to_euler()
+                rot_euler_data[i] = (e.x, e.y, e.z)
+
+        # ---------------------------------------------------------
+        # 4. Baking Algorithm (Ported from 3dgs2quad.py)
+        # ---------------------------------------------------------
+        if color_mode == 'ATTRIBUTE':
+            # Colours go straight into a byte colour attribute: no palette
+            cls.log("Per-splat colour attribute: skipping palette baking")
+            final_palette_colors, point_slots, palette_slots = None, None, None
+        else:
+            final_palette_colors, final_point_ranks = cls.bake_palette(color_keys)
+            # Texel of every palette colour / splat (row-major from the bottom)
+            palette_slots, point_slots = None, final_point_ranks
+            if palette_layout == 'HILBERT':
+                final_palette_colors, palette_slots, point_slots = palette.hilbert_layout(
+                    final_palette_colors, final_point_ranks, cls.PALETTE_SIZE)
+                bc1_layout, bc1_rows = palette.layout_report(final_palette_colors, palette_slots,
+                                                             cls.PALETTE_SIZE)
+                cls.log(f"Hilbert palette layout: BC1 RMSE {bc1_layout:.2f} (row-major {bc1_rows:.2f}, 8-bit units)")
+
+        # ---------------------------------------------------------
+        # 5. Create Blender Object
+        # ---------------------------------------------------------
+        # Attributes written on every point mesh
+        if attribute_schema == 'FULL':
+            point_attributes = [
+                ("scale", 'FLOAT_VECTOR', scales),
+                ("logscale", 'FLOAT_VECTOR', log_scales),
+                ("rot_euler", 'FLOAT_VECTOR', rot_euler_data),
+                ("quatxyz", 'FLOAT_VECTOR', quats[:, :3]),
+                ("quatw", 'FLOAT', quats[:, 3]),
+                ("opacity", 'FLOAT', opacities),
+                ("log_opacity", 'FLOAT', log_opacities),
+            ]
+        else:
+            # Only what GS_Instancer reads; GS_Decode rebuilds its inputs.
+            # PLY quaternions are not unit length, and Rotation to Euler
+            # expects unit ones (FULL normalizes through mathutils to_euler)
+            from .export import normalize_quats
+            point_attributes = [
+                ("scale", 'FLOAT_VECTOR', scales),
+                ("rotation", 'QUATERNION', normalize_quats(quats)),
+            ]
+            if attribute_schema == 'LEAN':
+                point_attributes.append(("opacity", 'FLOAT', opacities))
+            else:
+                point_attributes.append(
+                    ("opacity_q", 'INT8', np.rint(np.clip(opacities, 0.0, 1.0) * cls.OPACITY_SCALE)))
+
+        if color_mode == 'ATTRIBUTE':
+            # sRGB bytes, read by the shader's Attribute node instead of a palette texture
+            rgba = np.ones((n_points, 4), dtype=np.float32)
+            rgba[:, :3] = palette.keys_to_rgb(color_keys)
+            point_attributes.append((cls.COLOR_ATTRIBUTE, 'BYTE_COLOR', rgba))
+        else:
+            # Compute Palette UV
+            u_coords = ((point_slots % cls.PALETTE_SIZE) + 0.5) / cls.PALETTE_SIZE
+            v_coords = ((point_slots // cls.PALETTE_SIZE) + 0.5) / cls.PALETTE_SIZE
+            uv_data = np.stack((u_coords, v_coords), axis=1)
+            if attribute_schema == 'FULL':
+                uv_data_3d = np.zeros((n_points, 3), dtype=np.float32)
+                uv_data_3d[:, :2] = uv_data
+                point_attributes.append(("palette_uv", 'FLOAT_VECTOR', uv_data_3d))
+            elif attribute_schema == 'LEAN':
+                point_attributes.append(("palette_uv", 'FLOAT2', uv_data))
+            else:
+                point_attributes.append(("palette_index", 'INT', point_slots))
+
+        # LOD rank: any prefix of ranks covers the whole scene, so the
+        # GS_LODFilter modifier can thin the viewport with one threshold
+        from .spatial import lod_ranks
+        importance = opacities * np.prod(scales, axis=1) ** (2.0 / 3.0)
+        point_attributes.append(("lod_rank", 'INT', lod_ranks(xyz, importance)))
+
+        # Brush atlas: every splat picks one of the selected brushes
+        atlas_brushes = []
+        if brush_mode == 'ATLAS':
+            from . import atlas
+            atlas_brushes = atlas.select_brushes(BrushRegistry.alpha_files(),
+                                                 getattr(context.scene, "gs_atlas_filter", ""))
+            if atlas_brushes:
+                brush_assign = getattr(context.scene, "gs_brush_assign", 'SCALE')
+                brush_index = atlas.assign_brushes(brush_assign, len(atlas_brushes), scales,
+                                                   palette.keys_to_rgb(color_keys),
+                                                   getattr(context.scene, "gs_brush_seed", 0))
+                point_attributes.append(("brush_index", 'INT', brush_index))
+                cls.log(f"Brush atlas: {len(atlas_brushes)} brushes, assigned by {brush_assign}")
+            else:
+                cls.log("Brush atlas: no brush matches the filter, using the selected brush")
+
+        bytes_per_splat = sum(cls.ATTRIBUTE_BYTES[type_enum] for _, type_enum, _ in point_attributes)
+        cls.log(f"Point attributes: {bytes_per_splat} bytes/splat "
+                f"({bytes_per_splat * n_points / (1024 * 1024):.1f} MB)")
+
+        obj_name = bpy.path.display_name_from_filepath(filepath)
+        if len(sources) > 1:
+            obj_name = f"{obj_name}_Merged"
+        chunks = cls._spatial_chunks(xyz, chunk_divisions)
+        chunk_coll = None
+
+        if chunks is None:
+            cls.log("Creating Mesh...")
+            mesh = cls._create_point_mesh("GS_Mesh", xyz, point_attributes)
+            obj = bpy.data.objects.new(obj_name, mesh)
+            context.collection.objects.link(obj)
+            objects = [obj]
+            block_name = obj.name
+        else:
+            # One object per grid cell, grouped in a collection so regions can
+            # be hidden/excluded; they share material, palette and node group
+            cls.log(f"Creating {len(chunks)} chunk meshes ({chunk_divisions}^3 grid)...")
+            chunk_coll = bpy.data.collections.new(obj_name)
+            context.collection.children.link(chunk_coll)
+            objects = []
+            for i, idx in enumerate(chunks):
+                chunk_attributes = [(name, type_enum, data[idx]) for name, type_enum, data in point_attributes]
+                mesh = cls._create_point_mesh(f"GS_Mesh_{i:03d}", xyz[idx], chunk_attributes)
+                chunk_obj = bpy.data.objects.new(f"{obj_name}_{i:03d}", mesh)
+                chunk_coll.objects.link(chunk_obj)
+                objects.append(chunk_obj)
+            block_name = chunk_coll.name
+
+        # ---------------------------------------------------------
+        # 6. Create Texture and Material
+        # ---------------------------------------------------------
+        obj = objects[0]
+        context.view_layer.objects.active = obj
+        for o in objects:
+            o.select_set(True)
         
-        # 3. Normal Map
-        # 3. Normal Map
+        # A. Create Texture (identical palettes share one image)
+        if color_mode == 'ATTRIBUTE':
+            # No texture; every colour-attribute import with the same brush shares one material
+            image = None
+            palette_hash = cls.COLOR_ATTRIBUTE
+        else:
+            # 8-bit PNG, packed or loaded from the palette cache folder (palette.py)
+            rgba8 = palette.palette_rgba8(final_palette_colors, cls.PALETTE_SIZE, palette_slots)
+            palette_hash = palette.palette_hash(rgba8)
+            image, source = palette.palette_image(f"{block_name}_Palette_Lut", rgba8, palette_hash,
+                                                  getattr(context.scene, "gs_palette_cache_dir", ""))
+            cls.log(f"Palette image {image.name} ({source})")
+
+        # B. Material: one cached shader template per brush configuration,
+        # copied per palette (brush images are only resolved to build it)
+        shader_options = {}
+        found_normal_path = None
         if target_mat_name and target_mat_name != "NONE":
-            # Search logic
-            normal_dir = AssetManager.get_brush_path("tex_normal")
-            base_name = os.path.splitext(target_mat_name)[0] # e.g. "brush01"
+            found_normal_path = BrushRegistry.get_normal_path(target_mat_name)
+        alpha_key, normal_key = target_mat_name, found_normal_path
+
+        def load_brush_images():
+            img_alpha = None
+            img_normal = None
             
-            found_normal_path = None
-            if os.path.exists(normal_dir):
-                # User request: "same name (excluding format name)"
-                valid_exts = ('.png', '.jpg', '.jpeg', '.tif', '.tiff')
-                for f in os.listdir(normal_dir):
-                    if f.startswith('.') or f.startswith('_'): continue
-                    
-                    f_name, f_ext = os.path.splitext(f)
-                    if f_name == base_name and f.lower().endswith(valid_exts): 
-                        found_normal_path = os.path.join(normal_dir, f)
-                        break
+            # 2. Brush Alpha Texture
+            if target_mat_name and target_mat_name != "NONE":
+                alpha_path = BrushRegistry.get_alpha_path(target_mat_name)
+                if alpha_path:
+                    try: img_alpha = BrushRegistry.get_image(alpha_path)
+                    except Exception as e: cls.log(f"Failed to load brush alpha: {e}")
             
-            if found_normal_path:
-                # Correctly handle loading to avoid mixing up with Alpha texture of same name
-                # We cannot just look up by name because alpha and normal might both be "brush01.png"
-                img_normal = None
+            # 3. Normal Map (same name as the alpha, excluding format name)
+            if target_mat_name and target_mat_name != "NONE":
+                base_name = os.path.splitext(target_mat_name)[0] # e.g. "brush01"
                 
-                # 1. Try to find existing loaded image with exact path match
-                norm_abspath = os.path.abspath(found_normal_path)
-                for img in bpy.data.images:
-                    if img.filepath:
-                        if os.path.abspath(img.filepath) == norm_abspath:
-                            img_normal = img
-                            break
-                
-                # 2. If not found, load it
-                if not img_normal:
+                if found_normal_path:
+                    # Looked up by path: alpha and normal might both be "brush01.png"
                     try: 
-                        img_normal = bpy.data.images.load(found_normal_path)
+                        img_normal = BrushRegistry.get_image(found_normal_path)
                     except Exception as e: 
                         cls.log(f"Failed to load normal map: {e}")
-                
-                if img_normal:
-                    cls.log(f"Loaded Normal Map: {img_normal.name} (Source: tex_normal)")
-            else:
-                cls.log(f"No Normal Map found for {base_name} in tex_normal")
-
-        # Call shader creation (from shader.py)
+                    
+                    if img_normal:
+                        cls.log(f"Loaded Normal Map: {img_normal.name} (Source: tex_normal)")
+                else:
+                    cls.log(f"No Normal Map found for {base_name} in tex_normal")
+            return img_alpha, img_normal
+
+        if atlas_brushes:
+            from . import atlas
+            alpha_paths = [BrushRegistry.get_alpha_path(name) for name in atlas_brushes]
+            normal_paths = [BrushRegistry.get_normal_path(name) for name in atlas_brushes]
+            grid = atlas.grid_size(len(alpha_paths))
+            alpha_key, normal_key = f"atlas:{atlas.atlas_key(alpha_paths, normal_paths)}", None
+            shader_options = {"atlas_grid": grid, "atlas_cell": atlas.ATLAS_CELL}
+
+            def load_brush_images():
+                img_alpha, img_normal, _ = atlas.build_atlas(alpha_paths, normal_paths)
+                cls.log(f"Brush atlas image: {img_alpha.name} ({grid}x{grid} cells)")
+                return img_alpha, img_normal
+
+        if color_mode == 'ATTRIBUTE':
+            shader_options["color_attribute"] = cls.COLOR_ATTRIBUTE
+        shader_key = template_key(alpha_key, normal_key, **shader_options)
+
+        # Template creation goes through create_shader (shader.py)
         try:
-            create_shader(new_mat, palette_img=image, alpha_img=img_alpha, normal_img=img_normal)
+            new_mat, source = material_for_palette(f"GSmat_{block_name}", shader_key, image,
+                                                   palette_hash, load_brush_images, **shader_options)
+            cls.log(f"Material {new_mat.name} ({source})")
         except Exception as e:
             cls.log(f"Error creating shader nodes: {e}")
             import traceback
             traceback.print_exc()
+            new_mat = bpy.data.materials.new(name=f"GSmat_{block_name}")
+        
+        for o in objects:
+            o.data.materials.append(new_mat)
 
         # ---------------------------------------------------------
         # 7. Geometry Nodes Setup
         # ---------------------------------------------------------
 
-        # 1. Ensure GS_Instancer node tree is loaded
-        gn_tree_name = "GS_Instancer"
-        gn_tree = None
-
-        # Check if exists
-        if gn_tree_name in bpy.data.node_groups:
-            gn_tree = bpy.data.node_groups[gn_tree_name]
-        
-        # Load from asset.blend if missing
-        if not gn_tree:
-             asset_path = AssetManager.get_asset_path()
-             with bpy.data.libraries.load(asset_path, link=False) as (data_from, data_to):
-                 if gn_tree_name in data_from.node_groups:
-                     data_to.node_groups = [gn_tree_name]
-             
-             if data_to.node_groups:
-                 gn_tree = data_to.node_groups[0]
-        
+        # 1. GS_Instancer node tree (a local copy wins, else linked in Step 1)
         if not gn_tree:
             cls.log(f"ERROR: Could not load Geometry Node '{gn_tree_name}' from asset.blend")
             return {'CANCELLED'}
 
-        # 2. Load template mesh from Object Assets (if selected)
-        # Note: Assets are already imported by AssetManager.import_all_assets()
+        # 2. Template mesh was linked from asset.blend in Step 1 (if selected)
         
         instance_obj = None
         if template_mesh:
@@ -670,47 +944,334 @@ class GS_Processor:
              instance_obj.hide_viewport = True
              instance_obj.hide_render = True
 
-        # 3. Add modifier and apply node tree
-        mod = obj.modifiers.new("GS_Instancer", 'NODES')
-        mod.node_group = gn_tree 
+        # 3. Find socket identifiers once
+        instance_socket = None
+        material_socket = None
+        for item in gn_tree.interface.items_tree:
+            if item.name == "instance" and item.bl_socket_idname == 'NodeSocketObject':
+                instance_socket = item.identifier
+            elif item.name == "Material" and item.bl_socket_idname == 'NodeSocketMaterial':
+                material_socket = item.identifier
+
+        if not instance_obj:
+            cls.log("WARNING: No Instance Object to assign to GN!")
+        elif not instance_socket:
+            cls.log("WARNING: Could not find 'instance' socket in GS_Instancer node tree.")
+
+        lod_filter = cls.ensure_lod_filter_group()
+        decoder = cls.ensure_decode_group(attribute_schema)
+
+        for o in objects:
+            # 4. Viewport-only density filter ahead of the instancer
+            cls.add_lod_filter(o, lod_filter, n_points)
+            if decoder:
+                decode_mod = o.modifiers.new(decoder.name, 'NODES')
+                decode_mod.node_group = decoder
+
+            # 5. Add modifier and apply node tree
+            mod = o.modifiers.new("GS_Instancer", 'NODES')
+            mod.node_group = gn_tree 
+            
+            # 6. Set Input Parameters
+            if instance_obj:
+                try:
+                    if instance_socket:
+                        mod[instance_socket] = instance_obj
+                    if material_socket and new_mat:
+                        mod[material_socket] = new_mat
+                except Exception as e:
+                    cls.log(f"Error setting GN inputs: {e}")
+
+            # Rotate object to correct coordinate system (-90 on X)
+            if y_up_to_z_up:
+                o.rotation_euler = (np.radians(-90), 0, 0)
+            else:
+                o.rotation_euler = (0, 0, 0)
         
-        # 4. Set Input Parameters
-        if instance_obj:
-            try:
-                # Find inputs by name or identifier for robustness
-                found_socket = False
-                for item in gn_tree.interface.items_tree:
-                    if item.name == "instance" and item.bl_socket_idname == 'NodeSocketObject':
-                         mod[item.identifier] = instance_obj
-                         found_socket = True
-                    elif item.name == "Material" and item.bl_socket_idname == 'NodeSocketMaterial':
-                         if new_mat:
-                            mod[item.identifier] = new_mat
-                
-                if not found_socket:
-                    cls.log("WARNING: Could not find 'instance' socket in GS_Instancer node tree.")
-                    
-            except Exception as e:
-                cls.log(f"Error setting GN inputs: {e}")
-        else:
-             cls.log("WARNING: No Instance Object to assign to GN!")
+        # Tag everything this import created, so a later clean re-import of
+        # the same file can find what it left behind
+        cls._tag_source(filepath, *objects, *(o.data for o in objects), chunk_coll,
+                        image, new_mat, instance_obj)
+        if len(sources) > 1:
+            from .merge import MERGED_SOURCES_KEY
+            for o in objects:
+                o[MERGED_SOURCES_KEY] = "|".join(cls.source_path(path) for path, _ in sources)
 
-        # Rotate object to correct coordinate system (-90 on X)
-        if y_up_to_z_up:
-            obj.rotation_euler = (np.radians(-90), 0, 0)
-        else:
-            obj.rotation_euler = (0, 0, 0)
-        
         cls.log(f"Done. {time.time()-start_time:.2f}s")
         return {'FINISHED'}
 
+    LOD_FILTER_NAME = "GS_LODFilter"
+    last_cleanup = ""       # summary of the splats the last import removed, reported by the operators
+    SOURCE_KEY = "gs_source"
+    OPACITY_SCALE = 127.0   # COMPACT: opacity_q (INT8) = round(opacity * 127)
+    COLOR_ATTRIBUTE = "color"   # BYTE_COLOR attribute of the texture-free colour mode
+
+    # Stored bytes per point for each attribute type (memory / .blend size)
+    ATTRIBUTE_BYTES = {
+        'FLOAT': 4, 'INT': 4, 'INT8': 1, 'BOOLEAN': 1, 'FLOAT2': 8, 'FLOAT_VECTOR': 12, 'QUATERNION': 16,
+        'BYTE_COLOR': 4,
+    }
+
+    @staticmethod
+    def source_path(filepath):
+        return os.path.normcase(os.path.abspath(bpy.path.abspath(filepath)))
+
+    @classmethod
+    def _tag_source(cls, filepath, *blocks):
+        source = cls.source_path(filepath)
+        for block in blocks:
+            if block is not None:
+                block[cls.SOURCE_KEY] = source
+
+    @classmethod
+    def datablock_bytes(cls, block):
+        """Rough in-memory size of a mesh (point attributes) or image (pixels + packed file)."""
+        if isinstance(block, bpy.types.Mesh):
+            per_point = sum(cls.ATTRIBUTE_BYTES.get(attr.data_type, 4) for attr in block.attributes)
+            if "position" not in block.attributes:
+                per_point += 12
+            return len(block.vertices) * per_point
+        if isinstance(block, bpy.types.Image):
+            width, height = block.size
+            size = width * height * block.channels * (4 if block.is_float else 1)
+            if block.packed_file:
+                size += block.packed_file.size
+            return size
+        return 0
+
+    @classmethod
+    def purge_previous_import(cls, filepath):
+        """
+        Remove data left orphaned by earlier imports of `filepath`: hidden brush
+        instance objects no modifier uses any more, empty chunk collections, and
+        meshes, materials and palette images without users.
+        Returns (datablocks removed, bytes reclaimed).
+        """
+        source = cls.source_path(filepath)
+
+        def previous(collection):
+            return [b for b in collection if b.library is None and b.get(cls.SOURCE_KEY) == source]
+
+        # Instance objects are still linked in the scene, but unused once the
+        # object that referenced them through GS_Instancer is gone
+        referenced = set()
+        for obj in bpy.data.objects:
+            for mod in obj.modifiers:
+                if mod.type == 'NODES':
+                    referenced.update(v.name for v in mod.values() if isinstance(v, bpy.types.Object))
+
+        removed = 0
+        reclaimed = 0
+        for obj in previous(bpy.data.objects):
+            if obj.modifiers.get("GS_Instancer") is None and obj.name not in referenced:
+                bpy.data.objects.remove(obj, do_unlink=True)
+                removed += 1
+        for coll in previous(bpy.data.collections):
+            if len(coll.objects) == 0 and len(coll.children) == 0:
+                bpy.data.collections.remove(coll)
+                removed += 1
+
+        # Meshes release materials, materials release images
+        for collection in (bpy.data.meshes, bpy.data.materials, bpy.data.images):
+            for block in previous(collection):
+                if block.users == 0:
+                    reclaimed += cls.datablock_bytes(block)
+                    collection.remove(block)
+                    removed += 1
+        return removed, reclaimed
+
+    @classmethod
+    def ensure_decode_group(cls, schema):
+        """
+        LEAN / COMPACT: node group rebuilding the attributes GS_Instancer reads
+        (rot_euler, and for COMPACT opacity and palette_uv) from the stored
+        compact ones. Evaluated data only, nothing extra is saved.
+        Returns None for the FULL schema.
+        """
+        if schema == 'FULL':
+            return None
+        name = f"GS_Decode_{schema.title()}"
+        group = bpy.data.node_groups.get(name)
+        if group and not group.library:
+            return group
+
+        group = bpy.data.node_groups.new(name, 'GeometryNodeTree')
+        group.interface.new_socket("Geometry", in_out='INPUT', socket_type='NodeSocketGeometry')
+        group.interface.new_socket("Geometry", in_out='OUTPUT', socket_type='NodeSocketGeometry')
+
+        nodes = group.nodes
+        links = group.links
+        group_in = nodes.new('NodeGroupInput')
+        group_in.location = (-800, 0)
+        group_out = nodes.new('NodeGroupOutput')
+        group_out.location = (800, 0)
+
+        def named(attr_name, data_type, y):
+            node = nodes.new('GeometryNodeInputNamedAttribute')
+            node.data_type = data_type
+            node.inputs["Name"].default_value = attr_name
+            node.location = (-800, y)
+            return node.outputs["Attribute"]
+
+        def math_node(operation, a, b, y, x):
+            node = nodes.new('ShaderNodeMath')
+            node.operation = operation
+            node.location = (x, y)
+            for i, value in enumerate((a, b)):
+                if isinstance(value, (int, float)):
+                    node.inputs[i].default_value = value
+                elif value is not None:
+                    links.new(value, node.inputs[i])
+            return node.outputs[0]
+
+        stores = []
+
+        def store(attr_name, data_type, value):
+            node = nodes.new('GeometryNodeStoreNamedAttribute')
+            node.data_type = data_type
+            node.domain = 'POINT'
+            node.inputs["Name"].default_value = attr_name
+            node.location = (200 * len(stores) - 200, 200)
+            links.new(value, node.inputs["Value"])
+            stores.append(node)
+
+        # rot_euler <- rotation (QUATERNION)
+        to_euler = nodes.new('FunctionNodeRotationToEuler')
+        to_euler.location = (-500, 200)
+        links.new(named("rotation", 'QUATERNION', 200), to_euler.inputs["Rotation"])
+        store("rot_euler", 'FLOAT_VECTOR', to_euler.outputs["Euler"])
+
+        if schema == 'COMPACT':
+            # opacity <- opacity_q / 127
+            opacity = math_node('DIVIDE', named("opacity_q", 'INT', 0), cls.OPACITY_SCALE, 0, -500)
+            store("opacity", 'FLOAT', opacity)
+
+            # palette_uv <- ((i % N) + 0.5) / N, (floor(i / N) + 0.5) / N
+            size = float(cls.PALETTE_SIZE)
+            index = named("palette_index", 'INT', -300)
+            u = math_node('DIVIDE', math_node('ADD', math_node('MODULO', index, size, -300, -600), 0.5, -300, -450), size, -300, -300)
+            row = math_node('FLOOR', math_node('DIVIDE', index, size, -500, -600), None, -500, -450)
+            v = math_node('DIVIDE', math_node('ADD', row, 0.5, -500, -300), size, -500, -150)
+            combine = nodes.new('ShaderNodeCombineXYZ')
+            combine.location = (-150, -400)
+            links.new(u, combine.inputs[0])
+            links.new(v, combine.inputs[1])
+            store("palette_uv", 'FLOAT_VECTOR', combine.outputs[0])
+
+        geometry = group_in.outputs["Geometry"]
+        for node in stores:
+            links.new(geometry, node.inputs["Geometry"])
+            geometry = node.outputs["Geometry"]
+        links.new(geometry, group_out.inputs["Geometry"])
+        return group
+
+    @classmethod
+    def ensure_lod_filter_group(cls):
+        """
+        Local node group that deletes points whose `lod_rank` is at or above
+        Density * Splat Count. Built once per file, shared by all imports.
+        """
+        group = bpy.data.node_groups.get(cls.LOD_FILTER_NAME)
+        if group and not group.library:
+            return group
+
+        group = bpy.data.node_groups.new(cls.LOD_FILTER_NAME, 'GeometryNodeTree')
+        group.interface.new_socket("Geometry", in_out='INPUT', socket_type='NodeSocketGeometry')
+        density = group.interface.new_socket("Density", in_out='INPUT', socket_type='NodeSocketFloat')
+        density.default_value = 1.0
+        density.min_value = 0.0
+        density.max_value = 1.0
+        group.interface.new_socket("Splat Count", in_out='INPUT', socket_type='NodeSocketInt')
+        group.interface.new_socket("Geometry", in_out='OUTPUT', socket_type='NodeSocketGeometry')
+
+        nodes = group.nodes
+        links = group.links
+        group_in = nodes.new('NodeGroupInput')
+        group_in.location = (-600, 0)
+        group_out = nodes.new('NodeGroupOutput')
+        group_out.location = (400, 0)
+
+        rank = nodes.new('GeometryNodeInputNamedAttribute')
+        rank.data_type = 'INT'
+        rank.inputs["Name"].default_value = "lod_rank"
+        rank.location = (-400, -200)
+
+        threshold = nodes.new('ShaderNodeMath')
+        threshold.operation = 'MULTIPLY'
+        threshold.location = (-400, -400)
+
+        compare = nodes.new('FunctionNodeCompare')
+        compare.data_type = 'FLOAT'
+        compare.operation = 'GREATER_EQUAL'
+        compare.location = (-200, -200)
+
+        delete = nodes.new('GeometryNodeDeleteGeometry')
+        delete.domain = 'POINT'
+        delete.location = (100, 0)
+
+        links.new(group_in.outputs["Density"], threshold.inputs[0])
+        links.new(group_in.outputs["Splat Count"], threshold.inputs[1])
+        links.new(rank.outputs["Attribute"], compare.inputs[0])
+        links.new(threshold.outputs[0], compare.inputs[1])
+        links.new(group_in.outputs["Geometry"], delete.inputs["Geometry"])
+        links.new(compare.outputs["Result"], delete.inputs["Selection"])
+        links.new(delete.outputs["Geometry"], group_out.inputs["Geometry"])
+        return group
+
+    @classmethod
+    def add_lod_filter(cls, obj, group, splat_count):
+        """Viewport-only: renders always use every splat."""
+        mod = obj.modifiers.new(cls.LOD_FILTER_NAME, 'NODES')
+        mod.node_group = group
+        mod.show_render = False
+        for item in group.interface.items_tree:
+            if item.name == "Splat Count":
+                mod[item.identifier] = splat_count
+            elif item.name == "Density":
+                mod[item.identifier] = 1.0
+        return mod
+
+    @staticmethod
+    def _spatial_chunks(xyz, divisions):
+        """
+        Split point indices into a divisions^3 grid over the bounding box.
+        Returns a list of index arrays (empty cells dropped), or None when off.
+        """
+        import numpy as np
+
+        if divisions <= 1:
+            return None
+        bmin = xyz.min(axis=0)
+        extent = np.maximum(xyz.max(axis=0) - bmin, 1e-9)
+        cells = np.clip(((xyz - bmin) / extent * divisions).astype(np.int64), 0, divisions - 1)
+        keys = (cells[:, 2] * divisions + cells[:, 1]) * divisions + cells[:, 0]
+        order = np.argsort(keys, kind='stable')
+        counts = np.bincount(keys, minlength=divisions ** 3)
+        return [idx for idx in np.split(order, np.cumsum(counts)[:-1]) if len(idx)]
+
+    @classmethod
+    def _create_point_mesh(cls, name, xyz, point_attributes):
+        mesh = bpy.data.meshes.new(name=name)
+        mesh.from_pydata(xyz.tolist(), [], [])
+        mesh.update()
+        
+        # Write Attributes
+        for attr_name, type_enum, data in point_attributes:
+            cls._write_attribute(mesh, attr_name, type_enum, data)
+        return mesh
+
     @staticmethod
     def _write_attribute(mesh, name, type_enum, data):
         attr = mesh.attributes.new(name=name, type=type_enum, domain='POINT')
-        if type_enum == 'FLOAT_VECTOR':
+        if type_enum in ('FLOAT_VECTOR', 'FLOAT2'):
             attr.data.foreach_set('vector', data.flatten())
-        elif type_enum == 'FLOAT':
+        elif type_enum in ('FLOAT', 'QUATERNION'):
             attr.data.foreach_set('value', data.flatten())
+        elif type_enum in ('INT', 'INT8'):
+            attr.data.foreach_set('value', data.astype('i4').flatten())
+        elif type_enum == 'BYTE_COLOR':
+            # sRGB input: stored bytes as-is, no linear -> sRGB conversion
+            attr.data.foreach_set('color_srgb', data.astype('f4').flatten())
 
 # ==============================================================================
 #  OPERATOR & UI
@@ -728,13 +1289,355 @@ class GS_OT_Import(bpy.types.Operator):
     def execute(self, context):
         if not self.filepath:
             return {'CANCELLED'}
-        return GS_Processor.process_and_bake(context, self.filepath)
+        result = GS_Processor.process_and_bake(context, self.filepath)
+        if GS_Processor.last_cleanup:
+            self.report({'INFO'}, GS_Processor.last_cleanup)
+        return result
+
+    def invoke(self, context, event):
+        context.window_manager.fileselect_add(self)
+        return {'RUNNING_MODAL'}
+
+
+class GS_OT_ImportClean(GS_OT_Import):
+    """Import 3DGS PLY without an undo step, removing orphan data from earlier imports of the same file"""
+    bl_idname = "gs_tools.import_ply_clean"
+    bl_label = "Import 3DGS & Bake (No Undo)"
+    # No 'UNDO': multi-million point meshes would otherwise be kept a second
+    # time in the undo snapshot, doubling peak memory
+    bl_options = {'REGISTER'}
+
+    def execute(self, context):
+        if not self.filepath:
+            return {'CANCELLED'}
+        removed, reclaimed = GS_Processor.purge_previous_import(self.filepath)
+        result = GS_Processor.process_and_bake(context, self.filepath)
+        if GS_Processor.last_cleanup:
+            self.report({'INFO'}, GS_Processor.last_cleanup)
+        if removed:
+            self.report({'INFO'}, f"Removed {removed} orphan datablocks from earlier imports "
+                                  f"(~{reclaimed / (1024 * 1024):.1f} MB reclaimed)")
+        return result
+
+
+class GS_OT_ImportMerge(bpy.types.Operator):
+    """Import several 3DGS PLY captures into one object with a shared palette"""
+    bl_idname = "gs_tools.import_merge"
+    bl_label = "Merge 3DGS Captures"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    files: bpy.props.CollectionProperty(type=bpy.types.OperatorFileListElement, options={'HIDDEN', 'SKIP_SAVE'})
+    directory: bpy.props.StringProperty(subtype='DIR_PATH', options={'HIDDEN'})
+    filter_glob: bpy.props.StringProperty(default="*.ply", options={'HIDDEN'})
+
+    def execute(self, context):
+        from . import merge
+        paths = [os.path.join(self.directory, f.name) for f in self.files if f.name.lower().endswith(".ply")]
+        if not paths:
+            self.report({'WARNING'}, "No .ply files selected")
+            return {'CANCELLED'}
+
+        # Captures imported (and moved) before keep their placement
+        y_up_to_z_up = getattr(context.scene, "gs_y_up_to_z_up", True)
+        sources = [(path, merge.capture_transform(GS_Processor.source_path(path), GS_Processor.SOURCE_KEY,
+                                                  y_up_to_z_up)) for path in paths]
+        result = GS_Processor.process_and_bake(context, paths[0], sources)
+        if 'FINISHED' in result:
+            placed = sum(1 for _, transform in sources if transform is not None)
+            self.report({'INFO'}, f"Merged {len(paths)} captures ({placed} placed from earlier imports)")
+        if GS_Processor.last_cleanup:
+            self.report({'INFO'}, GS_Processor.last_cleanup)
+        return result
+
+    def invoke(self, context, event):
+        context.window_manager.fileselect_add(self)
+        return {'RUNNING_MODAL'}
+
+
+class GS_OT_Analyze(bpy.types.Operator):
+    """Estimate splat count, colors, memory and import/export time of a 3DGS PLY from a sample of its records"""
+    bl_idname = "gs_tools.analyze_ply"
+    bl_label = "Analyze 3DGS PLY"
+    bl_options = {'REGISTER'}
+
+    filepath: bpy.props.StringProperty(subtype="FILE_PATH")
+    filter_glob: bpy.props.StringProperty(default="*.ply", options={'HIDDEN'})
+
+    last_report = ()    # (file name, summary lines) of the last analysis, shown in the panel
+
+    def execute(self, context):
+        if not self.filepath:
+            return {'CANCELLED'}
+        from . import analysis
+        scene = context.scene
+        settings = {
+            'schema': getattr(scene, "gs_attribute_schema", 'FULL'),
+            'color_mode': getattr(scene, "gs_color_mode", 'PALETTE'),
+            'source_is_linear': getattr(scene, "gs_source_is_linear", True),
+            'sh_mode': getattr(scene, "gs_sh_mode", 'DC'),
+            'remove_degenerate': getattr(scene, "gs_remove_degenerate", True),
+            'remove_floaters': getattr(scene, "gs_remove_floaters", False),
+        }
+        start_time = time.perf_counter()
+        try:
+            sample, n_points = sample_ply_data(self.filepath, analysis.SAMPLE_SIZE)
+        except (OSError, ValueError) as exc:
+            self.report({'ERROR'}, f"Cannot read {self.filepath}: {exc}")
+            return {'CANCELLED'}
+        result = analysis.analyze_sample(sample, n_points, os.path.getsize(self.filepath), settings,
+                                         GS_Processor.ATTRIBUTE_BYTES,
+                                         GS_Processor.PALETTE_SIZE * GS_Processor.PALETTE_SIZE)
+        lines = analysis.report_lines(result, time.perf_counter() - start_time)
+        GS_OT_Analyze.last_report = (os.path.basename(self.filepath), tuple(lines))
+        for line in lines:
+            GS_Processor.log(f"Analysis: {line}")
+            self.report({'INFO'}, line)
+        return {'FINISHED'}
+
+    def invoke(self, context, event):
+        context.window_manager.fileselect_add(self)
+        return {'RUNNING_MODAL'}
+
+
+def _selected_splat_objects(context):
+    """The active splat object and every other selected one (e.g. all spatial chunks)."""
+    active = context.active_object
+    return [active] + [o for o in context.selected_objects
+                       if o != active and o.type == 'MESH' and o.modifiers.get("GS_Instancer")]
+
+
+def _report_unselected_chunks(operator, context, targets):
+    """Warn when `targets` leave out chunks of the multi-chunk import the active object belongs to."""
+    obj = context.active_object
+    source = obj.get(GS_Processor.SOURCE_KEY)
+    if source is None:
+        return
+    names = {o.name for o in targets}
+    for coll in obj.users_collection:
+        if coll.get(GS_Processor.SOURCE_KEY) != source:
+            continue
+        chunks = [o.name for o in coll.objects if o.modifiers.get("GS_Instancer")]
+        missing = len([name for name in chunks if name not in names])
+        if missing:
+            operator.report({'WARNING'}, f"{missing} of {len(chunks)} chunks of '{coll.name}' "
+                                         f"were not selected and are not in the export")
+
+
+class GS_OT_ExportDirect(bpy.types.Operator):
+    """Export the painted mesh of the selected splat objects, built directly from their attributes (no Geometry Nodes realization)"""
+    bl_idname = "gs_tools.export_direct"
+    bl_label = "Export Painted Mesh"
+
+    filepath: bpy.props.StringProperty(subtype="FILE_PATH")
+    filter_glob: bpy.props.StringProperty(default="*.glb;*.obj", options={'HIDDEN'})
+    chunk_size: bpy.props.IntProperty(
+        name="Chunk Size",
+        description="Splats realized per streaming chunk (bounds peak memory)",
+        default=65536, min=1024
+    )
+    apply_transform: bpy.props.BoolProperty(
+        name="Apply Transform",
+        description="Bake the object transform into the exported vertices",
+        default=True
+    )
+    gpu_instancing: bpy.props.BoolProperty(
+        name="GPU Instancing (GLB)",
+        description="Write the brush mesh once plus per-splat transforms (EXT_mesh_gpu_instancing) "
+                    "instead of realized geometry. Much smaller files; palette UV is a custom "
+                    "instance attribute (_PALETTE_UV) read by the engine shader",
+        default=False
+    )
+    compact_instances: bpy.props.BoolProperty(
+        name="Quantize Instances",
+        description="Store instance rotation and palette UV as normalized 16-bit integers",
+        default=True
+    )
+
+    @classmethod
+    def poll(cls, context):
+        obj = context.active_object
+        return obj is not None and obj.modifiers.get("GS_Instancer") is not None
+
+    def execute(self, context):
+        from . import export
+        start_time = time.time()
+        targets = _selected_splat_objects(context)
+        try:
+            stats = export.export_painted_mesh(
+                targets, self.filepath,
+                chunk_size=self.chunk_size, apply_transform=self.apply_transform,
+                instanced=self.gpu_instancing, compact=self.compact_instances)
+        except Exception as e:
+            self.report({'ERROR'}, f"Export failed: {e}")
+            return {'CANCELLED'}
+        self.report({'INFO'}, f"Exported {stats['instances']} strokes "
+                              f"({stats['triangles']} tris) in {time.time() - start_time:.2f}s")
+        _report_unselected_chunks(self, context, targets)
+        return {'FINISHED'}
+
+    def invoke(self, context, event):
+        if not self.filepath:
+            self.filepath = bpy.path.ensure_ext(context.active_object.name, ".glb")
+        context.window_manager.fileselect_add(self)
+        return {'RUNNING_MODAL'}
+
+
+class GS_OT_ExportTiles(bpy.types.Operator):
+    """Export the selected splat objects as one 3D Tiles LOD hierarchy (octree of instanced GLB tiles)"""
+    bl_idname = "gs_tools.export_tiles"
+    bl_label = "Export LOD Tiles"
+
+    directory: bpy.props.StringProperty(subtype="DIR_PATH")
+    max_points: bpy.props.IntProperty(
+        name="Splats per Tile",
+        description="Tiles with more splats are split into 8 children",
+        default=65536, min=1024
+    )
+    resolution: bpy.props.IntProperty(
+        name="Parent Grid",
+        description="Clustering grid per axis for the merged strokes of parent tiles",
+        default=32, min=4, max=128
+    )
+
+    @classmethod
+    def poll(cls, context):
+        obj = context.active_object
+        return obj is not None and obj.modifiers.get("GS_Instancer") is not None
+
+    def execute(self, context):
+        from . import lod
+        start_time = time.time()
+        targets = _selected_splat_objects(context)
+        try:
+            stats = lod.export_tileset(targets, self.directory,
+                                       max_points=self.max_points, resolution=self.resolution)
+        except Exception as e:
+            self.report({'ERROR'}, f"Export failed: {e}")
+            return {'CANCELLED'}
+        self.report({'INFO'}, f"Wrote {stats['tiles']} tiles ({stats['strokes']} strokes for "
+                              f"{stats['splats']} splats) in {time.time() - start_time:.2f}s")
+        _report_unselected_chunks(self, context, targets)
+        return {'FINISHED'}
+
+    def invoke(self, context, event):
+        context.window_manager.fileselect_add(self)
+        return {'RUNNING_MODAL'}
+
+
+class GS_OT_ExportPalette(bpy.types.Operator):
+    """Export the palette texture as PNG or BC1-compressed DDS"""
+    bl_idname = "gs_tools.export_palette"
+    bl_label = "Export Palette"
+
+    filepath: bpy.props.StringProperty(subtype="FILE_PATH")
+    filter_glob: bpy.props.StringProperty(default="*.png;*.dds", options={'HIDDEN'})
+
+    @classmethod
+    def poll(cls, context):
+        obj = context.active_object
+        return obj is not None and obj.modifiers.get("GS_Instancer") is not None
+
+    def execute(self, context):
+        from . import palette
+        try:
+            size = palette.export_palette(context.active_object, self.filepath)
+        except Exception as e:
+            self.report({'ERROR'}, f"Palette export failed: {e}")
+            return {'CANCELLED'}
+        self.report({'INFO'}, f"Exported palette ({size / 1024:.1f} KB)")
+        return {'FINISHED'}
 
     def invoke(self, context, event):
+        if not self.filepath:
+            self.filepath = bpy.path.ensure_ext(f"{context.active_object.name}_palette", ".dds")
         context.window_manager.fileselect_add(self)
         return {'RUNNING_MODAL'}
 
 
+class GS_OT_CullToCamera(bpy.types.Operator):
+    """Cull splats the scene camera cannot see (outside the frustum, sub-pixel or transparent)"""
+    bl_idname = "gs_tools.cull_to_camera"
+    bl_label = "Cull to Camera"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    mode: bpy.props.EnumProperty(
+        name="Mode",
+        items=[
+            ('MASK', "Mask", "Write a 'gs_culled' attribute that a GS_CameraCull modifier removes before instancing"),
+            ('COPY', "Culled Copy", "Create a new object with only the visible splats and hide the original from renders"),
+        ],
+        default='MASK'
+    )
+    min_pixels: bpy.props.FloatProperty(
+        name="Min Size (px)",
+        description="Cull splats whose projected diameter at the render resolution is smaller",
+        default=0.5, min=0.0
+    )
+    min_opacity: bpy.props.FloatProperty(
+        name="Min Opacity",
+        description="Cull splats that are more transparent",
+        default=0.02, min=0.0, max=1.0
+    )
+    margin: bpy.props.FloatProperty(
+        name="Frustum Margin",
+        description="Extra border around the frame, as a fraction of the frame size",
+        default=0.05, min=0.0, max=1.0
+    )
+    per_frame: bpy.props.BoolProperty(
+        name="Every Frame",
+        description="Mask mode: re-cull on every frame change, for animated cameras",
+        default=False
+    )
+
+    @classmethod
+    def poll(cls, context):
+        obj = context.active_object
+        return obj is not None and obj.modifiers.get("GS_Instancer") is not None
+
+    def execute(self, context):
+        from . import culling
+        scene = context.scene
+        camera = scene.camera
+        if camera is None:
+            self.report({'ERROR'}, "Scene has no active camera")
+            return {'CANCELLED'}
+
+        targets = _selected_splat_objects(context)
+
+        start_time = time.time()
+        depsgraph = context.evaluated_depsgraph_get()
+        settings = (self.min_pixels, self.min_opacity, self.margin)
+        kept = 0
+        total = 0
+        for obj in targets:
+            visible = culling.visibility_mask(obj, scene, camera, depsgraph, *settings)
+            if self.mode == 'MASK':
+                for (key, _), value in zip(culling.SETTINGS, settings):
+                    obj[key] = value
+                obj[culling.PER_FRAME_KEY] = self.per_frame
+                culling.write_mask(obj.data, visible)
+                culling.ensure_cull_modifier(obj)
+            else:
+                culling.culled_copy(obj, visible)
+            kept += int(visible.sum())
+            total += len(visible)
+
+        share = 100.0 * kept / total if total else 0.0
+        self.report({'INFO'}, f"Kept {kept} of {total} splats ({share:.1f}%) "
+                              f"in {time.time() - start_time:.2f}s")
+        return {'FINISHED'}
+
+    def invoke(self, context, event):
+        return context.window_manager.invoke_props_dialog(self)
+
+
+@bpy.app.handlers.persistent
+def _cull_frame_change(scene, depsgraph=None):
+    """Re-cull objects masked with 'Every Frame'; NumPy only loads if any exist."""
+    if any(obj.get("gs_cull_per_frame") for obj in scene.objects):
+        from . import culling
+        culling.update_per_frame(scene, depsgraph)
+
 
 class GS_PT_Panel(bpy.types.Panel):
     bl_label = "3DGS Palette Tools"
@@ -754,21 +1657,66 @@ class GS_PT_Panel(bpy.types.Panel):
         row.label(text="Brush Texture:")
         # Debug Path in UI
         box.label(text=f"Scan: {AssetManager.get_brush_path('tex_alpha')}")
-        box.template_icon_view(scene, "gs_target_material", show_labels=True, scale=3.0)
+        box.prop(scene, "gs_brush_mode", expand=True)
+        if scene.gs_brush_mode == 'ATLAS':
+            box.prop(scene, "gs_atlas_filter", text="Brushes")
+            box.prop(scene, "gs_brush_assign", text="Assign By")
+            if scene.gs_brush_assign == 'RANDOM':
+                box.prop(scene, "gs_brush_seed", text="Seed")
+        else:
+            box.template_icon_view(scene, "gs_target_material", show_labels=True, scale=3.0)
         
         box.prop(scene, "gs_target_mesh", text="Mesh")
         box.prop(scene, "gs_z_is_minimum", text="[Suggested] Z is Minimum") # Added checkbox
         box.prop(scene, "gs_y_up_to_z_up", text="Y-up to Z-up")
         box.prop(scene, "gs_source_is_linear", text="Source is Linear Color Space")
-        box.operator(GS_OT_Import.bl_idname, text="Load .ply")
+        box.prop(scene, "gs_morton_order", text="Morton Order (Cache Locality)")
+        box.prop(scene, "gs_chunk_divisions", text="Spatial Chunks")
+        box.prop(scene, "gs_attribute_schema", text="Attributes")
+        box.prop(scene, "gs_remove_degenerate", text="Remove Degenerate Splats")
+        box.prop(scene, "gs_remove_floaters", text="Remove Floaters")
+        if scene.gs_remove_floaters:
+            row = box.row(align=True)
+            row.prop(scene, "gs_floater_radius", text="Radius")
+            row.prop(scene, "gs_floater_neighbors", text="Neighbors")
+        box.prop(scene, "gs_sh_mode", text="View Color")
+        box.prop(scene, "gs_color_mode", text="Color")
+        if scene.gs_color_mode == 'PALETTE':
+            box.prop(scene, "gs_palette_layout", text="Palette Layout")
+            box.prop(scene, "gs_palette_cache_dir", text="Palette Cache")
+        box.prop(scene, "gs_import_no_undo", text="No Undo & Clean Up")
+        if scene.gs_import_no_undo:
+            box.operator(GS_OT_ImportClean.bl_idname, text="Load .ply (No Undo)")
+        else:
+            box.operator(GS_OT_Import.bl_idname, text="Load .ply")
+        box.operator(GS_OT_ImportMerge.bl_idname, text="Merge .ply Captures...")
+        box.operator(GS_OT_Analyze.bl_idname, text="Analyze .ply...", icon='VIEWZOOM')
+        if GS_OT_Analyze.last_report:
+            name, lines = GS_OT_Analyze.last_report
+            col = box.column(align=True)
+            col.label(text=name, icon='INFO')
+            for line in lines:
+                col.label(text=line)
         
         box = layout.box()
         obj = context.active_object
         
         if obj and obj.modifiers.get("GS_Instancer"):
             box.label(text="Instancer Active", icon='CHECKMARK')
+            lod_mod = obj.modifiers.get(GS_Processor.LOD_FILTER_NAME)
+            if lod_mod and lod_mod.node_group:
+                for item in lod_mod.node_group.interface.items_tree:
+                    if item.name == "Density":
+                        box.prop(lod_mod, f'["{item.identifier}"]', text="Viewport Density", slider=True)
+            box.operator(GS_OT_CullToCamera.bl_idname, text="Cull to Camera...")
         else:
             box.label(text="Select object and edit modifier", icon='INFO')
+
+        box = layout.box()
+        box.label(text="Export", icon='EXPORT')
+        box.operator(GS_OT_ExportDirect.bl_idname, text="Export...")
+        box.operator(GS_OT_ExportTiles.bl_idname, text="Export LOD Tiles...")
+        box.operator(GS_OT_ExportPalette.bl_idname, text="Export Palette...")
             
 
 
@@ -778,29 +1726,66 @@ class GS_PT_Panel(bpy.types.Panel):
 
 classes = (
     GS_OT_Import,
+    GS_OT_ImportClean,
+    GS_OT_ImportMerge,
+    GS_OT_Analyze,
+    GS_OT_ExportDirect,
+    GS_OT_ExportTiles,
+    GS_OT_ExportPalette,
+    GS_OT_CullToCamera,
     GS_PT_Panel,
 )
 
 def register():
     print("[GS_Tool] Registering...")
+    start_time = time.perf_counter()
     try:
         for cls in classes:
             bpy.utils.register_class(cls)
+
+        # post: the camera is already evaluated at the new frame
+        if _cull_frame_change not in bpy.app.handlers.frame_change_post:
+            bpy.app.handlers.frame_change_post.append(_cull_frame_change)
             
-        # Ensure preview collection is ready
-        if "main" not in preview_collections:
-            print("[GS_Tool] Creating new preview collection 'main'")
-            pcoll = bpy.utils.previews.new()
-            pcoll.brush_dir = ""
-            preview_collections["main"] = pcoll
-        else:
-             print("[GS_Tool] Preview collection 'main' already exists")
+        # Preview collection, brush scan and asset.blend index are all created
+        # on first use by the enum callbacks, never at registration time.
 
         bpy.types.Scene.gs_target_material = bpy.props.EnumProperty(
             name="Brush Texture",
             description="Select brush alpha texture",
             items=get_brush_textures_callback
         )
+        bpy.types.Scene.gs_brush_mode = bpy.props.EnumProperty(
+            name="Brush Mode",
+            description="Brushes drawn by one import",
+            items=[
+                ('SINGLE', "Single Brush", "Every stroke uses the selected brush texture"),
+                ('ATLAS', "Brush Atlas", "Pack several brushes into one atlas texture and pick one per stroke "
+                                         "(one material and draw call per object)"),
+            ],
+            default='SINGLE'
+        )
+        bpy.types.Scene.gs_atlas_filter = bpy.props.StringProperty(
+            name="Atlas Brushes",
+            description="Glob pattern of the tex_alpha files packed into the atlas, e.g. 'PosterColor_Tex*' "
+                        "(empty = all brushes)",
+            default=""
+        )
+        bpy.types.Scene.gs_brush_assign = bpy.props.EnumProperty(
+            name="Assign Brushes By",
+            description="How each stroke picks its brush from the atlas",
+            items=[
+                ('SCALE', "Scale", "Stroke size quantiles: small strokes use the first brushes"),
+                ('COLOR', "Color", "Luminance quantiles: dark strokes use the first brushes"),
+                ('RANDOM', "Random", "Random brush per stroke from a fixed seed"),
+            ],
+            default='SCALE'
+        )
+        bpy.types.Scene.gs_brush_seed = bpy.props.IntProperty(
+            name="Brush Seed",
+            description="Seed of the random brush assignment",
+            default=0, min=0
+        )
         bpy.types.Scene.gs_target_mesh = bpy.props.EnumProperty(
             name="Target Mesh",
             description="Select mesh from asset.blend for the splat instance",
@@ -821,7 +1806,95 @@ def register():
             description="If checked, source colors are treated as Linear and converted to sRGB for baking. If unchecked, source is assumed to be sRGB.",
             default=False
         )
-        print("[GS_Tool] Registration complete.")
+        bpy.types.Scene.gs_morton_order = bpy.props.BoolProperty(
+            name="Morton Order",
+            description="Sort splats along a Z-curve before building the mesh, "
+                        "for better memory locality when instancing, rendering and exporting",
+            default=False
+        )
+        bpy.types.Scene.gs_attribute_schema = bpy.props.EnumProperty(
+            name="Attribute Schema",
+            description="Point attributes stored on the imported mesh",
+            items=[
+                ('FULL', "Full", "All float32 attributes, including log-space and Euler copies (~76 bytes/splat)"),
+                ('LEAN', "Lean", "scale, QUATERNION rotation, opacity, FLOAT2 palette_uv; decoded by a "
+                                 "GS_Decode modifier (~44 bytes/splat)"),
+                ('COMPACT', "Compact", "Lean with INT8 opacity and an INT palette index (~37 bytes/splat)"),
+            ],
+            default='FULL'
+        )
+        bpy.types.Scene.gs_color_mode = bpy.props.EnumProperty(
+            name="Color Mode",
+            description="How splat colours reach the shader",
+            items=[
+                ('PALETTE', "Palette Texture", "Bake a 256x256 palette image sampled through ColUV"),
+                ('ATTRIBUTE', "Color Attribute", "Store an sRGB byte colour per splat (4 bytes) and read it "
+                                                 "in the shader; no palette baking, no texture fetch"),
+            ],
+            default='PALETTE'
+        )
+        bpy.types.Scene.gs_sh_mode = bpy.props.EnumProperty(
+            name="View Color",
+            description="Which view-dependent colour (SH bands 1-3, f_rest_*) is baked",
+            items=[
+                ('DC', "Base Color", "Only the view-independent f_dc colour"),
+                ('HEMISPHERE', "View Average", "Mean colour over all views from outside the scene, "
+                                               "with highlights and lighting of the capture"),
+                ('CAMERA', "Active Camera", "Colour seen from the scene camera, for a fixed render view"),
+            ],
+            default='DC'
+        )
+        bpy.types.Scene.gs_palette_layout = bpy.props.EnumProperty(
+            name="Palette Layout",
+            description="Placement of the colours in the palette texture",
+            items=[
+                ('HSV', "HSV Rows", "Row-major in HSV order"),
+                ('HILBERT', "Hilbert", "Perceptual (OKLab) order along a 2D Hilbert curve: 4x4 blocks hold "
+                                       "similar colours, so the palette survives block compression and mipmaps"),
+            ],
+            default='HSV'
+        )
+        bpy.types.Scene.gs_palette_cache_dir = bpy.props.StringProperty(
+            name="Palette Cache",
+            description="Folder for palette PNGs, loaded by path instead of packed into the .blend "
+                        "(empty = pack into the .blend)",
+            subtype='DIR_PATH',
+            default=""
+        )
+        bpy.types.Scene.gs_remove_degenerate = bpy.props.BoolProperty(
+            name="Remove Degenerate Splats",
+            description="Drop splats with NaN/inf values, zero scale or a zero rotation, "
+                        "and exact copies of another splat's whole record (first one is kept)",
+            default=True
+        )
+        bpy.types.Scene.gs_remove_floaters = bpy.props.BoolProperty(
+            name="Remove Floaters",
+            description="Drop isolated splats with too few neighbours (hash-grid neighbour count)",
+            default=False
+        )
+        bpy.types.Scene.gs_floater_radius = bpy.props.FloatProperty(
+            name="Floater Radius",
+            description="Neighbourhood grid cell size, in multiples of the median splat size",
+            default=10.0, min=1.0, soft_max=100.0
+        )
+        bpy.types.Scene.gs_floater_neighbors = bpy.props.IntProperty(
+            name="Floater Neighbors",
+            description="Splats with fewer neighbours in the surrounding 3x3x3 cells are removed",
+            default=3, min=1, soft_max=50
+        )
+        bpy.types.Scene.gs_import_no_undo = bpy.props.BoolProperty(
+            name="No Undo & Clean Up",
+            description="Import without an undo step (avoids keeping a second copy of huge meshes) "
+                        "and remove orphan data left by earlier imports of the same file",
+            default=False
+        )
+        bpy.types.Scene.gs_chunk_divisions = bpy.props.IntProperty(
+            name="Spatial Chunks",
+            description="Split the import into N x N x N grid chunks, one object each (1 = single object). "
+                        "Chunks share material, palette and node group and evaluate in parallel",
+            default=1, min=1, max=16
+        )
+        print(f"[GS_Tool] Registration complete ({(time.perf_counter() - start_time) * 1000:.1f} ms).")
     except Exception as e:
         print(f"[GS_Tool] ERROR during registration: {e}")
         import traceback
@@ -832,7 +1905,12 @@ def unregister():
     try:
         for cls in classes:
             bpy.utils.unregister_class(cls)
+
+        if _cull_frame_change in bpy.app.handlers.frame_change_post:
+            bpy.app.handlers.frame_change_post.remove(_cull_frame_change)
             
+        thumbnails.shutdown()
+        parallel.shutdown()
         for pcoll in preview_collections.values():
             bpy.utils.previews.remove(pcoll)
         preview_collections.clear()
@@ -844,6 +1922,38 @@ def unregister():
         
         if hasattr(bpy.types.Scene, "gs_source_is_linear"):
             del bpy.types.Scene.gs_source_is_linear
+        if hasattr(bpy.types.Scene, "gs_morton_order"):
+            del bpy.types.Scene.gs_morton_order
+        if hasattr(bpy.types.Scene, "gs_attribute_schema"):
+            del bpy.types.Scene.gs_attribute_schema
+        if hasattr(bpy.types.Scene, "gs_color_mode"):
+            del bpy.types.Scene.gs_color_mode
+        if hasattr(bpy.types.Scene, "gs_sh_mode"):
+            del bpy.types.Scene.gs_sh_mode
+        if hasattr(bpy.types.Scene, "gs_palette_layout"):
+            del bpy.types.Scene.gs_palette_layout
+        if hasattr(bpy.types.Scene, "gs_palette_cache_dir"):
+            del bpy.types.Scene.gs_palette_cache_dir
+        if hasattr(bpy.types.Scene, "gs_remove_degenerate"):
+            del bpy.types.Scene.gs_remove_degenerate
+        if hasattr(bpy.types.Scene, "gs_remove_floaters"):
+            del bpy.types.Scene.gs_remove_floaters
+        if hasattr(bpy.types.Scene, "gs_floater_radius"):
+            del bpy.types.Scene.gs_floater_radius
+        if hasattr(bpy.types.Scene, "gs_floater_neighbors"):
+            del bpy.types.Scene.gs_floater_neighbors
+        if hasattr(bpy.types.Scene, "gs_import_no_undo"):
+            del bpy.types.Scene.gs_import_no_undo
+        if hasattr(bpy.types.Scene, "gs_chunk_divisions"):
+            del bpy.types.Scene.gs_chunk_divisions
+        if hasattr(bpy.types.Scene, "gs_brush_mode"):
+            del bpy.types.Scene.gs_brush_mode
+        if hasattr(bpy.types.Scene, "gs_atlas_filter"):
+            del bpy.types.Scene.gs_atlas_filter
+        if hasattr(bpy.types.Scene, "gs_brush_assign"):
+            del bpy.types.Scene.gs_brush_assign
+        if hasattr(bpy.types.Scene, "gs_brush_seed"):
+            del bpy.types.Scene.gs_brush_seed
         
         # Clean up old property if it exists (robustness)
         if hasattr(bpy.types.Scene, "gs_source_color_space"):
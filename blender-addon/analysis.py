@@ -0,0 +1,161 @@
+import time
+
+import numpy as np
+
+# ==============================================================================
+#  PRE-IMPORT ANALYSIS
+# ==============================================================================
+# A quick look at a PLY file before committing to a multi-minute import. Only
+# the header and an evenly strided sample of records are read (sample_ply_data:
+# through a memory map, so a multi-GB file costs a few thousand page reads),
+# and the sample goes through the same colour-key and clean-up code as the import:
+#   - splat count: exact, from the header
+#   - unique colours: estimated from the sample's key frequencies (Haas et
+#     al.'s hybrid: a chi-square test picks the jackknife d / (1 - (1 - q) f1 / n)
+#     for evenly spread colours, else GEE sqrt(N / n) f1 + (d - f1); f1: keys
+#     seen once, d: distinct keys, q = n / N), which decides Mode A (lossless
+#     palette) or Mode B (grid quantization)
+#   - memory: PLY records + working arrays during the import, point
+#     attributes of the chosen schema afterwards
+#   - time: per-splat costs measured with benchmark/bench_import.py, scaled
+#     by how fast this machine runs the colour-key kernel on the sample
+
+SAMPLE_SIZE = 1 << 16
+CALIBRATION_RUNS = 3
+
+# Reference machine (benchmark/bench_import.py, bench_sh.py; single core)
+REFERENCE_KEY_RATE = 30e6           # palette.color_keys, base colour, splats/s
+IMPORT_SECONDS_PER_SPLAT = {'FULL': 13.7e-6, 'LEAN': 4.0e-6, 'COMPACT': 4.2e-6}
+CLEANUP_SECONDS_PER_SPLAT = {'degenerate': 0.2e-6, 'floaters': 0.35e-6}
+READ_BYTES_PER_SECOND = 500e6       # cold read of the PLY file
+# Working arrays of the import besides the PLY records (FULL adds the Euler angles)
+WORKING_BYTES_PER_SPLAT = {'FULL': 315, 'LEAN': 290, 'COMPACT': 290}
+# Direct export with the default quad brush (2 triangles per splat)
+EXPORT_SECONDS_PER_SPLAT = {'.glb': 2.1e-6, '.obj': 45e-6}
+EXPORT_BYTES_PER_SPLAT = {'.glb': 184, '.obj': 520}
+
+# Point attribute types per schema (position included), as written by process_and_bake
+SCHEMA_ATTRIBUTES = {
+    'FULL': ('FLOAT_VECTOR',) * 5 + ('FLOAT',) * 3,
+    'LEAN': ('FLOAT_VECTOR', 'FLOAT_VECTOR', 'QUATERNION', 'FLOAT'),
+    'COMPACT': ('FLOAT_VECTOR', 'FLOAT_VECTOR', 'QUATERNION', 'INT8'),
+}
+PALETTE_ATTRIBUTE = {'FULL': 'FLOAT_VECTOR', 'LEAN': 'FLOAT2', 'COMPACT': 'INT'}
+
+
+def estimate_distinct(keys, population):
+    """
+    Estimate of the distinct values among `population` records from a uniform
+    sample of their `keys`; exact when the sample is the population. Returns
+    (estimate, exact).
+    """
+    _, counts = np.unique(keys, return_counts=True)
+    n, d = len(keys), len(counts)
+    if n >= population:
+        return d, True
+    singletons = int(np.count_nonzero(counts == 1))
+    # Chi-square test of equal frequencies on the sample counts
+    chi2 = float(np.sum((counts - n / d) ** 2)) * d / n
+    if chi2 <= d - 1 + 2.33 * np.sqrt(2.0 * (d - 1)):
+        # Low skew: unsmoothed first-order jackknife
+        estimate = d / (1.0 - (1.0 - n / population) * singletons / n) if singletons < n else population
+    else:
+        # High skew: GEE, within a factor sqrt(population / n) of the truth
+        estimate = np.sqrt(population / n) * singletons + (d - singletons)
+    return int(min(max(estimate, d), population)), False
+
+
+def attribute_bytes_per_splat(schema, color_mode, type_bytes):
+    """Stored bytes per splat of the point mesh (`type_bytes`: GS_Processor.ATTRIBUTE_BYTES)."""
+    types = list(SCHEMA_ATTRIBUTES[schema])
+    types.append('BYTE_COLOR' if color_mode == 'ATTRIBUTE' else PALETTE_ATTRIBUTE[schema])
+    types.append('INT')     # lod_rank
+    return sum(type_bytes[t] for t in types)
+
+
+def analyze_sample(sample, n_points, ply_bytes, settings, type_bytes, palette_pixels):
+    """
+    Estimates for importing a PLY file of `n_points` splats and `ply_bytes`
+    bytes from a strided `sample` of its records, with the scene `settings`
+    (dict of the gs_* values the import reads). Returns a dict: 'splats',
+    'sampled', 'colors', 'colors_exact', 'mode', 'removed', 'ply_bytes',
+    'peak_bytes', 'mesh_bytes', 'import_seconds', 'export' ({ext: (seconds, bytes)}).
+    """
+    from . import cleanup, palette
+
+    n_sampled = len(sample)
+
+    # Machine speed: the base colour kernel on the sample against the reference rate
+    # (best of a few runs: a single run of a few ms is at the mercy of the scheduler)
+    palette.srgb_lut()      # built once per session, not part of the kernel
+    key_seconds = float('inf')
+    for _ in range(CALIBRATION_RUNS):
+        t0 = time.perf_counter()
+        keys = palette.color_keys(sample, settings['source_is_linear'])
+        key_seconds = min(key_seconds, time.perf_counter() - t0)
+    slowdown = 1.0
+    if n_sampled and 0.0 < key_seconds < float('inf'):
+        slowdown = float(np.clip(REFERENCE_KEY_RATE * key_seconds / n_sampled, 0.25, 4.0))
+
+    # Splats the clean-up would drop (floaters need the full cloud's density: not sampled)
+    kept = sample
+    removed = 0
+    if settings['remove_degenerate'] and n_sampled:
+        bad = cleanup.nonfinite_mask(sample) | cleanup.degenerate_mask(sample)
+        removed = int(round(np.count_nonzero(bad) * n_points / n_sampled))
+        kept, keys = sample[~bad], keys[~bad]
+    n_kept = n_points - removed
+
+    # View-dependent colours spread the keys: count them with the view average
+    names = sample.dtype.names or ()
+    if settings['sh_mode'] != 'DC' and len(kept) and 'x' in names:
+        from . import sh
+        if sh.file_degree(names) > 0:
+            centre = np.median(np.stack((kept['x'], kept['y'], kept['z'])), axis=1)
+            keys = palette.color_keys(kept, settings['source_is_linear'],
+                                      view=sh.ViewColor(names, 'HEMISPHERE', centre))
+
+    colors, exact = estimate_distinct(keys, n_kept) if len(keys) else (0, True)
+    if settings['color_mode'] == 'ATTRIBUTE':
+        mode = 'Color attribute (no palette)'
+    elif colors <= palette_pixels:
+        mode = 'Mode A: lossless palette'
+    else:
+        mode = 'Mode B: grid quantization'
+
+    schema = settings['schema']
+    mesh_bytes = attribute_bytes_per_splat(schema, settings['color_mode'], type_bytes) * n_kept
+    peak_bytes = sample.dtype.itemsize * n_points + WORKING_BYTES_PER_SPLAT[schema] * n_kept + mesh_bytes
+
+    import_seconds = IMPORT_SECONDS_PER_SPLAT[schema] * n_kept
+    if settings['remove_degenerate']:
+        import_seconds += CLEANUP_SECONDS_PER_SPLAT['degenerate'] * n_points
+    if settings['remove_floaters']:
+        import_seconds += CLEANUP_SECONDS_PER_SPLAT['floaters'] * n_points
+    import_seconds = import_seconds * slowdown + ply_bytes / READ_BYTES_PER_SECOND
+    export = {ext: (EXPORT_SECONDS_PER_SPLAT[ext] * n_kept * slowdown, EXPORT_BYTES_PER_SPLAT[ext] * n_kept)
+              for ext in EXPORT_SECONDS_PER_SPLAT}
+
+    return {
+        'splats': n_points, 'sampled': n_sampled, 'colors': colors, 'colors_exact': exact,
+        'mode': mode, 'removed': removed, 'ply_bytes': ply_bytes, 'peak_bytes': peak_bytes,
+        'mesh_bytes': mesh_bytes, 'import_seconds': import_seconds, 'export': export,
+    }
+
+
+def report_lines(result, seconds):
+    """Human-readable summary of an analyze_sample result (`seconds`: time the analysis took)."""
+    mb = 1024 * 1024
+    approx = "" if result['colors_exact'] else "~"
+    lines = [
+        f"{result['splats']:,} splats ({result['ply_bytes'] / mb:.1f} MB), "
+        f"{result['sampled']:,} sampled in {seconds * 1000:.0f} ms",
+        f"{approx}{result['colors']:,} unique colors: {result['mode']}",
+        f"Memory: ~{result['peak_bytes'] / mb:.0f} MB peak, ~{result['mesh_bytes'] / mb:.0f} MB point mesh",
+        f"Import: ~{result['import_seconds']:.1f} s",
+    ]
+    if result['removed']:
+        lines.insert(2, f"Clean-up: ~{result['removed']:,} degenerate splats")
+    lines.append("Export: " + ", ".join(f"{ext} ~{export_seconds:.1f} s / {size / mb:.0f} MB"
+                                        for ext, (export_seconds, size) in result['export'].items()))
+    return lines
@@ -0,0 +1,139 @@
+import os
+import hashlib
+import fnmatch
+import bpy
+import numpy as np
+
+# ==============================================================================
+#  BRUSH ATLAS
+# ==============================================================================
+# Several brush alphas (and their tex_normal pairs) are packed into one grid
+# texture so a single material can draw mixed brush styles. Cell i sits at
+# column i % cols, row i // cols (rows count up from the bottom, like image
+# pixels and UVs). Each splat carries an INT `brush_index`; create_shader maps
+# the brush UV into that cell. Brushes without a normal map get a flat normal.
+# The atlas images are packed and tagged with a key built from the brush file
+# names and stats, so later imports reuse them without reading the PNGs.
+
+ATLAS_CELL = 256            # pixels per brush cell
+ATLAS_NAME = "GS_BrushAtlas"
+ATLAS_KEY_PROP = "gs_atlas_key"
+ATLAS_BRUSHES_PROP = "gs_atlas_brushes"     # lookup table: "|"-joined names, in index order
+FLAT_NORMAL = (0.5, 0.5, 1.0, 1.0)
+
+
+def select_brushes(alpha_files, pattern=""):
+    """Alpha file names matching a glob pattern (empty = all), in panel order."""
+    if not pattern:
+        return list(alpha_files)
+    return [f for f in alpha_files if fnmatch.fnmatch(f.lower(), pattern.lower())]
+
+
+def grid_size(count):
+    """Columns (= rows) of the square grid holding `count` cells."""
+    return max(1, int(np.ceil(np.sqrt(count))))
+
+
+def atlas_key(alpha_paths, normal_paths, cell=ATLAS_CELL):
+    """Identifies an atlas by its brush files (name, size, mtime) without reading them."""
+    h = hashlib.sha1(str(cell).encode())
+    for path in list(alpha_paths) + list(normal_paths):
+        h.update(b"|")
+        if path:
+            h.update(os.path.basename(path).encode())
+            try:
+                st = os.stat(path)
+                h.update(f"{st.st_size}:{st.st_mtime_ns}".encode())
+            except OSError:
+                pass
+    return h.hexdigest()[:16]
+
+
+def _find_atlas(key, suffix=""):
+    for img in bpy.data.images:
+        if img.library is None and img.get(ATLAS_KEY_PROP) == key + suffix:
+            return img
+    return None
+
+
+def _load_cell(filepath, cell):
+    """float32 (cell, cell, 4) pixels of an image resized through Blender."""
+    img = bpy.data.images.load(filepath, check_existing=False)
+    try:
+        if tuple(img.size) != (cell, cell):
+            img.scale(cell, cell)
+        pixels = np.zeros(cell * cell * 4, dtype=np.float32)
+        img.pixels.foreach_get(pixels)
+    finally:
+        bpy.data.images.remove(img)
+    return pixels.reshape(cell, cell, 4)
+
+
+def _pack_grid(name, cells, cols, cell, key):
+    size = cols * cell
+    pixels = np.zeros((size, size, 4), dtype=np.float32)
+    for i, data in enumerate(cells):
+        x, y = (i % cols) * cell, (i // cols) * cell
+        pixels[y:y + cell, x:x + cell] = data
+
+    stale = bpy.data.images.get(name)
+    if stale is not None and stale.users == 0 and stale.library is None:
+        bpy.data.images.remove(stale)
+    img = bpy.data.images.new(name, size, size, alpha=True)
+    img.pixels.foreach_set(pixels.reshape(-1))
+    img.pack()
+    img[ATLAS_KEY_PROP] = key
+    return img
+
+
+def build_atlas(alpha_paths, normal_paths, cell=ATLAS_CELL):
+    """
+    Atlas images for the given brushes (normal_paths[i] may be None).
+    Returns (alpha_img, normal_img or None, cols); cached images are reused.
+    """
+    cols = grid_size(len(alpha_paths))
+    key = atlas_key(alpha_paths, normal_paths, cell)
+    has_normals = any(normal_paths)
+
+    alpha_img = _find_atlas(key)
+    normal_img = _find_atlas(key, "_normal") if has_normals else None
+    if alpha_img is not None and (normal_img is not None or not has_normals):
+        return alpha_img, normal_img, cols
+
+    if alpha_img is None:
+        alpha_img = _pack_grid(ATLAS_NAME, [_load_cell(p, cell) for p in alpha_paths], cols, cell, key)
+        alpha_img[ATLAS_BRUSHES_PROP] = "|".join(os.path.basename(p) for p in alpha_paths)
+
+    if has_normals and normal_img is None:
+        flat = np.broadcast_to(np.array(FLAT_NORMAL, dtype=np.float32), (cell, cell, 4))
+        cells = [_load_cell(p, cell) if p else flat for p in normal_paths]
+        normal_img = _pack_grid(f"{ATLAS_NAME}_Normal", cells, cols, cell, key + "_normal")
+        normal_img.colorspace_settings.name = 'Non-Color'
+
+    return alpha_img, normal_img, cols
+
+
+def _quantile_bins(values, count):
+    """Equal-count bins of `values`: the smallest n/count get 0, the next n/count get 1, ..."""
+    n = len(values)
+    order = np.argsort(values, kind='stable')
+    bins = np.empty(n, dtype=np.int32)
+    bins[order] = (np.arange(n, dtype=np.int64) * count // max(n, 1)).astype(np.int32)
+    return bins
+
+
+def assign_brushes(mode, count, scales, colors, seed=0):
+    """
+    Per-splat brush index in [0, count):
+    - SCALE: stroke size quantiles, small strokes use the first brushes
+    - COLOR: luminance quantiles, dark strokes use the first brushes
+    - RANDOM: uniform with a fixed seed
+    """
+    n = len(scales)
+    if count <= 1 or n == 0:
+        return np.zeros(n, dtype=np.int32)
+    if mode == 'SCALE':
+        return _quantile_bins(np.prod(np.abs(scales), axis=1), count)
+    if mode == 'COLOR':
+        return _quantile_bins(colors @ np.array([0.2126, 0.7152, 0.0722]), count)
+    return np.random.default_rng(seed).integers(0, count, n, dtype=np.int32)
@@ -0,0 +1,185 @@
+import numpy as np
+from numpy.lib import recfunctions
+
+# ==============================================================================
+#  SPLAT CLEAN-UP
+# ==============================================================================
+# Raw captures carry splats that only cost instancing and render time:
+#   - non-finite: NaN/inf in any float field (corrupt or diverged training)
+#   - degenerate: largest scale axis effectively zero, or a zero quaternion
+#   - duplicate: exact copies of another splat's whole record (first one is kept)
+#   - floater: fewer than `min_neighbors` other splats in the 3x3x3 block of
+#     hash-grid cells around it; the cell size is a multiple of the median
+#     splat size, so the test follows the capture's scale
+# Everything is a mask over the PLY records, applied once before the splat
+# arrays are built.
+
+DEGENERATE_LOG_SCALE = np.log(1e-7)     # exp(log scale) below this never covers a pixel
+GRID_BITS = 21                          # per axis in the packed cell keys
+CHECK_CHUNK = 1 << 16                   # records per block of the non-finite check
+HASH_PRIMES = (0x9E3779B97F4A7C15, 0xC2B2AE3D27D4EB4F, 0x165667B19E3779F9)
+
+
+def nonfinite_mask(ply_data, chunk=CHECK_CHUNK):
+    """
+    Splats with NaN or inf in any float field. A row sum is non-finite exactly
+    then (or when the values are absurdly large), so each block of records is
+    checked with one matrix-vector product instead of a pass per field.
+    """
+    fields = [name for name in ply_data.dtype.names if ply_data.dtype[name].kind == 'f']
+    bad = np.zeros(len(ply_data), dtype=bool)
+    if not fields:
+        return bad
+    ones = np.ones(len(fields), dtype=np.float32)
+    with np.errstate(over='ignore', invalid='ignore'):
+        for start in range(0, len(ply_data), chunk):
+            rows = recfunctions.structured_to_unstructured(
+                ply_data[fields][start:start + chunk], dtype=np.float32, copy=False)
+            bad[start:start + len(rows)] = ~np.isfinite(rows @ ones)
+    return bad
+
+
+def degenerate_mask(ply_data):
+    """Splats whose largest scale axis is effectively zero, or with a zero rotation quaternion."""
+    names = ply_data.dtype.names
+    bad = np.zeros(len(ply_data), dtype=bool)
+    scale_names = [n for n in names if n.startswith('scale')][:3]
+    if scale_names:
+        largest = np.array(ply_data[scale_names[0]], dtype=np.float32)
+        for name in scale_names[1:]:
+            np.maximum(largest, ply_data[name], out=largest)
+        bad |= largest < DEGENERATE_LOG_SCALE
+    rot_names = [n for n in names if n.startswith('rot')][:4]
+    if len(rot_names) == 4:
+        zero = ply_data[rot_names[0]] == 0.0
+        for name in rot_names[1:]:
+            zero &= ply_data[name] == 0.0
+        bad |= zero
+    return bad
+
+
+def duplicate_mask(ply_data, idx, positions):
+    """
+    Splats (over `idx`, records of `ply_data` at `positions`) that are exact
+    copies of an earlier splat: every field of the record is the same.
+    """
+    n = len(positions)
+    dup = np.zeros(n, dtype=bool)
+    bits = np.ascontiguousarray(positions, dtype=np.float32).view(np.uint32).astype(np.uint64)
+    h = bits[:, 0] * np.uint64(HASH_PRIMES[0])
+    h ^= bits[:, 1] * np.uint64(HASH_PRIMES[1])
+    h ^= bits[:, 2] * np.uint64(HASH_PRIMES[2])
+    # A plain sort finds the repeated position hashes; only their records are compared
+    sorted_h = np.sort(h)
+    repeated = sorted_h[1:][sorted_h[1:] == sorted_h[:-1]]
+    if len(repeated) == 0:
+        return dup
+    candidates = np.nonzero(np.isin(h, repeated))[0]
+    # Whole records as rows of 64-bit words (zero-padded)
+    records = np.ascontiguousarray(ply_data[idx[candidates]])
+    size = records.dtype.itemsize
+    rows = np.zeros((len(candidates), -(-size // 8) * 8), dtype=np.uint8)
+    rows[:, :size] = records.view(np.uint8).reshape(len(candidates), size)
+    rows = rows.view(np.uint64)
+    # Sorted by the words themselves (stable: earlier splats first), so identical
+    # records are always neighbours
+    order = np.lexsort(rows.T[::-1])
+    rows = rows[order]
+    same = np.all(rows[1:] == rows[:-1], axis=1)
+    dup[candidates[order[1:][same]]] = True
+    return dup
+
+
+def neighbor_counts(positions, cell):
+    """
+    Other splats in the 3x3x3 block of `cell`-sized grid cells around each splat.
+    Cells are packed (x, y, z) keys, sorted once. The cells z - 1 and z + 1 of
+    a key sit right next to the key itself in sorted order, so every (dx, dy)
+    column costs one sorted search; each neighbour pair is found once, through
+    the forward half of the offsets.
+    """
+    n = len(positions)
+    q = np.floor((positions - positions.min(axis=0)) / cell).astype(np.int64) + 1
+    # Far outliers beyond the key range share the border cells
+    np.clip(q, 1, (1 << GRID_BITS) - 2, out=q)
+    keys = (q[:, 0] << (2 * GRID_BITS)) | (q[:, 1] << GRID_BITS) | q[:, 2]
+
+    order = np.argsort(keys)
+    sorted_keys = keys[order]
+    first = np.ones(n, dtype=bool)
+    first[1:] = sorted_keys[1:] != sorted_keys[:-1]
+    starts = np.nonzero(first)[0]
+    cells = sorted_keys[starts]
+    counts = np.diff(np.append(starts, n))
+    m = len(cells)
+
+    block = counts.astype(np.float64)
+
+    def pair(src, dst):
+        block[:] += np.bincount(src, weights=counts[dst], minlength=m)
+        block[:] += np.bincount(dst, weights=counts[src], minlength=m)
+
+    # (0, 0, +1): the next key in sorted order
+    src = np.nonzero(cells[1:] == cells[:-1] + 1)[0]
+    pair(src, src + 1)
+    # (0, +1, dz) and (+1, dy, dz)
+    for dx, dy in ((0, 1), (1, -1), (1, 0), (1, 1)):
+        probe = cells + ((dx << (2 * GRID_BITS)) + (dy << GRID_BITS))
+        lo = np.searchsorted(cells, probe - 1)
+        for j in range(3):
+            idx = lo + j
+            valid = idx < m
+            idx[~valid] = m - 1
+            hit = valid & (np.abs(cells[idx] - probe) <= 1)
+            src = np.nonzero(hit)[0]
+            pair(src, idx[src])
+
+    cell_of_sorted = np.cumsum(first) - 1
+    result = np.empty(n, dtype=np.int64)
+    result[order] = block.astype(np.int64)[cell_of_sorted] - 1
+    return result
+
+
+def clean_splats(ply_data, remove_degenerate=True, remove_floaters=False,
+                 floater_radius=10.0, min_neighbors=3):
+    """
+    Boolean keep mask over the PLY records and the number of splats removed
+    per reason ('non-finite', 'degenerate', 'duplicate', 'floater'), each
+    counted among the splats the earlier tests kept.
+    """
+    n = len(ply_data)
+    keep = np.ones(n, dtype=bool)
+    removed = {}
+
+    def drop(reason, mask):
+        mask &= keep
+        removed[reason] = int(np.count_nonzero(mask))
+        keep[mask] = False
+
+    if remove_degenerate:
+        drop('non-finite', nonfinite_mask(ply_data))
+        drop('degenerate', degenerate_mask(ply_data))
+
+    if (remove_degenerate or remove_floaters) and keep.any():
+        idx = np.nonzero(keep)[0]
+        positions = np.stack((ply_data['x'][idx], ply_data['y'][idx], ply_data['z'][idx]), axis=1)
+        if remove_degenerate:
+            dup = duplicate_mask(ply_data, idx, positions)
+            copies = np.zeros(n, dtype=bool)
+            copies[idx[dup]] = True
+            drop('duplicate', copies)
+            idx, positions = idx[~dup], positions[~dup]
+
+        if remove_floaters and len(idx):
+            scale_names = [name for name in ply_data.dtype.names if name.startswith('scale')][:3]
+            if scale_names:
+                log_size = np.max(np.stack([ply_data[name][idx] for name in scale_names]), axis=0)
+                splat_size = float(np.exp(np.median(log_size)))
+            else:
+                splat_size = 0.01
+            cell = max(splat_size * floater_radius, 1e-9)
+            lonely = np.zeros(n, dtype=bool)
+            lonely[idx[neighbor_counts(positions, cell) < min_neighbors]] = True
+            drop('floater', lonely)
+
+    return keep, removed
@@ -0,0 +1,216 @@
+import bpy
+import numpy as np
+
+from .export import ATTRIBUTE_LAYOUT, SplatArrays, read_attribute
+
+# ==============================================================================
+#  CAMERA VISIBILITY PRE-CULLING
+# ==============================================================================
+# For a fixed render camera many splats are off screen or far below a pixel,
+# yet GS_Instancer instances all of them. The mask is computed in NumPy from
+# the point mesh attributes:
+#   - frustum: splat centre (padded by its radius) inside the clip volume
+#   - projected size: largest axis of `scale` in pixels at the render resolution
+#   - opacity: `opacity` attribute
+# MASK mode writes a `gs_culled` point attribute that the GS_CameraCull
+# modifier deletes ahead of the instancer (optionally re-evaluated every
+# frame); COPY mode builds a new point mesh with only the visible splats.
+
+CULLED_ATTR = "gs_culled"
+CULL_FILTER_NAME = "GS_CameraCull"
+PER_FRAME_KEY = "gs_cull_per_frame"
+# Custom properties storing an object's cull settings, with their defaults
+SETTINGS = (("gs_cull_min_pixels", 0.5), ("gs_cull_min_opacity", 0.02), ("gs_cull_margin", 0.05))
+
+def render_size(scene):
+    """Final render resolution in pixels and the pixel aspect."""
+    r = scene.render
+    pct = r.resolution_percentage / 100.0
+    return (max(1, int(r.resolution_x * pct)), max(1, int(r.resolution_y * pct)),
+            r.pixel_aspect_x, r.pixel_aspect_y)
+
+
+def view_projection(scene, camera, depsgraph):
+    """Projection and world -> view matrices of `camera` at the scene render resolution."""
+    width, height, aspect_x, aspect_y = render_size(scene)
+    projection = np.array(camera.calc_matrix_camera(
+        depsgraph, x=width, y=height, scale_x=aspect_x, scale_y=aspect_y), dtype=np.float64)
+    view = np.linalg.inv(np.array(camera.matrix_world, dtype=np.float64))
+    return projection, view, width, height
+
+
+def visibility_mask(obj, scene, camera, depsgraph, min_pixels=0.5, min_opacity=0.02, margin=0.05):
+    """Boolean mask of the splats of `obj` that `camera` can see."""
+    mesh = obj.data
+    n = len(mesh.vertices)
+    positions = np.zeros(n * 3, dtype=np.float32)
+    mesh.vertices.foreach_get('co', positions)
+    positions = positions.reshape(n, 3).astype(np.float64)
+
+    scales = read_attribute(mesh, "scale", n)
+    if scales is None:
+        scales = np.full((n, 3), 0.01, dtype=np.float32)
+    opacities = SplatArrays.read_opacities(mesh, n)
+    if opacities is None:
+        opacities = np.ones(n, dtype=np.float32)
+
+    world = np.array(obj.matrix_world, dtype=np.float64)
+    projection, view, width, height = view_projection(scene, camera, depsgraph)
+    mvp = projection @ view @ world
+    clip = positions @ mvp[:3, :3].T + mvp[:3, 3]
+    w = positions @ mvp[3, :3] + mvp[3, 3]
+
+    # Splat radius in world units (object scale applied), then in clip units
+    object_scale = np.linalg.norm(world[:3, :3], axis=0).max()
+    radius = np.abs(scales).max(axis=1) * object_scale
+    rx = radius * abs(projection[0, 0])
+    ry = radius * abs(projection[1, 1])
+
+    pad = w * (1.0 + margin)
+    in_front = w > 1e-6
+    in_frustum = (
+        in_front
+        & (np.abs(clip[:, 0]) <= pad + rx)
+        & (np.abs(clip[:, 1]) <= pad + ry)
+        & (clip[:, 2] <= w)
+    )
+
+    # Projected diameter in pixels: NDC radius r*P00/w, NDC spans 2 over `width`
+    pixels = np.zeros(n)
+    np.divide(rx * width, w, out=pixels, where=in_front)
+
+    return in_frustum & (pixels >= min_pixels) & (opacities >= min_opacity)
+
+
+def write_mask(mesh, visible):
+    """Store the inverse of `visible` as the BOOLEAN point attribute gs_culled."""
+    attr = mesh.attributes.get(CULLED_ATTR)
+    if attr is not None and attr.data_type != 'BOOLEAN':
+        mesh.attributes.remove(attr)
+        attr = None
+    if attr is None:
+        attr = mesh.attributes.new(name=CULLED_ATTR, type='BOOLEAN', domain='POINT')
+    attr.data.foreach_set('value', ~visible)
+    mesh.update()
+
+
+def ensure_cull_filter_group():
+    """Local node group deleting points flagged in `gs_culled` (missing attribute = keep all)."""
+    group = bpy.data.node_groups.get(CULL_FILTER_NAME)
+    if group and not group.library:
+        return group
+
+    group = bpy.data.node_groups.new(CULL_FILTER_NAME, 'GeometryNodeTree')
+    group.interface.new_socket("Geometry", in_out='INPUT', socket_type='NodeSocketGeometry')
+    group.interface.new_socket("Geometry", in_out='OUTPUT', socket_type='NodeSocketGeometry')
+
+    nodes = group.nodes
+    links = group.links
+    group_in = nodes.new('NodeGroupInput')
+    group_in.location = (-400, 0)
+    group_out = nodes.new('NodeGroupOutput')
+    group_out.location = (300, 0)
+
+    culled = nodes.new('GeometryNodeInputNamedAttribute')
+    culled.data_type = 'BOOLEAN'
+    culled.inputs["Name"].default_value = CULLED_ATTR
+    culled.location = (-400, -200)
+
+    delete = nodes.new('GeometryNodeDeleteGeometry')
+    delete.domain = 'POINT'
+    delete.location = (0, 0)
+
+    links.new(group_in.outputs["Geometry"], delete.inputs["Geometry"])
+    links.new(culled.outputs["Attribute"], delete.inputs["Selection"])
+    links.new(delete.outputs["Geometry"], group_out.inputs["Geometry"])
+    return group
+
+
+def _move_modifier(obj, mod, index):
+    try:
+        obj.modifiers.move(list(obj.modifiers).index(mod), index)
+    except AttributeError:
+        with bpy.context.temp_override(object=obj):
+            bpy.ops.object.modifier_move_to_index(modifier=mod.name, index=index)
+
+
+def ensure_cull_modifier(obj):
+    """GS_CameraCull modifier placed directly before GS_Instancer."""
+    mod = obj.modifiers.get(CULL_FILTER_NAME)
+    if mod is None:
+        mod = obj.modifiers.new(CULL_FILTER_NAME, 'NODES')
+        mod.node_group = ensure_cull_filter_group()
+        instancer = obj.modifiers.get("GS_Instancer")
+        if instancer is not None:
+            _move_modifier(obj, mod, list(obj.modifiers).index(instancer))
+    return mod
+
+
+def culled_copy(obj, visible):
+    """New object with only the visible splats; shares material and modifiers' inputs."""
+    mesh = obj.data
+    n = len(mesh.vertices)
+    positions = np.zeros(n * 3, dtype=np.float32)
+    mesh.vertices.foreach_get('co', positions)
+
+    new_mesh = bpy.data.meshes.new(f"{mesh.name}_Culled")
+    new_mesh.from_pydata(positions.reshape(n, 3)[visible].tolist(), [], [])
+    new_mesh.update()
+
+    for attr in list(mesh.attributes):
+        if (attr.domain != 'POINT' or attr.name == "position" or attr.name.startswith('.')
+                or attr.name == CULLED_ATTR or attr.data_type not in ATTRIBUTE_LAYOUT):
+            continue
+        key = ATTRIBUTE_LAYOUT[attr.data_type][0]
+        data = read_attribute(mesh, attr.name, n)[visible]
+        new_attr = new_mesh.attributes.new(name=attr.name, type=attr.data_type, domain='POINT')
+        new_attr.data.foreach_set(key, data.reshape(-1))
+
+    for mat in mesh.materials:
+        new_mesh.materials.append(mat)
+
+    new_obj = bpy.data.objects.new(f"{obj.name}_Culled", new_mesh)
+    for coll in obj.users_collection:
+        coll.objects.link(new_obj)
+    new_obj.parent = obj.parent
+    new_obj.location = tuple(obj.location)
+    new_obj.rotation_euler = tuple(obj.rotation_euler)
+    new_obj.scale = tuple(obj.scale)
+
+    for mod in obj.modifiers:
+        if mod.type != 'NODES' or mod.name == CULL_FILTER_NAME:
+            continue
+        new_mod = new_obj.modifiers.new(mod.name, 'NODES')
+        new_mod.node_group = mod.node_group
+        new_mod.show_viewport = mod.show_viewport
+        new_mod.show_render = mod.show_render
+        for key in mod.keys():
+            new_mod[key] = mod[key]
+
+    # The full cloud stays in the file for later re-culls, but not in renders
+    obj.hide_render = True
+    return new_obj
+
+
+def cull_object(obj, scene, camera, depsgraph):
+    """Re-evaluate the MASK of an object using the settings stored on it."""
+    min_pixels, min_opacity, margin = (obj.get(key, default) for key, default in SETTINGS)
+    visible = visibility_mask(obj, scene, camera, depsgraph, min_pixels, min_opacity, margin)
+    write_mask(obj.data, visible)
+    return visible
+
+
+def update_per_frame(scene, depsgraph=None):
+    """
+    frame_change_post: re-cull every object flagged for per-frame evaluation.
+    Runs after the new frame is evaluated, so an animated camera is culled
+    with its pose at that frame rather than the previous one.
+    """
+    camera = scene.camera
+    if camera is None:
+        return
+    if depsgraph is None:
+        depsgraph = bpy.context.evaluated_depsgraph_get()
+    for obj in scene.objects:
+        if obj.type == 'MESH' and obj.get(PER_FRAME_KEY):
+            cull_object(obj, scene, camera, depsgraph)
@@ -0,0 +1,703 @@
+import os
+import json
+import zlib
+import struct
+import numpy as np
+
+# ==============================================================================
+#  DIRECT EXPORT (NumPy realization, no Geometry Nodes evaluation)
+# ==============================================================================
+# Rebuilds what GS_Instancer produces: the template brush mesh, scaled by the
+# per-splat `scale`, rotated by the splat quaternion and moved to its position.
+# Brush UVs are copied to UV0 and the palette lookup (`palette_uv`) to UV1
+# ("ColUV"), or the per-splat `color` attribute to vertex colours. Instances
+# are processed in fixed-size chunks and streamed to disk, so time and memory
+# stay linear in the splat count.
+
+CHUNK_SIZE = 65536
+PALETTE_SIZE = 256      # GS_Processor.PALETTE_SIZE, decodes `palette_index`
+OPACITY_SCALE = 127.0   # `opacity_q` (INT8) = round(opacity * 127)
+COLOR_ATTRIBUTE = "color"   # GS_Processor.COLOR_ATTRIBUTE, sRGB BYTE_COLOR (texture-free mode)
+
+# foreach_get/set key, width and dtype per point attribute type
+ATTRIBUTE_LAYOUT = {
+    'FLOAT': ('value', 1, np.float32),
+    'INT': ('value', 1, np.int32),
+    'INT8': ('value', 1, np.int8),
+    'BOOLEAN': ('value', 1, bool),
+    'FLOAT2': ('vector', 2, np.float32),
+    'FLOAT_VECTOR': ('vector', 3, np.float32),
+    'QUATERNION': ('value', 4, np.float32),
+    'FLOAT_COLOR': ('color', 4, np.float32),
+    'BYTE_COLOR': ('color', 4, np.float32),
+}
+
+# Blender Z-up -> glTF/OBJ Y-up (x, y, z) -> (x, z, -y)
+AXIS_Z_UP_TO_Y_UP = np.array([
+    [1.0, 0.0, 0.0, 0.0],
+    [0.0, 0.0, 1.0, 0.0],
+    [0.0, -1.0, 0.0, 0.0],
+    [0.0, 0.0, 0.0, 1.0],
+])
+
+
+# ------------------------------------------------------------------------------
+#  Math
+# ------------------------------------------------------------------------------
+
+def normalize_quats(quats):
+    norms = np.linalg.norm(quats, axis=1, keepdims=True)
+    return quats / np.maximum(norms, 1e-8)
+
+
+def quat_rotate(quats, vectors):
+    """Rotate vectors (n, k, 3) by unit quaternions (n, 4) in (w, x, y, z) order."""
+    w = quats[:, None, 0:1]
+    u = np.broadcast_to(quats[:, None, 1:4], vectors.shape)
+    t = 2.0 * np.cross(u, vectors)
+    return vectors + w * t + np.cross(u, t)
+
+
+# ------------------------------------------------------------------------------
+#  Source data
+# ------------------------------------------------------------------------------
+
+def read_attribute(mesh, name, n):
+    """Point attribute as an (n,) or (n, width) array, None if missing or unsupported."""
+    attr = mesh.attributes.get(name)
+    if attr is None or attr.data_type not in ATTRIBUTE_LAYOUT:
+        return None
+    key, width, dtype = ATTRIBUTE_LAYOUT[attr.data_type]
+    data = np.zeros(n * width, dtype=dtype)
+    attr.data.foreach_get(key, data)
+    return data.reshape(n, width) if width > 1 else data
+
+
+class BrushTemplate:
+    """Template brush mesh split per face corner (UVs live on corners)."""
+
+    def __init__(self, corners, normals, uvs, triangles):
+        self.corners = np.asarray(corners, dtype=np.float32).reshape(-1, 3)
+        self.normals = np.asarray(normals, dtype=np.float32).reshape(-1, 3)
+        self.uvs = np.asarray(uvs, dtype=np.float32).reshape(-1, 2)
+        self.triangles = np.asarray(triangles, dtype=np.uint32).reshape(-1, 3)
+
+    @classmethod
+    def from_mesh(cls, mesh, uv_name="UVMap"):
+        n_verts = len(mesh.vertices)
+        co = np.zeros(n_verts * 3, dtype=np.float32)
+        mesh.vertices.foreach_get('co', co)
+
+        n_loops = len(mesh.loops)
+        loop_verts = np.zeros(n_loops, dtype=np.int32)
+        mesh.loops.foreach_get('vertex_index', loop_verts)
+
+        mesh.calc_loop_triangles()
+        tris = np.zeros(len(mesh.loop_triangles) * 3, dtype=np.int32)
+        mesh.loop_triangles.foreach_get('loops', tris)
+
+        normals = np.zeros(n_loops * 3, dtype=np.float32)
+        mesh.corner_normals.foreach_get('vector', normals)
+
+        uvs = np.zeros(n_loops * 2, dtype=np.float32)
+        uv_layer = mesh.uv_layers.get(uv_name) or mesh.uv_layers.active
+        if uv_layer:
+            uv_layer.data.foreach_get('uv', uvs)
+
+        return cls(co.reshape(-1, 3)[loop_verts], normals, uvs, tris)
+
+
+class SplatArrays:
+    """Per-splat arrays as written by GS_Processor.process_and_bake."""
+
+    def __init__(self, positions, scales, quats, palette_uv, opacities=None, colors=None):
+        self.positions = positions
+        self.scales = scales
+        self.quats = quats
+        self.palette_uv = palette_uv
+        self.opacities = opacities if opacities is not None else np.ones(len(positions), dtype=np.float32)
+        self.colors = colors    # (n, 4) sRGB uint8, only in the colour attribute mode
+
+    def __len__(self):
+        return len(self.positions)
+
+    def subset(self, indices):
+        return SplatArrays(self.positions[indices], self.scales[indices], self.quats[indices],
+                           self.palette_uv[indices], self.opacities[indices],
+                           self.colors[indices] if self.colors is not None else None)
+
+    @staticmethod
+    def concatenate(parts):
+        if len(parts) == 1:
+            return parts[0]
+        colors = [p.colors for p in parts]
+        return SplatArrays(*(np.concatenate([getattr(p, key) for p in parts])
+                             for key in ("positions", "scales", "quats", "palette_uv", "opacities")),
+                           np.concatenate(colors) if all(c is not None for c in colors) else None)
+
+    @staticmethod
+    def read_opacities(mesh, n):
+        """Opacity from any attribute schema (float `opacity` or INT8 `opacity_q`)."""
+        opacities = read_attribute(mesh, "opacity", n)
+        if opacities is None:
+            quantized = read_attribute(mesh, "opacity_q", n)
+            if quantized is not None:
+                opacities = quantized.astype(np.float32) / OPACITY_SCALE
+        return opacities
+
+    @staticmethod
+    def read_colors(mesh, n):
+        """sRGB uint8 (n, 4) from the BYTE_COLOR `color` attribute, None if missing."""
+        attr = mesh.attributes.get(COLOR_ATTRIBUTE)
+        if attr is None or attr.data_type != 'BYTE_COLOR':
+            return None
+        rgba = np.zeros(n * 4, dtype=np.float32)
+        attr.data.foreach_get('color_srgb', rgba)
+        return (np.clip(rgba, 0.0, 1.0) * 255.0 + 0.5).astype(np.uint8).reshape(n, 4)
+
+    @classmethod
+    def from_mesh(cls, mesh):
+        n = len(mesh.vertices)
+        positions = np.zeros(n * 3, dtype=np.float32)
+        mesh.vertices.foreach_get('co', positions)
+
+        scales = read_attribute(mesh, "scale", n)
+        if scales is None:
+            scales = np.full((n, 3), 0.01, dtype=np.float32)
+
+        # Lean schemas store a native (w, x, y, z) QUATERNION; the full schema
+        # stores it as quatxyz=(w, x, y), quatw=z
+        quats = read_attribute(mesh, "rotation", n)
+        if quats is None:
+            quats = np.zeros((n, 4), dtype=np.float32)
+            quats[:, 0] = 1.0
+            q3 = read_attribute(mesh, "quatxyz", n)
+            q1 = read_attribute(mesh, "quatw", n)
+            if q3 is not None and q1 is not None:
+                quats[:, :3] = q3
+                quats[:, 3] = q1
+
+        # FLOAT_VECTOR (full), FLOAT2 (lean) or an INT palette index (compact)
+        palette_uv = read_attribute(mesh, "palette_uv", n)
+        if palette_uv is None:
+            palette_uv = np.zeros((n, 2), dtype=np.float32)
+            index = read_attribute(mesh, "palette_index", n)
+            if index is not None:
+                palette_uv[:, 0] = ((index % PALETTE_SIZE) + 0.5) / PALETTE_SIZE
+                palette_uv[:, 1] = ((index // PALETTE_SIZE) + 0.5) / PALETTE_SIZE
+
+        opacities = cls.read_opacities(mesh, n)
+
+        return cls(positions.reshape(n, 3), scales, normalize_quats(quats),
+                   np.ascontiguousarray(palette_uv[:, :2]), opacities, cls.read_colors(mesh, n))
+
+
+# ------------------------------------------------------------------------------
+#  Realization
+# ------------------------------------------------------------------------------
+
+def realize_chunk(template, splats, start, stop, matrix):
+    """
+    Realize instances [start, stop) into flat per-corner arrays.
+    Returns positions (m, 3), normals (m, 3), brush UVs (m, 2), palette UVs (m, 2),
+    triangle indices local to the chunk (t, 3) and sRGB uint8 colours (m, 4) or None.
+    """
+    n = stop - start
+    k = len(template.corners)
+    scales = splats.scales[start:stop, None, :]
+    quats = splats.quats[start:stop]
+
+    local = template.corners[None, :, :] * scales
+    world = quat_rotate(quats, local) + splats.positions[start:stop, None, :]
+
+    # Normals transform with the inverse scale
+    nrm = quat_rotate(quats, template.normals[None, :, :] / np.maximum(np.abs(scales), 1e-12))
+
+    m3 = matrix[:3, :3]
+    positions = world.reshape(-1, 3) @ m3.T + matrix[:3, 3]
+    normals = nrm.reshape(-1, 3) @ np.linalg.inv(m3)
+    normals /= np.maximum(np.linalg.norm(normals, axis=1, keepdims=True), 1e-12)
+
+    uv0 = np.broadcast_to(template.uvs[None], (n, k, 2)).reshape(-1, 2)
+    uv1 = np.repeat(splats.palette_uv[start:stop], k, axis=0)
+
+    offsets = (np.arange(n, dtype=np.uint32) * k)[:, None, None]
+    triangles = (template.triangles[None] + offsets).reshape(-1, 3)
+
+    colors = None
+    if splats.colors is not None:
+        colors = np.repeat(splats.colors[start:stop], k, axis=0)
+
+    return (positions.astype(np.float32), normals.astype(np.float32),
+            uv0.astype(np.float32), uv1.astype(np.float32), triangles, colors)
+
+
+def iter_chunks(template, splats, matrix, chunk_size=CHUNK_SIZE):
+    for start in range(0, len(splats), chunk_size):
+        stop = min(start + chunk_size, len(splats))
+        yield start, stop, realize_chunk(template, splats, start, stop, matrix)
+
+
+# ------------------------------------------------------------------------------
+#  PNG (palette texture)
+# ------------------------------------------------------------------------------
+
+def encode_png(rgba, indexed=False):
+    """
+    Encode an (h, w, 4) uint8 array as PNG bytes, top row first.
+    With `indexed`, images of at most 256 colours are written palette-indexed
+    (1 byte per pixel) and other opaque images as 8-bit RGB.
+    """
+    h, w = rgba.shape[:2]
+    color_type, data, extra = 6, rgba.reshape(h, w * 4), b""
+
+    if indexed:
+        keys = np.ascontiguousarray(rgba).view(np.uint32).reshape(-1)
+        unique, inverse = np.unique(keys, return_inverse=True)
+        opaque = bool((rgba[..., 3] == 255).all())
+        if len(unique) <= 256:
+            colors = unique.view(np.uint8).reshape(-1, 4)
+            color_type, data = 3, inverse.astype(np.uint8).reshape(h, w)
+            extra = _png_chunk(b"PLTE", colors[:, :3].tobytes())
+            if not opaque:
+                extra += _png_chunk(b"tRNS", colors[:, 3].tobytes())
+        elif opaque:
+            color_type, data = 2, rgba[..., :3].reshape(h, w * 3)
+
+    raw = np.zeros((h, data.shape[1] + 1), dtype=np.uint8)
+    raw[:, 1:] = data
+
+    return (b"\x89PNG\r\n\x1a\n"
+            + _png_chunk(b"IHDR", struct.pack(">IIBBBBB", w, h, 8, color_type, 0, 0, 0))
+            + extra
+            + _png_chunk(b"IDAT", zlib.compress(raw.tobytes(), 6))
+            + _png_chunk(b"IEND", b""))
+
+
+def _png_chunk(tag, data):
+    body = tag + data
+    return struct.pack(">I", len(data)) + body + struct.pack(">I", zlib.crc32(body) & 0xFFFFFFFF)
+
+
+def image_to_rgba8(image):
+    """Blender image pixels (bottom row first, float) -> (h, w, 4) uint8, top row first."""
+    w, h = image.size
+    pixels = np.zeros(w * h * 4, dtype=np.float32)
+    image.pixels.foreach_get(pixels)
+    rgba = (np.clip(pixels, 0.0, 1.0) * 255.0 + 0.5).astype(np.uint8).reshape(h, w, 4)
+    return rgba[::-1]
+
+
+# ------------------------------------------------------------------------------
+#  Writers
+# ------------------------------------------------------------------------------
+
+def _pad4(n):
+    return (n + 3) & ~3
+
+
+# glTF componentType / target enums
+FLOAT = 5126
+UNSIGNED_INT = 5125
+UNSIGNED_SHORT = 5123
+SHORT = 5122
+UNSIGNED_BYTE = 5121
+ARRAY_BUFFER = 34962
+ELEMENT_ARRAY_BUFFER = 34963
+
+
+class GLBFile:
+    """
+    Binary glTF whose BIN chunk regions are allocated up front.
+    Arrays are written into their region in any order (so data can be streamed
+    chunk by chunk); the JSON chunk is reserved at the start of the file and
+    filled in on close().
+    """
+    JSON_RESERVE = 8192
+
+    def __init__(self, filepath, regions):
+        """regions: list of (key, byte_size)."""
+        self.f = open(filepath, 'wb')
+        self.regions = {}
+        offset = 0
+        for key, size in regions:
+            self.regions[key] = (offset, size)
+            offset += _pad4(size)
+        self.bin_length = offset
+        self.bin_start = 12 + 8 + self.JSON_RESERVE + 8
+        self.buffer_views = []
+        self.accessors = []
+
+        # Reserve header + JSON, write BIN chunk header
+        self.f.write(b"\0" * (12 + 8 + self.JSON_RESERVE))
+        self.f.write(struct.pack("<I4s", self.bin_length, b"BIN\0"))
+        self.f.truncate(self.bin_start + self.bin_length)
+
+    def put(self, key, byte_offset, data):
+        region_offset, size = self.regions[key]
+        payload = data if isinstance(data, bytes) else np.ascontiguousarray(data).tobytes()
+        if byte_offset + len(payload) > size:
+            raise ValueError(f"Data overflows GLB region '{key}'")
+        self.f.seek(self.bin_start + region_offset + byte_offset)
+        self.f.write(payload)
+
+    def add_view(self, key, target=None):
+        offset, size = self.regions[key]
+        view = {"buffer": 0, "byteOffset": offset, "byteLength": size}
+        if target:
+            view["target"] = target
+        self.buffer_views.append(view)
+        return len(self.buffer_views) - 1
+
+    def add_accessor(self, key, component_type, kind, count, target=None,
+                     normalized=False, minmax=None):
+        accessor = {"bufferView": self.add_view(key, target), "componentType": component_type,
+                    "count": count, "type": kind}
+        if normalized:
+            accessor["normalized"] = True
+        if minmax is not None:
+            accessor["min"] = [float(v) for v in minmax[0]]
+            accessor["max"] = [float(v) for v in minmax[1]]
+        self.accessors.append(accessor)
+        return len(self.accessors) - 1
+
+    def close(self, gltf):
+        gltf["buffers"] = [{"byteLength": self.bin_length}]
+        gltf["bufferViews"] = self.buffer_views
+        gltf["accessors"] = self.accessors
+
+        payload = json.dumps(gltf, separators=(",", ":")).encode('utf-8')
+        if len(payload) > self.JSON_RESERVE:
+            self.f.close()
+            raise RuntimeError("glTF JSON exceeds reserved header space")
+        payload += b" " * (self.JSON_RESERVE - len(payload))
+
+        self.f.seek(0)
+        self.f.write(struct.pack("<4sII", b"glTF", 2, self.bin_start + self.bin_length))
+        self.f.write(struct.pack("<I4s", self.JSON_RESERVE, b"JSON"))
+        self.f.write(payload)
+        self.f.close()
+
+
+def _palette_texture(glb, gltf, palette_png):
+    """Embed the palette PNG (bytes) or reference it by relative uri (str); returns the texture index."""
+    if isinstance(palette_png, str):
+        gltf["images"] = [{"uri": palette_png, "name": "Palette"}]
+    else:
+        glb.put("palette", 0, palette_png)
+        gltf["images"] = [{"bufferView": glb.add_view("palette"), "mimeType": "image/png", "name": "Palette"}]
+    # NEAREST filtering: the palette is a lookup table
+    gltf["samplers"] = [{"magFilter": 9728, "minFilter": 9728, "wrapS": 33071, "wrapT": 33071}]
+    gltf["textures"] = [{"source": 0, "sampler": 0}]
+    return 0
+
+
+def srgb_to_linear(srgb):
+    """sRGB values in [0, 1] -> linear (glTF COLOR_0 is linear)."""
+    return np.where(srgb <= 0.04045, srgb / 12.92, ((srgb + 0.055) / 1.055) ** 2.4)
+
+
+def _material():
+    return {"name": "GS_Painted", "doubleSided": True,
+            "pbrMetallicRoughness": {"metallicFactor": 0.0, "roughnessFactor": 0.4}}
+
+
+class GLBWriter:
+    """Streams realized chunks into a binary glTF (one fully realized mesh)."""
+
+    def __init__(self, filepath, n_instances, template, palette_png=None, colors=False):
+        self.n_corners = n_instances * len(template.corners)
+        self.n_indices = n_instances * len(template.triangles) * 3
+        self.palette_png = palette_png
+        self.colors = colors
+        regions = [
+            ("POSITION", self.n_corners * 12),
+            ("NORMAL", self.n_corners * 12),
+            ("TEXCOORD_0", self.n_corners * 8),
+            ("TEXCOORD_1", self.n_corners * 8),
+            ("indices", self.n_indices * 4),
+        ]
+        if colors:
+            # Linear RGBA as normalized UNSIGNED_SHORT (8-bit linear would band in the darks)
+            regions.append(("COLOR_0", self.n_corners * 8))
+        if palette_png:
+            regions.append(("palette", len(palette_png)))
+        self.glb = GLBFile(filepath, regions)
+        self.pos_min = np.full(3, np.inf)
+        self.pos_max = np.full(3, -np.inf)
+
+    def write_chunk(self, corner_start, index_start, positions, normals, uv0, uv1, triangles, colors=None):
+        self.pos_min = np.minimum(self.pos_min, positions.min(axis=0))
+        self.pos_max = np.maximum(self.pos_max, positions.max(axis=0))
+        # glTF UV origin is top-left
+        uv0 = uv0.copy()
+        uv0[:, 1] = 1.0 - uv0[:, 1]
+        uv1 = uv1.copy()
+        uv1[:, 1] = 1.0 - uv1[:, 1]
+        self.glb.put("POSITION", corner_start * 12, positions)
+        self.glb.put("NORMAL", corner_start * 12, normals)
+        self.glb.put("TEXCOORD_0", corner_start * 8, uv0)
+        self.glb.put("TEXCOORD_1", corner_start * 8, uv1)
+        self.glb.put("indices", index_start * 4, (triangles + np.uint32(corner_start)).astype(np.uint32))
+        if self.colors and colors is not None:
+            linear = srgb_to_linear(colors.astype(np.float32) / 255.0)
+            self.glb.put("COLOR_0", corner_start * 8, np.round(linear * 65535.0).astype(np.uint16))
+
+    def close(self):
+        glb = self.glb
+        minmax = (self.pos_min, self.pos_max) if self.n_corners else None
+        attributes = {
+            "POSITION": glb.add_accessor("POSITION", FLOAT, "VEC3", self.n_corners, ARRAY_BUFFER, minmax=minmax),
+            "NORMAL": glb.add_accessor("NORMAL", FLOAT, "VEC3", self.n_corners, ARRAY_BUFFER),
+            "TEXCOORD_0": glb.add_accessor("TEXCOORD_0", FLOAT, "VEC2", self.n_corners, ARRAY_BUFFER),
+            "TEXCOORD_1": glb.add_accessor("TEXCOORD_1", FLOAT, "VEC2", self.n_corners, ARRAY_BUFFER),
+        }
+        if self.colors:
+            attributes["COLOR_0"] = glb.add_accessor("COLOR_0", UNSIGNED_SHORT, "VEC4", self.n_corners,
+                                                     ARRAY_BUFFER, normalized=True)
+        indices = glb.add_accessor("indices", UNSIGNED_INT, "SCALAR", self.n_indices, ELEMENT_ARRAY_BUFFER)
+
+        material = _material()
+        gltf = {
+            "asset": {"version": "2.0", "generator": "3DGS Oil Paint direct exporter"},
+            "scene": 0,
+            "scenes": [{"nodes": [0]}],
+            "nodes": [{"mesh": 0, "name": "GS_Painted"}],
+            "meshes": [{"primitives": [{"attributes": attributes, "indices": indices, "material": 0}]}],
+            "materials": [material],
+        }
+        if self.palette_png:
+            texture = _palette_texture(glb, gltf, self.palette_png)
+            material["pbrMetallicRoughness"]["baseColorTexture"] = {"index": texture, "texCoord": 1}
+        glb.close(gltf)
+
+
+def write_instanced_glb(filepath, template, splats, matrix, palette_png=None,
+                        compact=True, chunk_size=CHUNK_SIZE):
+    """
+    Write one brush mesh plus per-splat TRANSLATION / ROTATION / SCALE through
+    EXT_mesh_gpu_instancing, and the palette lookup as the custom instance
+    attribute `_PALETTE_UV`. `matrix` goes on a parent node, so instance data
+    stays in object space. `palette_png` is PNG bytes to embed or a uri.
+    With `compact`, ROTATION is stored as normalized SHORT and `_PALETTE_UV`
+    as normalized UNSIGNED_SHORT (36 instead of 48 bytes per splat).
+    Splats with `colors` write them as `_COLOR` (sRGB normalized UNSIGNED_BYTE)
+    instead of `_PALETTE_UV`.
+    Returns the instance data size in bytes.
+    """
+    n = len(splats)
+    k = len(template.corners)
+    rot_bytes = 8 if compact else 16
+    has_colors = splats.colors is not None
+    uv_bytes = 4 if (compact or has_colors) else 8
+    uv_key = "_COLOR" if has_colors else "_PALETTE_UV"
+    regions = [
+        ("POSITION", k * 12),
+        ("NORMAL", k * 12),
+        ("TEXCOORD_0", k * 8),
+        ("indices", len(template.triangles) * 12),
+        ("TRANSLATION", n * 12),
+        ("ROTATION", n * rot_bytes),
+        ("SCALE", n * 12),
+        (uv_key, n * uv_bytes),
+    ]
+    if isinstance(palette_png, bytes):
+        regions.append(("palette", len(palette_png)))
+    glb = GLBFile(filepath, regions)
+
+    uv0 = template.uvs.copy()
+    uv0[:, 1] = 1.0 - uv0[:, 1]
+    glb.put("POSITION", 0, template.corners)
+    glb.put("NORMAL", 0, template.normals)
+    glb.put("TEXCOORD_0", 0, uv0)
+    glb.put("indices", 0, template.triangles.astype(np.uint32))
+
+    for start in range(0, n, chunk_size):
+        stop = min(start + chunk_size, n)
+        # glTF rotation order is (x, y, z, w)
+        rot = splats.quats[start:stop][:, [1, 2, 3, 0]]
+        uv = splats.palette_uv[start:stop].copy()
+        uv[:, 1] = 1.0 - uv[:, 1]
+        if compact:
+            rot = np.round(np.clip(rot, -1.0, 1.0) * 32767.0).astype(np.int16)
+            uv = np.round(np.clip(uv, 0.0, 1.0) * 65535.0).astype(np.uint16)
+        else:
+            rot = rot.astype(np.float32)
+            uv = uv.astype(np.float32)
+        if has_colors:
+            uv = splats.colors[start:stop]
+        glb.put("TRANSLATION", start * 12, splats.positions[start:stop].astype(np.float32))
+        glb.put("ROTATION", start * rot_bytes, rot)
+        glb.put("SCALE", start * 12, splats.scales[start:stop].astype(np.float32))
+        glb.put(uv_key, start * uv_bytes, uv)
+
+    minmax = (template.corners.min(axis=0), template.corners.max(axis=0)) if k else None
+    attributes = {
+        "POSITION": glb.add_accessor("POSITION", FLOAT, "VEC3", k, ARRAY_BUFFER, minmax=minmax),
+        "NORMAL": glb.add_accessor("NORMAL", FLOAT, "VEC3", k, ARRAY_BUFFER),
+        "TEXCOORD_0": glb.add_accessor("TEXCOORD_0", FLOAT, "VEC2", k, ARRAY_BUFFER),
+    }
+    indices = glb.add_accessor("indices", UNSIGNED_INT, "SCALAR", len(template.triangles) * 3,
+                               ELEMENT_ARRAY_BUFFER)
+    instancing = {
+        "TRANSLATION": glb.add_accessor("TRANSLATION", FLOAT, "VEC3", n),
+        "ROTATION": glb.add_accessor("ROTATION", SHORT if compact else FLOAT, "VEC4", n,
+                                     normalized=compact),
+        "SCALE": glb.add_accessor("SCALE", FLOAT, "VEC3", n),
+    }
+    if has_colors:
+        instancing["_COLOR"] = glb.add_accessor("_COLOR", UNSIGNED_BYTE, "VEC4", n, normalized=True)
+    else:
+        instancing["_PALETTE_UV"] = glb.add_accessor("_PALETTE_UV", UNSIGNED_SHORT if compact else FLOAT,
+                                                     "VEC2", n, normalized=compact)
+
+    material = _material()
+    gltf = {
+        "asset": {"version": "2.0", "generator": "3DGS Oil Paint direct exporter"},
+        "extensionsUsed": ["EXT_mesh_gpu_instancing"],
+        "scene": 0,
+        "scenes": [{"nodes": [0]}],
+        "nodes": [
+            {"name": "GS_Painted", "matrix": [float(v) for v in np.asarray(matrix).T.reshape(-1)],
+             "children": [1]},
+            {"name": "GS_Strokes", "mesh": 0,
+             "extensions": {"EXT_mesh_gpu_instancing": {"attributes": instancing}}},
+        ],
+        "meshes": [{"primitives": [{"attributes": attributes, "indices": indices, "material": 0}]}],
+        "materials": [material],
+    }
+    if has_colors:
+        material["extras"] = {"color_attribute": "_COLOR", "color_space": "sRGB"}
+    elif palette_png:
+        # Standard materials cannot read per-instance UVs: the palette is
+        # sampled with `_PALETTE_UV` by the engine-side shader
+        texture = _palette_texture(glb, gltf, palette_png)
+        material["extras"] = {"palette_texture": texture, "palette_uv_attribute": "_PALETTE_UV"}
+    glb.close(gltf)
+    return n * (12 + rot_bytes + 12 + uv_bytes)
+
+
+class OBJWriter:
+    """
+    Streams realized chunks as OBJ text. OBJ has a single UV set, so the brush
+    UVs are written as `vt` and the splat or palette colour (if given) as vertex colour.
+    """
+
+    def __init__(self, filepath, palette_rgba=None):
+        self.f = open(filepath, 'w', newline="\n")
+        self.palette = palette_rgba
+        self.written = 0
+        self.f.write("# 3DGS Oil Paint direct export\no GS_Painted\n")
+
+    def write_chunk(self, corner_start, index_start, positions, normals, uv0, uv1, triangles, colors=None):
+        if colors is not None or self.palette is not None:
+            if colors is not None:
+                rgb = colors[:, :3] / 255.0
+            else:
+                h, w = self.palette.shape[:2]
+                px = np.clip((uv1[:, 0] * w).astype(np.int32), 0, w - 1)
+                py = np.clip(((1.0 - uv1[:, 1]) * h).astype(np.int32), 0, h - 1)
+                rgb = self.palette[py, px, :3] / 255.0
+            np.savetxt(self.f, np.hstack((positions, rgb)), fmt="v %.6f %.6f %.6f %.4f %.4f %.4f")
+        else:
+            np.savetxt(self.f, positions, fmt="v %.6f %.6f %.6f")
+        np.savetxt(self.f, uv0, fmt="vt %.6f %.6f")
+        np.savetxt(self.f, normals, fmt="vn %.4f %.4f %.4f")
+        idx = (triangles.astype(np.int64) + corner_start + 1).repeat(3, axis=1)
+        np.savetxt(self.f, idx, fmt="f %d/%d/%d %d/%d/%d %d/%d/%d")
+        self.written += len(positions)
+
+    def close(self):
+        self.f.close()
+
+
+# ------------------------------------------------------------------------------
+#  Entry point
+# ------------------------------------------------------------------------------
+
+def find_instance_object(obj):
+    mod = obj.modifiers.get("GS_Instancer")
+    if not mod or not mod.node_group:
+        return None
+    for item in mod.node_group.interface.items_tree:
+        if item.name == "instance" and item.bl_socket_idname == 'NodeSocketObject':
+            return mod.get(item.identifier)
+    return None
+
+
+def find_palette_image(obj):
+    for mat in obj.data.materials:
+        if mat and mat.use_nodes:
+            node = mat.node_tree.nodes.get("Image Texture")
+            if node and node.image:
+                return node.image
+    return None
+
+
+def merged_splats(objects):
+    """
+    The brush template, splats and palette image of imported GS objects, the
+    splats of all of them in one SplatArrays (the spatial chunks of an import
+    share brush, palette and transform). Raises ValueError if they differ.
+    """
+    obj = objects[0]
+    inst_obj = find_instance_object(obj)
+    if not inst_obj or inst_obj.type != 'MESH':
+        raise ValueError("GS_Instancer has no brush mesh assigned to 'instance'")
+    palette_img = find_palette_image(obj)
+    world = np.array(obj.matrix_world, dtype=np.float64)
+    for other in objects[1:]:
+        if find_instance_object(other) != inst_obj or find_palette_image(other) != palette_img:
+            raise ValueError(f"'{other.name}' uses another brush or palette than '{obj.name}'")
+        if not np.allclose(np.array(other.matrix_world, dtype=np.float64), world):
+            raise ValueError(f"'{other.name}' is not placed like '{obj.name}'")
+
+    splats = SplatArrays.concatenate([SplatArrays.from_mesh(o.data) for o in objects])
+    return BrushTemplate.from_mesh(inst_obj.data), splats, palette_img
+
+
+def export_painted_mesh(objects, filepath, chunk_size=CHUNK_SIZE, apply_transform=True,
+                        instanced=False, compact=True):
+    """
+    Export the painted geometry of imported GS objects (e.g. all spatial
+    chunks of an import) to one .glb or .obj.
+    With `instanced` (GLB only) the brush mesh is written once and every splat
+    becomes a GPU instance (EXT_mesh_gpu_instancing).
+    Returns a dict with instance/vertex/triangle counts.
+    """
+    ext = os.path.splitext(filepath)[1].lower()
+    if ext not in ('.glb', '.obj'):
+        raise ValueError(f"Unsupported export format '{ext}' (use .glb or .obj)")
+
+    template, splats, palette_img = merged_splats(objects)
+
+    matrix = np.array(objects[0].matrix_world, dtype=np.float64) if apply_transform else np.eye(4)
+    matrix = AXIS_Z_UP_TO_Y_UP @ matrix
+
+    palette_rgba = image_to_rgba8(palette_img) if palette_img else None
+
+    k = len(template.corners)
+    t = len(template.triangles)
+
+    if instanced:
+        if ext != '.glb':
+            raise ValueError("GPU instancing is only supported for .glb")
+        write_instanced_glb(filepath, template, splats, matrix,
+                            encode_png(palette_rgba) if palette_rgba is not None else None,
+                            compact=compact, chunk_size=chunk_size)
+        return {"instances": len(splats), "vertices": k, "triangles": t}
+
+    if ext == '.glb':
+        writer = GLBWriter(filepath, len(splats), template,
+                           encode_png(palette_rgba) if palette_rgba is not None else None,
+                           colors=splats.colors is not None)
+    else:
+        writer = OBJWriter(filepath, palette_rgba)
+
+    try:
+        for start, stop, arrays in iter_chunks(template, splats, matrix, chunk_size):
+            writer.write_chunk(start * k, start * t * 3, *arrays)
+    finally:
+        writer.close()
+
+    return {"instances": len(splats), "vertices": len(splats) * k, "triangles": len(splats) * t}
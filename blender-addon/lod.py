@@ -0,0 +1,193 @@
+import os
+import json
+import numpy as np
+
+from .export import (
+    SplatArrays, AXIS_Z_UP_TO_Y_UP, encode_png, image_to_rgba8, merged_splats,
+    write_instanced_glb,
+)
+
+# ==============================================================================
+#  HIERARCHICAL LOD EXPORT (3D Tiles 1.1, glTF tile content)
+# ==============================================================================
+# The splats are partitioned into an octree. Leaf tiles hold their splats at
+# full detail; every parent holds a merged version of everything below it,
+# clustered on a GRID_RESOLUTION^3 grid over the tile, so a parent never holds
+# more than GRID_RESOLUTION^3 strokes. Tiles use REPLACE refinement and carry
+# the clustering cell diagonal as geometric error, so viewers only fetch and
+# draw the tiles whose error is visible at the current distance.
+
+MAX_POINTS_PER_TILE = 65536
+GRID_RESOLUTION = 32
+MAX_DEPTH = 10
+
+
+class Tile:
+    def __init__(self, tile_id, level, bmin, size, indices):
+        self.id = tile_id
+        self.level = level
+        self.bmin = bmin
+        self.size = size
+        self.indices = indices
+        self.children = []
+
+    @property
+    def center(self):
+        return self.bmin + self.size * 0.5
+
+    @property
+    def is_leaf(self):
+        return not self.children
+
+
+def build_octree(positions, max_points=MAX_POINTS_PER_TILE, max_depth=MAX_DEPTH):
+    """Split the splats into a cubic octree; returns the root Tile."""
+    bmin = positions.min(axis=0).astype(np.float64)
+    size = float(np.max(positions.max(axis=0) - bmin)) or 1.0
+    root = Tile("0", 0, bmin, size, np.arange(len(positions)))
+
+    stack = [root]
+    while stack:
+        tile = stack.pop()
+        if len(tile.indices) <= max_points or tile.level >= max_depth:
+            continue
+
+        pos = positions[tile.indices]
+        half = tile.size * 0.5
+        octant = ((pos >= tile.bmin + half) * np.array([1, 2, 4])).sum(axis=1)
+        order = np.argsort(octant, kind='stable')
+        counts = np.bincount(octant, minlength=8)
+        splits = np.split(tile.indices[order], np.cumsum(counts)[:-1])
+
+        for i, child_indices in enumerate(splits):
+            if len(child_indices) == 0:
+                continue
+            offset = np.array([i & 1, (i >> 1) & 1, (i >> 2) & 1]) * half
+            child = Tile(f"{tile.id}{i}", tile.level + 1, tile.bmin + offset, half, child_indices)
+            tile.children.append(child)
+            stack.append(child)
+        tile.indices = None if tile.children else tile.indices
+    return root
+
+
+def collect_indices(tile):
+    if tile.is_leaf:
+        return tile.indices
+    return np.concatenate([collect_indices(c) for c in tile.children])
+
+
+def merge_splats(splats, bmin, cell, resolution):
+    """
+    Cluster splats on a grid of `cell` size and merge each cluster into one stroke:
+    - position: weighted mean (weight = opacity * stroke area)
+    - scale: moment matched, sqrt(mean(scale^2) + positional variance)
+    - rotation / palette or attribute colour: taken from the heaviest splat of the cluster
+    - opacity: maximum of the cluster
+    """
+    pos = splats.positions.astype(np.float64)
+    cells = np.clip(((pos - bmin) / cell).astype(np.int64), 0, resolution - 1)
+    keys = (cells[:, 2] * resolution + cells[:, 1]) * resolution + cells[:, 0]
+    _, inverse = np.unique(keys, return_inverse=True)
+    inverse = inverse.reshape(-1)
+    n_groups = int(inverse.max()) + 1 if len(inverse) else 0
+
+    scales = splats.scales.astype(np.float64)
+    weights = splats.opacities.astype(np.float64) * np.sqrt(np.prod(np.abs(scales), axis=1)) ** (4.0 / 3.0)
+    weights = np.maximum(weights, 1e-12)
+    wsum = np.bincount(inverse, weights, n_groups)
+
+    mean = np.stack([np.bincount(inverse, weights * pos[:, a], n_groups) for a in range(3)], axis=1) / wsum[:, None]
+    ex2 = np.stack([np.bincount(inverse, weights * pos[:, a] ** 2, n_groups) for a in range(3)], axis=1) / wsum[:, None]
+    spread = np.maximum(ex2 - mean ** 2, 0.0).mean(axis=1, keepdims=True)
+    ms2 = np.stack([np.bincount(inverse, weights * scales[:, a] ** 2, n_groups) for a in range(3)], axis=1) / wsum[:, None]
+    merged_scales = np.sqrt(ms2 + spread)
+
+    # Heaviest splat per group: sort by (group, -weight) and take each group's first
+    order = np.lexsort((-weights, inverse))
+    starts = np.flatnonzero(np.r_[True, np.diff(inverse[order]) != 0])
+    rep = order[starts]
+    opacity = np.maximum.reduceat(splats.opacities[order], starts)
+
+    return SplatArrays(
+        mean.astype(np.float32),
+        merged_scales.astype(np.float32),
+        splats.quats[rep],
+        splats.palette_uv[rep],
+        opacity.astype(np.float32),
+        splats.colors[rep] if splats.colors is not None else None,
+    )
+
+
+def _bounding_box(tile):
+    """3D Tiles box (center + 3 half-axes) of the tile in object space."""
+    half = tile.size * 0.5
+    return [float(v) for v in tile.center] + [half, 0.0, 0.0, 0.0, half, 0.0, 0.0, 0.0, half]
+
+
+def export_tileset(objects, directory, max_points=MAX_POINTS_PER_TILE, resolution=GRID_RESOLUTION,
+                   max_depth=MAX_DEPTH, compact=True):
+    """
+    Write `tileset.json`, `palette.png` and one instanced GLB per tile into
+    `directory`, for the splats of all `objects` (e.g. the spatial chunks of
+    an import). Returns a dict with tile and stroke counts.
+    """
+    template, splats, palette_img = merged_splats(objects)
+    if len(splats) == 0:
+        raise ValueError("Object has no splats")
+
+    # Tile content is glTF (y-up) in object space; 3D Tiles converts it back to
+    # z-up, and the root transform places the tileset like the Blender object.
+    world = np.array(objects[0].matrix_world, dtype=np.float64)
+
+    tiles_dir = os.path.join(directory, "tiles")
+    os.makedirs(tiles_dir, exist_ok=True)
+
+    palette_uri = None
+    if palette_img:
+        with open(os.path.join(directory, "palette.png"), 'wb') as f:
+            f.write(encode_png(image_to_rgba8(palette_img)))
+        palette_uri = "../palette.png"
+
+    root = build_octree(splats.positions, max_points, max_depth)
+    n_tiles = 0
+    n_strokes = 0
+
+    def write_tile(tile):
+        nonlocal n_tiles, n_strokes
+        if tile.is_leaf:
+            content = splats.subset(tile.indices)
+            error = 0.0
+        else:
+            cell = tile.size / resolution
+            content = merge_splats(splats.subset(collect_indices(tile)), tile.bmin, cell, resolution)
+            error = cell * np.sqrt(3.0)
+
+        uri = f"tiles/{tile.id}.glb"
+        write_instanced_glb(os.path.join(directory, uri), template, content, AXIS_Z_UP_TO_Y_UP,
+                            palette_uri, compact=compact)
+        n_tiles += 1
+        n_strokes += len(content)
+
+        node = {
+            "boundingVolume": {"box": _bounding_box(tile)},
+            "geometricError": float(error),
+            "content": {"uri": uri},
+        }
+        if tile.children:
+            node["children"] = [write_tile(c) for c in tile.children]
+        return node
+
+    root_node = write_tile(root)
+    root_node["refine"] = "REPLACE"
+    root_node["transform"] = [float(v) for v in world.T.reshape(-1)]
+
+    tileset = {
+        "asset": {"version": "1.1", "generator": "3DGS Oil Paint tiles exporter"},
+        "geometricError": float(root.size),
+        "root": root_node,
+    }
+    with open(os.path.join(directory, "tileset.json"), 'w') as f:
+        json.dump(tileset, f, separators=(",", ":"))
+
+    return {"tiles": n_tiles, "strokes": n_strokes, "splats": len(splats)}
+
@@ -0,0 +1,89 @@
+import bpy
+import numpy as np
+
+# ==============================================================================
+#  MULTI-CAPTURE MERGE
+# ==============================================================================
+# Several PLY captures are streamed one by one into a single point mesh, so the
+# scene gets one mesh, palette, material and GS_Instancer evaluation instead of
+# one per capture. Each capture is placed by a 4x4 transform from its own PLY
+# space into the PLY space of the merged object:
+#   - a capture imported before and moved in the viewport keeps that placement
+#     (the matrix_world of an object tagged with its source file)
+#   - otherwise it stays where it is (identity)
+# Positions, splat scales and rotations are transformed on ingest; colours are
+# computed in the capture's own space first, so view-dependent SH stays exact
+# without rotating SH coefficients.
+
+MERGED_SOURCES_KEY = "gs_merged_sources"    # "|"-joined source paths of a merged object
+
+
+def placement_matrix(y_up_to_z_up=True):
+    """matrix_world of an imported object: at the origin, rotated -90 degrees about X for Y-up sources."""
+    matrix = np.eye(4)
+    if y_up_to_z_up:
+        matrix[1:3, 1:3] = ((0.0, 1.0), (-1.0, 0.0))
+    return matrix
+
+
+def capture_transform(source, source_key, y_up_to_z_up=True):
+    """
+    4x4 transform of a capture (`source`: GS_Processor.source_path) into a
+    merged import, from the first object an earlier import of it left in the
+    scene; None (identity) when there is none or it was not moved.
+    """
+    candidates = sorted((obj for obj in bpy.data.objects
+                         if obj.library is None and obj.get(source_key) == source
+                         and obj.get(MERGED_SOURCES_KEY) is None
+                         and obj.modifiers.get("GS_Instancer") is not None), key=lambda obj: obj.name)
+    if not candidates:
+        return None
+    placement = placement_matrix(y_up_to_z_up)
+    transform = np.linalg.inv(placement) @ np.array(candidates[0].matrix_world, dtype=np.float64)
+    return None if np.allclose(transform, np.eye(4), atol=1e-6) else transform
+
+
+def matrix_to_quaternion(rot):
+    """Unit quaternion (w, x, y, z) of a 3x3 rotation matrix."""
+    m = np.asarray(rot, dtype=np.float64)
+    trace = m[0, 0] + m[1, 1] + m[2, 2]
+    if trace > 0.0:
+        s = np.sqrt(trace + 1.0) * 2.0
+        q = (0.25 * s, (m[2, 1] - m[1, 2]) / s, (m[0, 2] - m[2, 0]) / s, (m[1, 0] - m[0, 1]) / s)
+    elif m[0, 0] > m[1, 1] and m[0, 0] > m[2, 2]:
+        s = np.sqrt(1.0 + m[0, 0] - m[1, 1] - m[2, 2]) * 2.0
+        q = ((m[2, 1] - m[1, 2]) / s, 0.25 * s, (m[0, 1] + m[1, 0]) / s, (m[0, 2] + m[2, 0]) / s)
+    elif m[1, 1] > m[2, 2]:
+        s = np.sqrt(1.0 + m[1, 1] - m[0, 0] - m[2, 2]) * 2.0
+        q = ((m[0, 2] - m[2, 0]) / s, (m[0, 1] + m[1, 0]) / s, 0.25 * s, (m[1, 2] + m[2, 1]) / s)
+    else:
+        s = np.sqrt(1.0 + m[2, 2] - m[0, 0] - m[1, 1]) * 2.0
+        q = ((m[1, 0] - m[0, 1]) / s, (m[0, 2] + m[2, 0]) / s, (m[1, 2] + m[2, 1]) / s, 0.25 * s)
+    q = np.array(q)
+    return q / np.linalg.norm(q)
+
+
+def transform_splats(xyz, scales, log_scales, quats, matrix):
+    """
+    Apply a 4x4 placement to splat arrays (in place where possible). Returns
+    (xyz, scales, log_scales, quats). Splats keep their shape, so a
+    non-uniform scale is applied as its geometric mean.
+    """
+    matrix = np.asarray(matrix, dtype=np.float64)
+    linear = matrix[:3, :3]
+    axis_scale = np.linalg.norm(linear, axis=0)
+    scale = float(np.cbrt(np.prod(axis_scale)))
+
+    xyz = (xyz @ linear.T + matrix[:3, 3]).astype(xyz.dtype, copy=False)
+    scales = scales * scale
+    log_scales = log_scales + np.log(scale)
+
+    # q_new = q_rot * q (rotation applied in the parent space)
+    w1, x1, y1, z1 = matrix_to_quaternion(linear / axis_scale)
+    w2, x2, y2, z2 = quats[:, 0], quats[:, 1], quats[:, 2], quats[:, 3]
+    rotated = np.empty_like(quats)
+    rotated[:, 0] = w1*w2 - x1*x2 - y1*y2 - z1*z2
+    rotated[:, 1] = w1*x2 + x1*w2 + y1*z2 - z1*y2
+    rotated[:, 2] = w1*y2 - x1*z2 + y1*w2 + z1*x2
+    rotated[:, 3] = w1*z2 + x1*y2 - y1*x2 + z1*w2
+    return xyz, scales, log_scales, rotated
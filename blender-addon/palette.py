@@ -0,0 +1,324 @@
+import os
+import struct
+import hashlib
+import tempfile
+import bpy
+import numpy as np
+
+from .export import encode_png, image_to_rgba8, find_palette_image as find_object_palette
+from .shader import PALETTE_PROP, find_palette_image
+from .spatial import hilbert_codes, hilbert_xy
+from . import parallel
+
+# ==============================================================================
+#  PALETTE STORAGE
+# ==============================================================================
+# Palette colours are 8-bit already, so the image is built as an RGBA uint8
+# buffer and encoded to PNG here (8-bit RGB, or indexed when it has at most 256
+# colours) instead of pushing a float32 pixel buffer through Blender and having
+# it re-encode the generated image. Blender then loads the PNG as a byte image:
+#   - no cache folder: from a temporary file, packed into the .blend as-is
+#   - cache folder: content-addressed `palette_<hash>.png`, loaded by path and
+#     not packed, so .blend files holding many captures stay small
+
+PALETTE_SIZE = 256      # GS_Processor.PALETTE_SIZE
+ORDER_BITS = 10         # per OKLab axis for the perceptual ordering
+
+
+def palette_rgba8(colors, size=PALETTE_SIZE, slots=None):
+    """
+    (size, size, 4) uint8 palette, bottom row first like Blender pixels; unused texels are black.
+    Colour i goes to texel slots[i] (row-major from the bottom), or texel i without slots.
+    """
+    rgba = np.zeros((size * size, 4), dtype=np.uint8)
+    rgba[:, 3] = 255
+    if slots is None:
+        slots = np.arange(len(colors))
+    rgba[slots, :3] = np.clip(np.asarray(colors) * 255.0 + 0.5, 0.0, 255.0)
+    return rgba.reshape(size, size, 4)
+
+
+def palette_hash(rgba8):
+    return hashlib.sha1(np.ascontiguousarray(rgba8).tobytes()).hexdigest()
+
+
+def cached_png_path(cache_dir, digest):
+    return os.path.join(bpy.path.abspath(cache_dir), f"palette_{digest[:16]}.png")
+
+
+def palette_image(name, rgba8, digest, cache_dir=""):
+    """
+    Image datablock showing `rgba8`; an existing image with the same hash is reused.
+    Returns (image, source) with source 'reused', 'cached' or 'packed'.
+    """
+    image = find_palette_image(digest)
+    if image is not None:
+        return image, 'reused'
+
+    stale = bpy.data.images.get(name)
+    if stale is not None and stale.users == 0 and stale.library is None:
+        bpy.data.images.remove(stale)
+
+    if cache_dir:
+        path = cached_png_path(cache_dir, digest)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'wb') as f:
+                f.write(encode_png(rgba8[::-1], indexed=True))
+        image = bpy.data.images.load(path, check_existing=True)
+        image.name = name
+        source = 'cached'
+    else:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, f"{name}.png")
+            with open(path, 'wb') as f:
+                f.write(encode_png(rgba8[::-1], indexed=True))
+            image = bpy.data.images.load(path)
+            image.pack()
+        # The temporary file is gone; unpacking writes next to the .blend
+        image.filepath_raw = f"//{name}.png"
+        image.name = name
+        source = 'packed'
+
+    image[PALETTE_PROP] = digest
+    return image, source
+
+
+# ==============================================================================
+#  COLOUR KEYS
+# ==============================================================================
+# One fused, chunked pass from the PLY colour fields to packed 24-bit sRGB keys
+# (r << 16 | g << 8 | b), the form palette baking deduplicates. Every chunk
+# stays in one float32 scratch buffer sized for the cache, and the linear ->
+# sRGB transfer is a table lookup instead of np.power on every element.
+
+SH_C0 = 0.28209479177387814
+KEY_CHUNK = 1 << 15         # splats per block (384 KB float32 scratch)
+SRGB_LUT_BITS = 16          # linear input resolution; steps stay well below one output code
+
+_srgb_lut = None
+
+
+def srgb_lut():
+    """uint8 sRGB code (truncated, like int(srgb * 255)) for 2^SRGB_LUT_BITS linear steps over [0, 1]."""
+    global _srgb_lut
+    if _srgb_lut is None:
+        linear = np.linspace(0.0, 1.0, 1 << SRGB_LUT_BITS)
+        srgb = np.where(linear <= 0.0031308, linear * 12.92, 1.055 * np.power(linear, 1.0 / 2.4) - 0.055)
+        _srgb_lut = (np.clip(srgb, 0.0, 1.0) * 255.0).astype(np.uint8)
+    return _srgb_lut
+
+
+def color_keys(ply_data, source_is_linear=False, chunk=KEY_CHUNK, view=None):
+    """
+    Packed 24-bit sRGB key per splat from f_dc_* (SH degree 0) or red/green/blue.
+    `view` (sh.ViewColor) adds the f_rest_* bands for a view or view average.
+    Blocks of `chunk` splats run on the parallel.py thread pool.
+    """
+    names = ply_data.dtype.names
+    n = len(ply_data)
+    keys = np.empty(n, dtype=np.uint32)
+    if 'f_dc_0' in names:
+        fields, scale, offset = ('f_dc_0', 'f_dc_1', 'f_dc_2'), SH_C0, 0.5
+    elif 'red' in names:
+        fields, scale, offset = ('red', 'green', 'blue'), 1.0 / 255.0, 0.0
+        view = None     # byte colours carry no SH bands
+    else:
+        fields = None
+
+    lut = srgb_lut() if source_is_linear else None
+    lut_max = float((1 << SRGB_LUT_BITS) - 1)
+
+    def block(start, stop):
+        # Scratch per block: blocks run concurrently on the parallel.py thread pool
+        b = np.empty((3, stop - start), dtype=np.float32)
+        c = np.empty(b.shape, dtype=np.uint32)
+        if fields is None:
+            b.fill(1.0)
+        else:
+            for i, name in enumerate(fields):
+                np.multiply(ply_data[name][start:stop], scale, out=b[i], casting='unsafe')
+            b += offset
+            if view is not None:
+                view.add_to(ply_data, start, stop, b)
+        np.clip(b, 0.0, 1.0, out=b)
+        if lut is not None:
+            b *= lut_max
+            b += 0.5
+            np.copyto(c, b, casting='unsafe')
+            c[...] = lut[c]
+        else:
+            b *= 255.0
+            np.copyto(c, b, casting='unsafe')
+        keys[start:stop] = (c[0] << 16) | (c[1] << 8) | c[2]
+
+    parallel.map_chunks(n, block, chunk)
+    return keys
+
+
+def keys_to_rgb(keys):
+    """Packed keys -> sRGB float32 (n, 3) in [0, 1]."""
+    rgb = np.empty((len(keys), 3), dtype=np.float32)
+    rgb[:, 0] = (keys >> 16) & 0xFF
+    rgb[:, 1] = (keys >> 8) & 0xFF
+    rgb[:, 2] = keys & 0xFF
+    rgb *= 1.0 / 255.0
+    return rgb
+
+
+# ==============================================================================
+#  LOCALITY-PRESERVING LAYOUT
+# ==============================================================================
+# Row-major HSV order puts unrelated colours next to each other (every row wraps
+# around the hue circle), so 4x4 blocks are noisy and block compression (BC1,
+# BC7, ASTC) and mipmaps break the palette. The Hilbert layout sorts colours
+# along a 3D Hilbert curve in OKLab, then lays that order out along a 2D
+# Hilbert curve: each aligned 4x4 block holds 16 consecutive, similar colours.
+
+def srgb_to_oklab(srgb):
+    """sRGB in [0, 1] (n, 3) -> OKLab (n, 3)."""
+    c = np.asarray(srgb, dtype=np.float64)
+    linear = np.where(c <= 0.04045, c / 12.92, ((c + 0.055) / 1.055) ** 2.4)
+    lms = linear @ np.array([
+        [0.4122214708, 0.5363325363, 0.0514459929],
+        [0.2119034982, 0.6806995451, 0.1073969566],
+        [0.0883024619, 0.2817188376, 0.6299787005],
+    ]).T
+    return np.cbrt(lms) @ np.array([
+        [0.2104542553, 0.7936177850, -0.0040720468],
+        [1.9779984951, -2.4285922050, 0.4505937099],
+        [0.0259040371, 0.7827717662, -0.8086757660],
+    ]).T
+
+
+def perceptual_order(colors, bits=ORDER_BITS):
+    """Permutation of sRGB colours along a 3D Hilbert curve through OKLab."""
+    if len(colors) < 2:
+        return np.arange(len(colors))
+    lab = srgb_to_oklab(colors)
+    lo = lab.min(axis=0)
+    extent = np.maximum(lab.max(axis=0) - lo, 1e-12)
+    q = ((lab - lo) / extent.max() * ((1 << bits) - 1) + 0.5).astype(np.int64)
+    return np.argsort(hilbert_codes(q, bits), kind='stable')
+
+
+def hilbert_slots(count, size=PALETTE_SIZE):
+    """Row-major texel index of the first `count` cells of the 2D Hilbert curve over the palette."""
+    bits = int(size).bit_length() - 1
+    x, y = hilbert_xy(np.arange(count), bits)
+    return (y * size + x).astype(np.int32)
+
+
+def hilbert_layout(colors, ranks, size=PALETTE_SIZE):
+    """
+    Re-lay a baked palette (colours + per-splat ranks) out along the Hilbert curves.
+    Returns (colours in curve order, texel slot per colour, texel slot per splat).
+    """
+    order = perceptual_order(colors)
+    new_rank = np.empty(len(order), dtype=np.int64)
+    new_rank[order] = np.arange(len(order))
+    slots = hilbert_slots(len(order), size)
+    return colors[order], slots, slots[new_rank[ranks]]
+
+
+# ==============================================================================
+#  BLOCK COMPRESSION (BC1 / DXT1)
+# ==============================================================================
+# A straightforward BC1 encoder: per 4x4 block, endpoints at the extremes of
+# the principal axis of the used texels, RGB565 endpoints, nearest of the four
+# interpolated colours per texel. It is used to estimate the error any block
+# format would add to a layout and to write compressed palettes (.dds).
+
+def _bc1_blocks(rgba8, used=None):
+    """Top-first (h, w, 4) uint8 -> (blocks (n,) [c0, c1, indices] uint32 triples, decoded (h, w, 3))."""
+    h, w = rgba8.shape[:2]
+    rgb = rgba8[..., :3].astype(np.float64)
+    blocks = rgb.reshape(h // 4, 4, w // 4, 4, 3).transpose(0, 2, 1, 3, 4).reshape(-1, 16, 3)
+    if used is None:
+        weights = np.ones(blocks.shape[:2])
+    else:
+        weights = used.reshape(h // 4, 4, w // 4, 4).transpose(0, 2, 1, 3).reshape(-1, 16).astype(np.float64)
+    wsum = np.maximum(weights.sum(axis=1, keepdims=True), 1e-12)
+
+    mean = (blocks * weights[..., None]).sum(axis=1) / wsum
+    centered = (blocks - mean[:, None]) * np.sqrt(weights)[..., None]
+    axis = np.linalg.eigh(np.einsum('nki,nkj->nij', centered, centered))[1][:, :, -1]
+    t = np.einsum('nki,ni->nk', blocks - mean[:, None], axis)
+    t_min = np.where(weights > 0, t, np.inf).min(axis=1)
+    t_max = np.where(weights > 0, t, -np.inf).max(axis=1)
+    t_min = np.where(np.isfinite(t_min), t_min, 0.0)
+    t_max = np.where(np.isfinite(t_max), t_max, 0.0)
+    ends = np.stack((mean + axis * t_max[:, None], mean + axis * t_min[:, None]), axis=1)
+
+    # RGB565 endpoints and their 8-bit expansion
+    scale = np.array([31.0, 63.0, 31.0])
+    q = np.clip(np.rint(ends / 255.0 * scale), 0, scale).astype(np.uint32)
+    packed = (q[..., 0] << 11) | (q[..., 1] << 5) | q[..., 2]
+    swap = packed[:, 0] < packed[:, 1]
+    q[swap] = q[swap][:, ::-1]
+    packed[swap] = packed[swap][:, ::-1]
+    bits = np.array([5, 6, 5])
+    e = ((q << (8 - bits)) | (q >> (2 * bits - 8))).astype(np.float64)
+
+    # Four-colour mode needs c0 > c1; equal endpoints decode to a flat block anyway
+    palette = np.stack((e[:, 0], e[:, 1], (2 * e[:, 0] + e[:, 1]) / 3, (e[:, 0] + 2 * e[:, 1]) / 3), axis=1)
+    dist = ((blocks[:, :, None, :] - palette[:, None, :, :]) ** 2).sum(axis=-1)
+    index = dist.argmin(axis=2)
+    index[packed[:, 0] == packed[:, 1]] = 0
+    decoded = np.take_along_axis(palette, index[..., None], axis=1)
+
+    bitfield = (index.astype(np.uint32) << (2 * np.arange(16, dtype=np.uint32))).sum(axis=1, dtype=np.uint32)
+    encoded = np.stack((packed[:, 0], packed[:, 1], bitfield), axis=1)
+    decoded = decoded.reshape(h // 4, w // 4, 4, 4, 3).transpose(0, 2, 1, 3, 4).reshape(h, w, 3)
+    return encoded, decoded
+
+
+def bc1_rmse(rgba8, used=None):
+    """RMS error (8-bit units) of BC1-compressing `rgba8`, over the `used` texels only."""
+    _, decoded = _bc1_blocks(rgba8, used)
+    err = ((decoded - rgba8[..., :3]) ** 2).sum(axis=-1)
+    if used is not None:
+        err = err[used]
+    return float(np.sqrt(err.mean() / 3.0)) if err.size else 0.0
+
+
+def layout_report(colors, slots, size=PALETTE_SIZE):
+    """BC1 RMSE of a layout next to the row-major layout of the same colours."""
+    used = np.zeros(size * size, dtype=bool)
+    used[slots] = True
+    rows = np.zeros(size * size, dtype=bool)
+    rows[:len(colors)] = True
+    return (bc1_rmse(palette_rgba8(colors, size, slots), used.reshape(size, size)),
+            bc1_rmse(palette_rgba8(colors, size), rows.reshape(size, size)))
+
+
+def encode_dds_bc1(rgba8):
+    """Top-first (h, w, 4) uint8, h and w multiples of 4 -> DXT1 .dds bytes."""
+    h, w = rgba8.shape[:2]
+    encoded, _ = _bc1_blocks(rgba8)
+    data = np.zeros(len(encoded), dtype=[('c0', '<u2'), ('c1', '<u2'), ('idx', '<u4')])
+    data['c0'], data['c1'], data['idx'] = encoded[:, 0], encoded[:, 1], encoded[:, 2]
+
+    flags = 0x1 | 0x2 | 0x4 | 0x1000 | 0x80000     # CAPS, HEIGHT, WIDTH, PIXELFORMAT, LINEARSIZE
+    pixel_format = struct.pack("<II4s5I", 32, 0x4, b"DXT1", 0, 0, 0, 0, 0)
+    header = struct.pack("<7I", 124, flags, h, w, data.nbytes, 0, 0) + b"\0" * 44 + pixel_format
+    header += struct.pack("<5I", 0x1000, 0, 0, 0, 0)
+    return b"DDS " + header + data.tobytes()
+
+
+def export_palette(obj, filepath):
+    """Write the palette of an imported object as .png or BC1 .dds; returns the file size."""
+    image = find_object_palette(obj)
+    if image is None:
+        raise ValueError("Object has no palette image")
+    rgba8 = image_to_rgba8(image)
+    ext = os.path.splitext(filepath)[1].lower()
+    if ext == '.dds':
+        payload = encode_dds_bc1(rgba8)
+    elif ext == '.png':
+        payload = encode_png(rgba8, indexed=True)
+    else:
+        raise ValueError(f"Unsupported palette format '{ext}' (use .png or .dds)")
+    with open(filepath, 'wb') as f:
+        f.write(payload)
+    return len(payload)
@@ -0,0 +1,58 @@
+import os
+
+# ==============================================================================
+#  CHUNKED THREAD-POOL EXECUTION
+# ==============================================================================
+# Per-splat stages split the splat range into fixed blocks and run them on one
+# shared thread pool. NumPy releases the GIL inside its loops, so the blocks of
+# a stage run on separate cores; every block writes its own slice of outputs
+# preallocated by the caller, so nothing is gathered or concatenated
+# afterwards. Short ranges (a single block) and single-core machines run
+# inline. concurrent.futures is imported on first use, like thumbnails.py.
+
+CHUNK = 1 << 16             # splats per block: the block's temporaries stay in cache
+MAX_WORKERS = 32
+
+_executor = None
+
+
+def worker_count():
+    """Threads used for per-splat stages: the CPUs available to this process."""
+    if hasattr(os, "sched_getaffinity"):
+        cpus = len(os.sched_getaffinity(0))
+    else:
+        cpus = os.cpu_count() or 1
+    return max(1, min(cpus, MAX_WORKERS))
+
+
+def map_chunks(n, kernel, chunk=CHUNK):
+    """
+    Call kernel(start, stop) for consecutive blocks of [0, n), in parallel
+    when there is more than one block. Blocks must write disjoint outputs.
+    Returns when all are done; the first exception of a kernel is re-raised.
+    """
+    global _executor
+    ranges = [(start, min(start + chunk, n)) for start in range(0, n, chunk)]
+    workers = worker_count()
+    if workers == 1 or len(ranges) < 2:
+        for start, stop in ranges:
+            kernel(start, stop)
+        return
+
+    if _executor is None:
+        from concurrent.futures import ThreadPoolExecutor
+        _executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="gs_splats")
+    futures = [_executor.submit(kernel, start, stop) for start, stop in ranges]
+    try:
+        for future in futures:
+            future.result()
+    finally:
+        for future in futures:
+            future.cancel()
+
+
+def shutdown():
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=True, cancel_futures=True)
+        _executor = None
@@ -0,0 +1,113 @@
+import numpy as np
+from numpy.lib import recfunctions
+
+# ==============================================================================
+#  VIEW-DEPENDENT COLOUR (SPHERICAL HARMONICS BANDS 1-3)
+# ==============================================================================
+# 3DGS stores a splat's colour as real spherical harmonics: the DC term in
+# f_dc_* and bands 1..3 in f_rest_* (channel-major: f_rest_{c * K + k}, K
+# coefficients per channel). The rendered colour for a view direction d
+# (camera -> splat, in PLY space) is
+#     rgb = 0.5 + SH_C0 * f_dc + sum_k Y_k(d) * f_rest_k
+# Two bakes are offered, both evaluated block by block next to the DC term so
+# the 45 extra floats per splat never all sit in memory as one array:
+#   - CAMERA: d from the active camera to every splat
+#   - HEMISPHERE: mean colour over all cameras on the outer side of the splat
+#     (view directions within 90 degrees of splat -> scene centre). By the
+#     Funk-Hecke theorem that mean is the same SH sum evaluated at the axis
+#     splat -> centre, with band l scaled by int_0^1 P_l(t) dt: 1/2, 0, -1/8.
+
+SH_C1 = 0.4886025119029199
+SH_C2 = (1.0925484305920792, -1.0925484305920792, 0.31539156525252005,
+         -1.0925484305920792, 0.5462742152960396)
+SH_C3 = (-0.5900435899266435, 2.890611442640554, -0.4570457994644658, 0.3731763325901154,
+         -0.4570457994644658, 1.445305721320277, -0.5900435899266435)
+
+HEMISPHERE_BAND_WEIGHTS = (1.0, 0.5, 0.0, -0.125)
+CAMERA_BAND_WEIGHTS = (1.0, 1.0, 1.0, 1.0)
+
+
+def file_degree(names):
+    """Highest SH degree stored in the f_rest_* fields of a PLY dtype (0 = DC only)."""
+    per_channel = sum(1 for n in names if n.startswith('f_rest_')) // 3
+    degree = 0
+    while degree < 3 and (degree + 2) ** 2 - 1 <= per_channel:
+        degree += 1
+    return degree
+
+
+def band_basis(band, x, y, z):
+    """Real SH basis rows of one band (1..3) at unit directions, in 3DGS coefficient order."""
+    if band == 1:
+        return (-SH_C1 * y, SH_C1 * z, -SH_C1 * x)
+    xx, yy, zz = x * x, y * y, z * z
+    if band == 2:
+        return (SH_C2[0] * x * y, SH_C2[1] * y * z, SH_C2[2] * (2.0 * zz - xx - yy),
+                SH_C2[3] * x * z, SH_C2[4] * (xx - yy))
+    return (SH_C3[0] * y * (3.0 * xx - yy), SH_C3[1] * x * y * z,
+            SH_C3[2] * y * (4.0 * zz - xx - yy), SH_C3[3] * z * (2.0 * zz - 3.0 * xx - 3.0 * yy),
+            SH_C3[4] * x * (4.0 * zz - xx - yy), SH_C3[5] * z * (xx - yy),
+            SH_C3[6] * x * (xx - 3.0 * yy))
+
+
+class ViewColor:
+    """
+    Adds the SH bands 1..degree of a block of splats to their DC colour.
+    mode 'CAMERA': `origin` is the camera position in PLY space, or `forward`
+    the view direction of an orthographic camera. mode 'HEMISPHERE': `origin`
+    is the scene centre the views face.
+    """
+
+    def __init__(self, names, mode, origin=(0.0, 0.0, 0.0), forward=None, max_degree=3):
+        self.mode = mode
+        self.degree = min(file_degree(names), max_degree)
+        self.rest_fields = [n for n in names if n.startswith('f_rest_')]
+        self.stride = len(self.rest_fields) // 3
+        self.origin = np.asarray(origin, dtype=np.float32).reshape(3, 1)
+        self.forward = None if forward is None else np.asarray(forward, dtype=np.float32)
+        self.weights = HEMISPHERE_BAND_WEIGHTS if mode == 'HEMISPHERE' else CAMERA_BAND_WEIGHTS
+
+    def directions(self, ply_data, start, stop):
+        """Unit view directions (3, m) of a block."""
+        m = stop - start
+        if self.forward is not None:
+            return np.broadcast_to((self.forward / np.linalg.norm(self.forward)).reshape(3, 1), (3, m))
+        d = np.empty((3, m), dtype=np.float32)
+        for i, name in enumerate(('x', 'y', 'z')):
+            np.subtract(ply_data[name][start:stop], self.origin[i], out=d[i], casting='unsafe')
+        if self.mode == 'HEMISPHERE':
+            d *= -1.0
+        length = np.sqrt(np.einsum('ij,ij->j', d, d))
+        np.maximum(length, 1e-12, out=length)
+        d /= length
+        return d
+
+    def add_to(self, ply_data, start, stop, rgb):
+        """rgb (3, m) float32 += view-dependent part of splats [start, stop)."""
+        if self.degree == 0:
+            return
+        x, y, z = self.directions(ply_data, start, stop)
+        # Weighted basis of all coefficients up to the degree, so each channel is one contraction
+        count = (self.degree + 1) ** 2 - 1
+        basis = np.zeros((stop - start, count), dtype=np.float32)
+        for band in range(1, self.degree + 1):
+            if self.weights[band]:
+                for j, row in enumerate(band_basis(band, x, y, z), band * band - 1):
+                    np.multiply(row, self.weights[band], out=basis[:, j], casting='unsafe')
+        # (m, 3K) rows of the block: a view into the PLY records when the fields are float32
+        rest = recfunctions.structured_to_unstructured(
+            ply_data[self.rest_fields][start:stop], dtype=np.float32, copy=False)
+        for c in range(3):
+            offset = c * self.stride
+            rgb[c] += np.einsum('mk,mk->m', rest[:, offset:offset + count], basis)
+
+
+def camera_view(camera, world_to_ply):
+    """
+    (origin, forward) of a camera object in PLY space (`world_to_ply`: 4x4
+    inverse of the imported object's matrix_world): its position, and for
+    orthographic cameras the shared view direction (None otherwise).
+    """
+    world = world_to_ply @ np.array(camera.matrix_world, dtype=np.float64)
+    forward = -world[:3, 2] if camera.data.type == 'ORTHO' else None
+    return world[:3, 3], forward
@@ -1,9 +1,13 @@
 import bpy
 import typing
 
-def create_shader(material: bpy.types.Material, palette_img=None, alpha_img=None, normal_img=None):
+def create_shader(material: bpy.types.Material, palette_img=None, alpha_img=None, normal_img=None,
+                  atlas_grid=0, atlas_cell=256, color_attribute=None):
     """
     Configure the shader node tree for the given material using the provided images.
+    With atlas_grid > 0, alpha_img/normal_img are brush atlases of atlas_grid x atlas_grid
+    cells and the brush UV is mapped into the cell given by the `brush_index` attribute.
+    With color_attribute, Base Color reads that colour attribute and no palette texture is built.
     """
     material.use_nodes = True
     
@@ -47,21 +51,31 @@ def create_shader(material: bpy.types.Material, palette_img=None, alpha_img=None
     pass 
 
     # 1. Palette Texture (Base Color) -> Image Texture
-    # Driven by ColUV (UV Map.001)
-    uv_map_palette = nodes.new("ShaderNodeUVMap")
-    uv_map_palette.name = "UV Map.001"
-    uv_map_palette.uv_map = "ColUV"
-    uv_map_palette.location = (-1337.7823486328125, -268.6052551269531)
-
-    tex_palette = nodes.new("ShaderNodeTexImage")
-    tex_palette.name = "Image Texture"
-    tex_palette.interpolation = 'Closest' # Important for palette
-    tex_palette.projection = 'FLAT'
-    tex_palette.extension = 'CLIP'
-    tex_palette.location = (-1072.0728759765625, -81.77071380615234)
-    
-    if palette_img:
-        tex_palette.image = palette_img
+    if color_attribute:
+        # Texture-free: per-splat colour straight from the point attribute
+        node_attr_color = nodes.new("ShaderNodeAttribute")
+        node_attr_color.name = "Color Attribute"
+        node_attr_color.attribute_name = color_attribute
+        node_attr_color.attribute_type = 'GEOMETRY'
+        node_attr_color.location = (-1072.0728759765625, -81.77071380615234)
+        base_color = node_attr_color.outputs[0]
+    else:
+        # Driven by ColUV (UV Map.001)
+        uv_map_palette = nodes.new("ShaderNodeUVMap")
+        uv_map_palette.name = "UV Map.001"
+        uv_map_palette.uv_map = "ColUV"
+        uv_map_palette.location = (-1337.7823486328125, -268.6052551269531)
+
+        tex_palette = nodes.new("ShaderNodeTexImage")
+        tex_palette.name = "Image Texture"
+        tex_palette.interpolation = 'Closest' # Important for palette
+        tex_palette.projection = 'FLAT'
+        tex_palette.extension = 'CLIP'
+        tex_palette.location = (-1072.0728759765625, -81.77071380615234)
+
+        if palette_img:
+            tex_palette.image = palette_img
+        base_color = tex_palette.outputs[0]
 
     # 2. Brush Alpha Texture (Alpha) -> Image Texture.002
     # Driven by UVMap (UV Map)
@@ -79,6 +93,11 @@ def create_shader(material: bpy.types.Material, palette_img=None, alpha_img=None
     
     if alpha_img:
         tex_alpha.image = alpha_img
+
+    # Brush UV: the UV map itself, or its position inside the atlas cell
+    brush_uv = uv_map_brush.outputs[0]
+    if atlas_grid > 0:
+        brush_uv = _atlas_uv(nodes, links, brush_uv, atlas_grid, atlas_cell)
     
     # Math Node for Alpha Multiplier (opacity attribute * texture alpha)
     # The snippet used simple mix or multiply? Snippet: Math.004 (Multiply)
@@ -121,18 +140,19 @@ def create_shader(material: bpy.types.Material, palette_img=None, alpha_img=None
 
         # Links for Normal
         # Use existing UV Map Brush
-        links.new(uv_map_brush.outputs[0], tex_normal.inputs[0])
+        links.new(brush_uv, tex_normal.inputs[0])
         links.new(tex_normal.outputs[0], node_normal_map.inputs[1])
         links.new(node_normal_map.outputs[0], principled_bsdf.inputs['Normal'])
 
     # Links for Palette (Base Color)
-    links.new(uv_map_palette.outputs[0], tex_palette.inputs[0])
-    links.new(tex_palette.outputs[0], principled_bsdf.inputs['Base Color'])
+    if not color_attribute:
+        links.new(uv_map_palette.outputs[0], tex_palette.inputs[0])
+    links.new(base_color, principled_bsdf.inputs['Base Color'])
     # Optional: Emission?
     # links.new(tex_palette.outputs[0], principled_bsdf.inputs['Emission Color'])
 
     # Links for Alpha
-    links.new(uv_map_brush.outputs[0], tex_alpha.inputs[0])
+    links.new(brush_uv, tex_alpha.inputs[0])
     
     # Multiply: Opacity Attribute (Fac) * Brush Texture (Color or Alpha?)
     # Generally alpha texture is grayscale in RGB or Alpha channel.
@@ -146,4 +166,130 @@ def create_shader(material: bpy.types.Material, palette_img=None, alpha_img=None
     # Final Output
     links.new(principled_bsdf.outputs[0], material_output.inputs[0])
 
-    return nodes
\ No newline at end of file
+    return nodes
+
+
+def _atlas_uv(nodes, links, uv_socket, cols, cell):
+    """
+    (uv * (1 - 2 * pad) + pad + (column, row)) / cols, with column and row taken
+    from `brush_index`. The one texel inset keeps linear filtering inside the cell.
+    """
+    pad = 1.0 / cell
+
+    node_attr_brush = nodes.new("ShaderNodeAttribute")
+    node_attr_brush.name = "Brush Index"
+    node_attr_brush.attribute_name = "brush_index"
+    node_attr_brush.attribute_type = 'GEOMETRY'
+    node_attr_brush.location = (-1900.0, 420.0)
+
+    def math_node(operation, a, b, x, y):
+        node = nodes.new("ShaderNodeMath")
+        node.operation = operation
+        node.location = (x, y)
+        for socket, value in zip(node.inputs, (a, b)):
+            if isinstance(value, float):
+                socket.default_value = value
+            else:
+                links.new(value, socket)
+        return node.outputs[0]
+
+    index = math_node('ROUND', node_attr_brush.outputs[2], 0.0, -1700.0, 420.0)
+    column = math_node('MODULO', index, float(cols), -1520.0, 480.0)
+    row = math_node('FLOOR', math_node('DIVIDE', index, float(cols), -1520.0, 360.0), 0.0, -1520.0, 300.0)
+
+    cell_offset = nodes.new("ShaderNodeCombineXYZ")
+    cell_offset.location = (-1340.0, 420.0)
+    links.new(column, cell_offset.inputs[0])
+    links.new(row, cell_offset.inputs[1])
+
+    inset = nodes.new("ShaderNodeVectorMath")
+    inset.operation = 'MULTIPLY_ADD'
+    inset.location = (-1340.0, 260.0)
+    links.new(uv_socket, inset.inputs[0])
+    inset.inputs[1].default_value = (1.0 - 2.0 * pad, 1.0 - 2.0 * pad, 1.0)
+    inset.inputs[2].default_value = (pad, pad, 0.0)
+
+    offset = nodes.new("ShaderNodeVectorMath")
+    offset.operation = 'ADD'
+    offset.location = (-1180.0, 340.0)
+    links.new(inset.outputs[0], offset.inputs[0])
+    links.new(cell_offset.outputs[0], offset.inputs[1])
+
+    to_atlas = nodes.new("ShaderNodeVectorMath")
+    to_atlas.operation = 'SCALE'
+    to_atlas.location = (-1180.0, 200.0)
+    links.new(offset.outputs[0], to_atlas.inputs[0])
+    to_atlas.inputs["Scale"].default_value = 1.0 / cols
+    return to_atlas.outputs[0]
+
+# ==============================================================================
+#  MATERIAL TEMPLATE CACHE
+# ==============================================================================
+# Imports with the same brush configuration only differ by their palette image.
+# One hidden template material is built per configuration with create_shader;
+# each import copies it and swaps the palette image, and an import whose palette
+# is identical to an existing one (e.g. re-importing a capture) reuses that
+# material and image outright. Keys live in custom properties, so the cache
+# survives saving and reopening the .blend.
+
+SHADER_VERSION = 1          # bump when create_shader changes, invalidates old templates
+TEMPLATE_PREFIX = ".GS_Template"
+KEY_PROP = "gs_shader_key"
+PALETTE_PROP = "gs_palette_hash"
+PALETTE_NODE = "Image Texture"
+
+
+def template_key(alpha_name, normal_path, **shader_options):
+    """Cache key of a brush configuration; `shader_options` (create_shader kwargs) tell variants apart."""
+    parts = [f"v{SHADER_VERSION}", alpha_name or '', normal_path or '']
+    parts += [f"{k}={v}" for k, v in sorted(shader_options.items())]
+    return "|".join(parts)
+
+
+def _find_material(key, palette_hash):
+    for mat in bpy.data.materials:
+        if mat.library is None and mat.get(KEY_PROP) == key and mat.get(PALETTE_PROP) == palette_hash:
+            return mat
+    return None
+
+
+def find_palette_image(palette_hash):
+    for img in bpy.data.images:
+        if img.library is None and img.get(PALETTE_PROP) == palette_hash:
+            return img
+    return None
+
+
+def get_template(key, load_images, **shader_options):
+    """
+    Template material for `key`; `load_images()` -> (alpha_img, normal_img) only runs on a miss.
+    `shader_options` are passed on to create_shader.
+    """
+    template = _find_material(key, None)
+    if template is None:
+        alpha_img, normal_img = load_images()
+        template = bpy.data.materials.new(name=TEMPLATE_PREFIX)
+        create_shader(template, palette_img=None, alpha_img=alpha_img, normal_img=normal_img, **shader_options)
+        template[KEY_PROP] = key
+        template.use_fake_user = True
+    return template
+
+
+def material_for_palette(name, key, palette_img, palette_hash, load_images, **shader_options):
+    """
+    Material showing `palette_img` for the brush configuration `key`.
+    Returns (material, source) with source 'reused', 'copied' or 'built'.
+    """
+    mat = _find_material(key, palette_hash)
+    if mat is not None:
+        return mat, 'reused'
+
+    source = 'copied' if _find_material(key, None) else 'built'
+    mat = get_template(key, load_images, **shader_options).copy()
+    mat.name = name
+    mat.use_fake_user = False
+    mat[PALETTE_PROP] = palette_hash
+    node = mat.node_tree.nodes.get(PALETTE_NODE)
+    if node is not None:
+        node.image = palette_img
+    return mat, source
@@ -0,0 +1,153 @@
+import numpy as np
+
+# ==============================================================================
+#  SPATIAL ORDERING (Morton / Z-curve)
+# ==============================================================================
+# PLY splats come in training order, which is spatially random. Sorting them
+# along a Z-curve puts neighbours next to each other in every attribute array,
+# so Geometry Nodes instancing, attribute reads and exported buffers touch
+# memory sequentially, and any spatial split becomes a contiguous range.
+
+MORTON_BITS = 21        # per axis -> 63-bit codes
+RADIX_BITS = 16         # digit width; stable argsort on uint16 is a radix sort
+
+
+def _spread_bits(v):
+    """Insert two zero bits between each of the low 21 bits of v (uint64)."""
+    v = v & np.uint64(0x1FFFFF)
+    v = (v | (v << np.uint64(32))) & np.uint64(0x1F00000000FFFF)
+    v = (v | (v << np.uint64(16))) & np.uint64(0x1F0000FF0000FF)
+    v = (v | (v << np.uint64(8))) & np.uint64(0x100F00F00F00F00F)
+    v = (v | (v << np.uint64(4))) & np.uint64(0x10C30C30C30C30C3)
+    v = (v | (v << np.uint64(2))) & np.uint64(0x1249249249249249)
+    return v
+
+
+def morton_codes(positions, bits=MORTON_BITS):
+    """63-bit Morton codes of positions quantized to `bits` per axis over their bounding box."""
+    bmin = positions.min(axis=0)
+    extent = np.maximum(positions.max(axis=0) - bmin, 1e-12)
+    scale = float((1 << bits) - 1)
+    q = ((positions - bmin) / extent * scale + 0.5).astype(np.uint64)
+    return _spread_bits(q[:, 0]) | (_spread_bits(q[:, 1]) << np.uint64(1)) | (_spread_bits(q[:, 2]) << np.uint64(2))
+
+
+def radix_argsort(codes, key_bits=3 * MORTON_BITS):
+    """
+    Stable LSD radix argsort of unsigned 64-bit keys in RADIX_BITS digits.
+    Each pass is a stable argsort of a uint16 digit, which NumPy runs as a
+    counting/radix sort, so the whole sort is linear in the number of keys.
+    """
+    order = np.arange(len(codes))
+    mask = np.uint64((1 << RADIX_BITS) - 1)
+    for shift in range(0, key_bits, RADIX_BITS):
+        digit = ((codes[order] >> np.uint64(shift)) & mask).astype(np.uint16)
+        order = order[np.argsort(digit, kind='stable')]
+    return order
+
+
+def morton_order(positions):
+    """Permutation that sorts positions along a Z-curve."""
+    if len(positions) < 2:
+        return np.arange(len(positions))
+    return radix_argsort(morton_codes(positions))
+
+
+def lod_ranks(positions, importance):
+    """
+    Importance-ordered LOD rank per splat (0 = shown first).
+
+    Stratified over the Z-curve octree: level l keeps the most important splat
+    of every occupied cell of a 2^l grid, and ranks are assigned level by
+    level, so any prefix of ranks covers the scene about uniformly instead of
+    thinning out only the dense regions.
+    """
+    n = len(positions)
+    if n == 0:
+        return np.zeros(0, dtype=np.int32)
+    # Candidates in descending importance: the first splat of a cell is its winner
+    candidates = np.argsort(-importance, kind='stable')
+    codes = morton_codes(positions)[candidates]
+
+    # Fine enough that the finest level has ~1 splat per occupied cell
+    max_level = min(MORTON_BITS, int(np.ceil(np.log2(max(n, 2)) / 3.0)) + 1)
+    level = np.full(n, max_level + 1, dtype=np.int32)
+    for lvl in range(max_level, -1, -1):
+        # The winner of a coarse cell is the best of its sub-cell winners,
+        # so each level only has to look at the previous level's winners
+        shift = np.uint64(3 * (MORTON_BITS - lvl))
+        _, first = np.unique(codes >> shift, return_index=True)
+        first.sort()
+        candidates = candidates[first]
+        codes = codes[first]
+        level[candidates] = lvl
+
+    order = np.lexsort((-importance, level))
+    ranks = np.empty(n, dtype=np.int32)
+    ranks[order] = np.arange(n, dtype=np.int32)
+    return ranks
+
+
+# ==============================================================================
+#  HILBERT CURVES
+# ==============================================================================
+# Unlike the Z-curve, consecutive Hilbert indices are always neighbours, and
+# every aligned 2^k x 2^k square is one contiguous index range.
+
+def hilbert_xy(d, bits):
+    """Cell (x, y) of index d on the 2D Hilbert curve over a 2^bits grid."""
+    t = np.asarray(d, dtype=np.int64).copy()
+    x = np.zeros_like(t)
+    y = np.zeros_like(t)
+    s = 1
+    while s < (1 << bits):
+        rx = (t >> 1) & 1
+        ry = (t ^ rx) & 1
+        # Rotate the quadrant
+        swap = ry == 0
+        flip = swap & (rx == 1)
+        x = np.where(flip, s - 1 - x, x)
+        y = np.where(flip, s - 1 - y, y)
+        x, y = np.where(swap, y, x), np.where(swap, x, y)
+        x += s * rx
+        y += s * ry
+        t >>= 2
+        s <<= 1
+    return x, y
+
+
+def hilbert_codes(q, bits):
+    """Hilbert indices of integer points q (n, dims) in [0, 2^bits) (Skilling's transpose method)."""
+    x = [c.copy() for c in np.asarray(q, dtype=np.int64).T]
+    dims = len(x)
+
+    # Inverse undo
+    m = 1 << (bits - 1)
+    bit = m
+    while bit > 1:
+        low = bit - 1
+        for i in range(dims):
+            has_bit = (x[i] & bit) != 0
+            x[0] = np.where(has_bit, x[0] ^ low, x[0])
+            swap = np.where(has_bit, 0, (x[0] ^ x[i]) & low)
+            x[0] ^= swap
+            x[i] ^= swap
+        bit >>= 1
+
+    # Gray encode
+    for i in range(1, dims):
+        x[i] ^= x[i - 1]
+    t = np.zeros_like(x[0])
+    bit = m
+    while bit > 1:
+        t = np.where((x[dims - 1] & bit) != 0, t ^ (bit - 1), t)
+        bit >>= 1
+    for i in range(dims):
+        x[i] ^= t
+
+    # Interleave the transposed bits, most significant first
+    codes = np.zeros_like(x[0])
+    for b in range(bits - 1, -1, -1):
+        for i in range(dims):
+            codes = (codes << 1) | ((x[i] >> b) & 1)
+    return codes
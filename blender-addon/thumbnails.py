@@ -0,0 +1,152 @@
+import bpy
+import os
+import time
+import hashlib
+import tempfile
+
+# ==============================================================================
+#  LAZY BRUSH THUMBNAILS
+# ==============================================================================
+# Brush PNGs can be several MB. Instead of pcoll.load() on the full image while
+# the panel draws, every preview starts empty and is filled in the background:
+#   - worker thread: hash the file, load its cached icon (.npy) if present
+#   - main thread (bpy.app.timers): apply cached icons, or downscale a missing
+#     one through bpy once and store it in the disk cache
+# The cache is keyed by file content hash, so renamed/moved files still hit it.
+
+ICON_SIZE = 128
+TICK_BUDGET = 0.02      # seconds of main-thread work per timer tick
+TICK_INTERVAL = 0.05
+
+_executor = None
+_cache_dir = None
+_pending = []           # (preview, filepath, future)
+
+
+def get_cache_dir():
+    """Per-user cache folder for downscaled brush icons."""
+    global _cache_dir
+    if _cache_dir:
+        return _cache_dir
+    path = None
+    try:
+        path = bpy.utils.extension_path_user(__package__, path="thumbnails", create=True)
+    except Exception:
+        pass
+    if not path:
+        path = os.path.join(tempfile.gettempdir(), "gs_oil_paint_thumbnails")
+        os.makedirs(path, exist_ok=True)
+    _cache_dir = path
+    return path
+
+
+def file_hash(filepath):
+    h = hashlib.sha1()
+    with open(filepath, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _cache_lookup(filepath, cache_dir):
+    """Worker thread: no bpy access here."""
+    import numpy as np
+    cache_path = os.path.join(cache_dir, f"{file_hash(filepath)}_{ICON_SIZE}.npy")
+    if os.path.exists(cache_path):
+        try:
+            return cache_path, np.load(cache_path)
+        except Exception:
+            pass
+    return cache_path, None
+
+
+def _generate_icon(filepath):
+    """Main thread: downscale the image through Blender, returns uint8 (h, w, 4)."""
+    import numpy as np
+    img = bpy.data.images.load(filepath, check_existing=False)
+    try:
+        w, h = img.size
+        scale = ICON_SIZE / max(w, h, 1)
+        tw, th = max(1, round(w * scale)), max(1, round(h * scale))
+        if (tw, th) != (w, h):
+            img.scale(tw, th)
+        pixels = np.zeros(tw * th * 4, dtype=np.float32)
+        img.pixels.foreach_get(pixels)
+    finally:
+        bpy.data.images.remove(img)
+    return (np.clip(pixels, 0.0, 1.0) * 255.0 + 0.5).astype(np.uint8).reshape((th, tw, 4))
+
+
+def _apply_icon(preview, icon):
+    import numpy as np
+    th, tw = icon.shape[:2]
+    preview.image_size = (tw, th)
+    preview.image_pixels_float.foreach_set(icon.reshape(-1).astype(np.float32) / 255.0)
+
+
+def _tag_redraw():
+    try:
+        for window in bpy.context.window_manager.windows:
+            for area in window.screen.areas:
+                if area.type == 'VIEW_3D':
+                    area.tag_redraw()
+    except AttributeError:
+        pass
+
+
+def _process_queue():
+    import numpy as np
+    start = time.perf_counter()
+    applied = 0
+    for entry in list(_pending):
+        preview, filepath, future = entry
+        if not future.done():
+            continue
+        _pending.remove(entry)
+        try:
+            cache_path, icon = future.result()
+            if icon is None:
+                icon = _generate_icon(filepath)
+                np.save(cache_path, icon)
+            _apply_icon(preview, icon)
+            applied += 1
+        except ReferenceError:
+            pass  # preview collection was removed meanwhile
+        except Exception as e:
+            print(f"[GS_Tool] Thumbnail failed for {os.path.basename(filepath)}: {e}")
+        if time.perf_counter() - start > TICK_BUDGET:
+            break
+
+    if applied:
+        _tag_redraw()
+    return TICK_INTERVAL if _pending else None
+
+
+def request(pcoll, name, filepath):
+    """
+    Return an (initially empty) preview for `name` and queue its icon for loading.
+    The returned preview's icon_id is valid immediately.
+    """
+    global _executor
+    if name in pcoll:
+        return pcoll[name]
+
+    preview = pcoll.new(name)
+    if _executor is None:
+        from concurrent.futures import ThreadPoolExecutor
+        _executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="gs_thumbs")
+    _pending.append((preview, filepath, _executor.submit(_cache_lookup, filepath, get_cache_dir())))
+
+    if not bpy.app.timers.is_registered(_process_queue):
+        bpy.app.timers.register(_process_queue, first_interval=TICK_INTERVAL)
+    return preview
+
+
+def shutdown():
+    global _executor
+    if bpy.app.timers.is_registered(_process_queue):
+        bpy.app.timers.unregister(_process_queue)
+    _pending.clear()
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
@@ -0,0 +1,117 @@
+import numpy as np
+
+from . import parallel
+
+# ==============================================================================
+#  PER-SPLAT TRANSFORM KERNEL
+# ==============================================================================
+# Position, opacity sigmoid, scale exp, Z-minimum reorientation and its
+# rotation fix-up of a block of PLY records, fused into one pass that reads
+# each field once and writes straight into preallocated outputs. Blocks run
+# across the thread pool of parallel.py.
+#
+# Z-minimum: the smallest scale axis is moved to Z by a local rotation P
+# (R_new = R_old * P, q_new = q_old * q_p). Both the scale reorder and q_p
+# are rows of small tables gathered by the splat's smallest axis.
+
+# Scale column order per smallest axis: X -> (z, y, x), Y -> (x, z, y), Z unchanged
+ZMIN_COLUMNS = np.array([[2, 1, 0], [0, 2, 1], [0, 1, 2]])
+# q_p (w, x, y, z) per smallest axis
+ZMIN_FIX = np.array([
+    [0.70710678, 0.0, 0.70710678, 0.0],     # X: Ry(90) maps X -> Z
+    [0.70710678, -0.70710678, 0.0, 0.0],    # Y: Rx(-90) maps Y -> Z
+    [1.0, 0.0, 0.0, 0.0],                   # Z: identity
+], dtype=np.float32)
+
+# Splats without scale fields
+DEFAULT_SCALE = 0.01
+DEFAULT_LOG_SCALE = -4.6
+
+
+def _dtype(ply_data, names):
+    return np.result_type(*[ply_data.dtype[name] for name in names]) if names else np.dtype(np.float32)
+
+
+def splat_arrays(ply_data, z_is_minimum=True, chunk=parallel.CHUNK):
+    """
+    Per-splat arrays of PLY records: 'xyz', 'log_opacities', 'opacities',
+    'log_scales', 'scales' and 'quats' (w, x, y, z), with the smallest scale
+    axis moved to Z when `z_is_minimum`.
+    """
+    names = ply_data.dtype.names
+    n = len(ply_data)
+    pos_names = ('x', 'y', 'z')
+    opacity_names = ('opacity',) if 'opacity' in names else ()
+    scale_names = [name for name in names if name.startswith('scale')]
+    scale_names = scale_names[:3] if len(scale_names) >= 3 else []
+    rot_names = [name for name in names if name.startswith('rot')]
+    rot_names = rot_names[:4] if len(rot_names) >= 4 else []
+
+    xyz = np.empty((n, 3), dtype=_dtype(ply_data, pos_names))
+    log_opacities = np.empty(n, dtype=_dtype(ply_data, opacity_names))
+    opacities = np.empty_like(log_opacities)
+    log_scales = np.empty((n, 3), dtype=_dtype(ply_data, scale_names))
+    scales = np.empty_like(log_scales)
+    quats = np.empty((n, 4), dtype=_dtype(ply_data, rot_names))
+
+    def block(start, stop):
+        m = stop - start
+        for i, name in enumerate(pos_names):
+            xyz[start:stop, i] = ply_data[name][start:stop]
+
+        # Opacity: 1 / (1 + exp(-x)), in place in the output slice
+        if opacity_names:
+            log_o = log_opacities[start:stop]
+            log_o[:] = ply_data['opacity'][start:stop]
+            o = opacities[start:stop]
+            np.negative(log_o, out=o)
+            np.exp(o, out=o)
+            o += 1.0
+            np.reciprocal(o, out=o)
+        else:
+            log_opacities[start:stop] = 0.0
+            opacities[start:stop] = 1.0
+
+        if scale_names:
+            ls = np.empty((m, 3), dtype=log_scales.dtype)
+            for i, name in enumerate(scale_names):
+                ls[:, i] = ply_data[name][start:stop]
+            s = np.exp(ls)
+        else:
+            ls = np.full((m, 3), DEFAULT_LOG_SCALE, dtype=log_scales.dtype)
+            s = np.full((m, 3), DEFAULT_SCALE, dtype=scales.dtype)
+
+        if rot_names:
+            q = np.empty((m, 4), dtype=quats.dtype)
+            for i, name in enumerate(rot_names):
+                q[:, i] = ply_data[name][start:stop]
+        else:
+            q = np.zeros((m, 4), dtype=quats.dtype)
+            q[:, 0] = 1.0
+
+        if not z_is_minimum:
+            log_scales[start:stop] = ls
+            scales[start:stop] = s
+            quats[start:stop] = q
+            return
+
+        smallest = np.argmin(s, axis=1)
+        columns = ZMIN_COLUMNS[smallest]
+        log_scales[start:stop] = np.take_along_axis(ls, columns, axis=1)
+        scales[start:stop] = np.take_along_axis(s, columns, axis=1)
+
+        # q * q_p
+        fix = ZMIN_FIX[smallest]
+        w1, x1, y1, z1 = q[:, 0], q[:, 1], q[:, 2], q[:, 3]
+        w2, x2, y2, z2 = fix[:, 0], fix[:, 1], fix[:, 2], fix[:, 3]
+        out = quats[start:stop]
+        out[:, 0] = w1*w2 - x1*x2 - y1*y2 - z1*z2
+        out[:, 1] = w1*x2 + x1*w2 + y1*z2 - z1*y2
+        out[:, 2] = w1*y2 - x1*z2 + y1*w2 + z1*x2
+        out[:, 3] = w1*z2 + x1*y2 - y1*x2 + z1*w2
+
+    parallel.map_chunks(n, block, chunk)
+    return {
+        "xyz": xyz, "opacities": opacities, "log_opacities": log_opacities,
+        "scales": scales, "log_scales": log_scales, "quats": quats,
+    }